@@ -2,7 +2,15 @@ import requests
 import json
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Union
+import os
+import time
+
+from observability import get_logger, record_llm_call
+
+log = get_logger("ai_agent")
+
+OLLAMA_API_URL = os.getenv("OLLAMA_API_URL", "http://localhost:11434/api/generate")
 
 
 def run_agentic_ai(
@@ -10,8 +18,8 @@ def run_agentic_ai(
         warnings: str,
         suggestions: str,
         user_suggestion_response: str,
-        task_summary: str
-) -> Tuple[str, str, str]:
+        task_summary: Union[str, List[Dict]]
+) -> Tuple[List[Dict], str, str]:
     """
     Process natural language task entry through Negotiator and Planner agents.
 
@@ -20,23 +28,26 @@ def run_agentic_ai(
         warnings: Previous warnings from Negotiator
         suggestions: Previous suggestions from Planner
         user_suggestion_response: User's response to suggestions
-        task_summary: Current task summary as JSON string
+        task_summary: Current task summary as a list of task dicts (or JSON string)
 
     Returns:
-        Tuple of (updated_task_summary_string, warning_msg, suggestion_msg)
+        Tuple of (updated_task_summary, warning_msg, suggestion_msg)
     """
 
     # Parse task_summary from string to list
     try:
-        task_list = json.loads(task_summary) if task_summary and task_summary.strip() else []
-        print(f"Parsed existing task_list: {len(task_list)} tasks")
+        if isinstance(task_summary, list):
+            task_list = task_summary
+        else:
+            task_list = json.loads(task_summary) if task_summary and task_summary.strip() else []
+        log.info("Parsed existing task_list: %d tasks", len(task_list))
     except Exception as e:
-        print(f"Error parsing task_summary: {e}")
+        log.warning("Error parsing task_summary: %s", e)
         task_list = []
 
     # Initialize return values
     updated_task_summary = task_list.copy()
-    print(f"Initial updated_task_summary: {len(updated_task_summary)} tasks")
+    log.info("Initial updated_task_summary: %d tasks", len(updated_task_summary))
     warning_msg = ""
     suggestion_msg = ""
     extracted_tasks = []  # Store extracted tasks from new entry
@@ -46,24 +57,24 @@ def run_agentic_ai(
 
     # Step 1: Process new task entry FIRST (if provided)
     if nl_entry and nl_entry.strip():
-        print(f"Processing new task entry: {nl_entry[:50]}...")
+        log.info("Processing new task entry: %s...", nl_entry[:50])
 
         # Extract basic task info from NL entry using LLM
         extracted_tasks = extract_task_info_with_llm(nl_entry)
-        print(f"Extracted {len(extracted_tasks)} tasks")
-        print(f"Extracted tasks: {json.dumps(extracted_tasks, indent=2)}")
+        log.info("Extracted %d tasks", len(extracted_tasks))
+        log.debug("Extracted tasks: %s", extracted_tasks)
 
         # Run Negotiator to check for missing info
         warning_msg = run_negotiator(extracted_tasks, nl_entry)
-        print(f"Warning message: {warning_msg[:100]}")
+        log.info("Warning message: %s", warning_msg[:100])
 
         # Check if there are actual warnings (not the success message)
         has_warnings = "⚠️" in warning_msg
 
         # Always add extracted tasks to summary
-        print(f"Before extend: {len(updated_task_summary)} tasks")
+        log.debug("Before extend: %d tasks", len(updated_task_summary))
         updated_task_summary.extend(extracted_tasks)
-        print(f"After extend: {len(updated_task_summary)} tasks")
+        log.debug("After extend: %d tasks", len(updated_task_summary))
 
         # If no warnings, run Planner to generate detailed suggestions
         if not has_warnings:
@@ -90,8 +101,7 @@ def run_agentic_ai(
                 warning_msg = warnings if warnings else "✅ No warnings. All information complete."
             # Use the response message as suggestion
             suggestion_msg = response_msg
-            task_summary_string = json.dumps(updated_task_summary, indent=4)
-            return task_summary_string, warning_msg, suggestion_msg
+            return updated_task_summary, warning_msg, suggestion_msg
 
         # If rejected, acknowledge
         if "rejected" in response_msg.lower():
@@ -99,18 +109,14 @@ def run_agentic_ai(
             if not warning_msg:
                 warning_msg = warnings if warnings else "⏳ Awaiting task entry."
             suggestion_msg = "👌 Understood. Feel free to provide new task details or modifications."
-            task_summary_string = json.dumps(updated_task_summary, indent=4)
-            return task_summary_string, warning_msg, suggestion_msg
+            return updated_task_summary, warning_msg, suggestion_msg
 
     # Step 3: Handle case where nothing was provided
     if not nl_entry.strip() and (not user_suggestion_response or not user_suggestion_response.strip()):
         warning_msg = warnings if warnings else "⏳ Awaiting task entry."
         suggestion_msg = suggestions if suggestions else "⏳ Awaiting task entry."
 
-    # Convert task list back to JSON string
-    task_summary_string = json.dumps(updated_task_summary, indent=4)
-
-    return task_summary_string, warning_msg, suggestion_msg
+    return updated_task_summary, warning_msg, suggestion_msg
 
 
 def handle_user_response_with_reasoning(
@@ -138,7 +144,7 @@ def handle_user_response_with_reasoning(
 
     # If user provides modification instructions, use LLM to intelligently modify tasks
     if is_acceptance or "break" in user_lower or "split" in user_lower or "divide" in user_lower or "modify" in user_lower:
-        print(f"User wants to modify tasks based on: {user_response}")
+        log.info("User wants to modify tasks based on: %s", user_response)
 
         # Use LLM to understand and apply modifications
         # NEW: Pass num_existing_tasks to protect old tasks
@@ -177,7 +183,7 @@ def apply_modifications_with_llm(
     existing_tasks = current_tasks[:num_existing_tasks]
     new_tasks = current_tasks[num_existing_tasks:]
 
-    print(f"Protecting {len(existing_tasks)} existing tasks, modifying {len(new_tasks)} new tasks")
+    log.info("Protecting %d existing tasks, modifying %d new tasks", len(existing_tasks), len(new_tasks))
 
     prompt = f"""You are a task modification expert. The user wants to modify their task list based on their instructions.
 
@@ -230,7 +236,7 @@ Return ONLY a valid JSON array of the MODIFIED NEW TASKS, nothing else:
 NOW APPLY THE MODIFICATION TO THE NEW TASKS ONLY. Return only the JSON array:"""
 
     response = call_groq(prompt)
-    print(f"LLM Modification Response:\n{response}\n")
+    log.debug("LLM Modification Response:\n%s\n", response)
 
     # Try to parse the response
     try:
@@ -257,10 +263,10 @@ NOW APPLY THE MODIFICATION TO THE NEW TASKS ONLY. Return only the JSON array:"""
                 # NEW: Combine existing tasks + modified new tasks
                 return existing_tasks + validated_new_tasks
     except Exception as e:
-        print(f"Modification parsing failed: {e}")
+        log.warning("Modification parsing failed: %s", e)
 
     # Fallback: Try simple rule-based modification
-    print("LLM modification failed, attempting rule-based fallback")
+    log.warning("LLM modification failed, attempting rule-based fallback")
     modified_new_tasks = rule_based_task_modification(user_instruction, new_tasks)
     # NEW: Combine existing tasks + modified new tasks
     return existing_tasks + modified_new_tasks
@@ -331,9 +337,10 @@ def rule_based_task_modification(user_instruction: str, tasks: List[Dict]) -> Li
 
 def call_ollama(prompt: str, model: str = "granite3.2:8b") -> str:
     """Call Ollama API with given prompt."""
+    start = time.perf_counter()
     try:
         response = requests.post(
-            "http://localhost:11434/api/generate",
+            OLLAMA_API_URL,
             json={
                 "model": model,
                 "prompt": prompt,
@@ -345,10 +352,17 @@ def call_ollama(prompt: str, model: str = "granite3.2:8b") -> str:
         )
 
         if response.status_code == 200:
-            return response.json().get("response", "")
+            result = response.json()
+            record_llm_call("ollama", model, time.perf_counter() - start, "ok", {
+                "prompt_tokens": result.get("prompt_eval_count"),
+                "completion_tokens": result.get("eval_count")
+            })
+            return result.get("response", "")
         else:
+            record_llm_call("ollama", model, time.perf_counter() - start, "error")
             return f"Error calling Ollama: {response.status_code}"
     except Exception as e:
+        record_llm_call("ollama", model, time.perf_counter() - start, "error")
         return f"Error: {str(e)}"
 
 
@@ -451,7 +465,7 @@ NOW EXTRACT FROM THE USER INPUT ABOVE. Return only the JSON array:"""
 
     response = call_groq(prompt)
 
-    print(f"LLM Response:\n{response}\n")  # Debug logging
+    log.debug("LLM Response:\n%s\n", response)
 
     # Try multiple parsing strategies
     extracted_tasks = None
@@ -478,7 +492,7 @@ NOW EXTRACT FROM THE USER INPUT ABOVE. Return only the JSON array:"""
             if isinstance(extracted_tasks, list) and len(extracted_tasks) > 0:
                 return validate_and_clean_tasks(extracted_tasks)
     except Exception as e:
-        print(f"Strategy 2 failed: {e}")
+        log.warning("Strategy 2 failed: %s", e)
 
     # Strategy 3: Try to fix common JSON issues
     try:
@@ -493,10 +507,10 @@ NOW EXTRACT FROM THE USER INPUT ABOVE. Return only the JSON array:"""
             if isinstance(extracted_tasks, list) and len(extracted_tasks) > 0:
                 return validate_and_clean_tasks(extracted_tasks)
     except Exception as e:
-        print(f"Strategy 3 failed: {e}")
+        log.warning("Strategy 3 failed: %s", e)
 
     # Strategy 4: Use regex-based extraction as absolute fallback
-    print("All LLM strategies failed, using regex fallback")
+    log.warning("All LLM strategies failed, using regex fallback")
     return regex_based_fallback(nl_entry)
 
 
@@ -542,76 +556,121 @@ def safe_int(value) -> Optional[int]:
         return None
 
 
+# Precompiled lexer for regex_based_fallback. A single alternation tokenizes
+# durations, dates, times and scheduling keywords in one left-to-right scan;
+# the (?=\d) guard lets non-digit positions skip the numeric branches, and
+# alternatives are ordered so "2hrs" and "2/10/2025" win over a bare time.
+FALLBACK_SEGMENT_SPLIT = re.compile(r',(?![^()]*\))|\band\b|;')
+FALLBACK_TOKEN_PATTERN = re.compile(
+    r'(?=\d)(?:(?P<duration>(?P<dur_value>\d+)\s*(?:hrs?|hours?))'
+    r'|(?P<date>(?P<day>\d{1,2})[/-](?P<month>\d{1,2})[/-](?P<year>\d{4}))'
+    r'|(?P<time>(?P<hour>\d{1,2})(?::\d{2})?\s*(?P<am_pm>am|pm)?))'
+    r'|\b(?P<keyword>same\s+day|anytime|start|begin|by|before|due|deadline|complete|finish'
+    r'|at|from|on|in|for|the)\b',
+    re.IGNORECASE
+)
+
+# Keywords preceding a date that mark it as the deadline date
+DATE_DEADLINE_KEYWORDS = frozenset(["by", "before", "due", "deadline", "complete", "finish"])
+# Keywords preceding a time that mark it as the deadline / start time
+TIME_DEADLINE_KEYWORDS = frozenset(["by", "before", "complete", "deadline", "finish"])
+TIME_START_KEYWORDS = frozenset(["start", "begin", "at", "from"])
+# Scheduling keywords that are not part of the task name
+NAME_STOP_KEYWORDS = frozenset(["start", "begin", "by", "before", "due", "at", "on", "in", "for",
+                                "complete", "finish", "the"])
+
+
 def regex_based_fallback(nl_entry: str) -> List[Dict]:
     """
     Enhanced regex-based extraction as absolute fallback.
+
+    Each segment is tokenized once with FALLBACK_TOKEN_PATTERN and the tokens
+    are assigned to task fields by a small state machine that tracks which
+    deadline/start keywords have been seen so far.
     """
     tasks = []
 
-    # Split by task separators
-    segments = re.split(r',(?![^()]*\))|\band\b|;', nl_entry)
-
     # Track last seen date for "same day" references
     last_date = None
 
-    for segment in segments:
+    for segment in FALLBACK_SEGMENT_SPLIT.split(nl_entry):
         original_segment = segment.strip()
         if len(original_segment) < 3:
             continue
 
-        # Make a working copy for extraction
-        working_text = original_segment
-
-        task = {
-            "TaskName": "",
-            "Duration": None,
-            "arrivaltime": None,
-            "arrivaldate": None,
-            "deadlinetime": None,
-            "deadlinedate": None,
-            "importance": "Medium"
-        }
+        task, last_date = parse_fallback_segment(original_segment, last_date)
+        if task["TaskName"]:
+            tasks.append(task)
 
-        # Extract duration and remove from working text
-        duration_match = re.search(r'(\d+)\s*(?:hrs?|hours?)', working_text, re.IGNORECASE)
-        if duration_match:
-            task["Duration"] = int(duration_match.group(1))
-            working_text = working_text.replace(duration_match.group(0), ' ')
-
-        # Extract dates (D/M/YYYY format) and remove from working text
-        date_match = re.search(r'(\d{1,2})[/-](\d{1,2})[/-](\d{4})', working_text)
-        if date_match:
-            day, month, year = int(date_match.group(1)), int(date_match.group(2)), int(date_match.group(3))
-            date_str = f"{year}-{month:02d}-{day:02d}"
-            last_date = date_str
-
-            # Check if this is a deadline or arrival
-            before_date = working_text[:date_match.start()]
-            if re.search(r'\b(by|before|due|deadline|complete|finish)\b', before_date, re.IGNORECASE):
-                task["deadlinedate"] = date_str
-            else:
-                task["arrivaldate"] = date_str
+    # Fallback if no tasks extracted
+    return tasks if tasks else [{
+        "TaskName": nl_entry[:100],
+        "Duration": None,
+        "arrivaltime": None,
+        "arrivaldate": None,
+        "deadlinetime": None,
+        "deadlinedate": None,
+        "importance": "Medium"
+    }]
 
-            working_text = working_text.replace(date_match.group(0), ' ')
 
-        # Handle "same day" and remove from working text
-        if re.search(r'\bsame\s+day\b', working_text, re.IGNORECASE) and last_date:
-            if not task["deadlinedate"] and not task["arrivaldate"]:
-                task["arrivaldate"] = last_date
-                task["deadlinedate"] = last_date
-            elif not task["deadlinedate"]:
-                task["deadlinedate"] = last_date
-            elif not task["arrivaldate"]:
-                task["arrivaldate"] = last_date
-            working_text = re.sub(r'\bsame\s+day\b', ' ', working_text, flags=re.IGNORECASE)
+def parse_fallback_segment(segment: str, last_date: Optional[str]) -> Tuple[Dict, Optional[str]]:
+    """
+    Single-pass parse of one task segment for regex_based_fallback.
 
-        # Extract all times and remove from working text
-        time_patterns = []
-        time_matches = list(re.finditer(r'(\d{1,2})(?::(\d{2}))?\s*(am|pm)?', working_text, re.IGNORECASE))
+    Args:
+        segment: One stripped task segment
+        last_date: Last date seen in previous segments (for "same day")
+
+    Returns:
+        Tuple of (task dict, last seen date)
+    """
+    task = {
+        "TaskName": "",
+        "Duration": None,
+        "arrivaltime": None,
+        "arrivaldate": None,
+        "deadlinetime": None,
+        "deadlinedate": None,
+        "importance": "Medium"
+    }
+
+    # State: keyword context seen so far in this segment
+    date_deadline_context = False
+    time_deadline_context = False
+    time_start_context = False
+    has_date = False
+    same_day = False
+    anytime = False
+
+    name_parts = []
+    same_day_slots = []
+    position = 0
+
+    for token in FALLBACK_TOKEN_PATTERN.finditer(segment):
+        kind = token.lastgroup
+        keep_in_name = False
+
+        if kind == "duration":
+            # Only the first duration counts; repeats are dropped from the name
+            if task["Duration"] is None:
+                task["Duration"] = int(token.group("dur_value"))
+
+        elif kind == "date":
+            # Only the first date counts; repeats are dropped from the name
+            if not has_date:
+                has_date = True
+                day, month, year = int(token.group("day")), int(token.group("month")), int(token.group("year"))
+                date_str = f"{year}-{month:02d}-{day:02d}"
+                last_date = date_str
+                if date_deadline_context:
+                    task["deadlinedate"] = date_str
+                else:
+                    task["arrivaldate"] = date_str
 
-        for time_match in time_matches:
-            hour = int(time_match.group(1))
-            am_pm = time_match.group(3)
+        elif kind == "time":
+            hour = int(token.group("hour"))
+            am_pm = token.group("am_pm")
 
             # Convert to 24-hour format
             if am_pm:
@@ -621,63 +680,62 @@ def regex_based_fallback(nl_entry: str) -> List[Dict]:
                 elif am_pm == 'am' and hour == 12:
                     hour = 0
 
-            # Determine if this is arrival or deadline based on context
-            # Look at text BEFORE the time for keywords
-            before_time = working_text[:time_match.start()]
-
-            # Check for deadline keywords
-            if re.search(r'\b(by|before|complete|deadline|finish)\b', before_time, re.IGNORECASE):
+            # Deadline keywords win over start keywords; otherwise the
+            # first time is the arrival and the second the deadline
+            if time_deadline_context:
                 if task["deadlinetime"] is None:
                     task["deadlinetime"] = hour
-            # Check for arrival/start keywords - be more flexible
-            elif re.search(r'\b(start|begin|at|from)\b', before_time, re.IGNORECASE):
+            elif time_start_context:
                 if task["arrivaltime"] is None:
                     task["arrivaltime"] = hour
+            elif task["arrivaltime"] is None:
+                task["arrivaltime"] = hour
+            elif task["deadlinetime"] is None:
+                task["deadlinetime"] = hour
+
+        else:
+            keyword = token.group("keyword").lower()
+            if keyword.startswith("same"):
+                # Kept in its own slot; blanked only if a date is known at the end
+                same_day = True
+                name_parts.append(segment[position:token.start()])
+                same_day_slots.append(len(name_parts))
+                name_parts.append(token.group(0))
+                position = token.end()
+                continue
+            elif keyword == "anytime":
+                anytime = True
             else:
-                # If no keyword found, use position-based logic:
-                # First time = arrival, second time = deadline
-                if task["arrivaltime"] is None:
-                    task["arrivaltime"] = hour
-                elif task["deadlinetime"] is None:
-                    task["deadlinetime"] = hour
+                date_deadline_context = date_deadline_context or keyword in DATE_DEADLINE_KEYWORDS
+                time_deadline_context = time_deadline_context or keyword in TIME_DEADLINE_KEYWORDS
+                time_start_context = time_start_context or keyword in TIME_START_KEYWORDS
+                keep_in_name = keyword not in NAME_STOP_KEYWORDS
 
-            # Store pattern for removal
-            time_patterns.append(time_match.group(0))
+        if keep_in_name:
+            continue
+        name_parts.append(segment[position:token.start()])
+        position = token.end()
 
-        # Remove all extracted times from working text
-        for pattern in time_patterns:
-            working_text = working_text.replace(pattern, ' ')
+    name_parts.append(segment[position:])
 
-        # Check for "anytime" and remove from working text
-        if re.search(r'\banytime\b', working_text, re.IGNORECASE):
-            task["arrivaltime"] = None
-            working_text = re.sub(r'\banytime\b', ' ', working_text, flags=re.IGNORECASE)
+    # Handle "same day" once the segment's own date is known
+    if same_day and last_date:
+        if not task["deadlinedate"] and not task["arrivaldate"]:
+            task["arrivaldate"] = last_date
+            task["deadlinedate"] = last_date
+        elif not task["deadlinedate"]:
+            task["deadlinedate"] = last_date
+        elif not task["arrivaldate"]:
+            task["arrivaldate"] = last_date
+        for slot in same_day_slots:
+            name_parts[slot] = " "
 
-        # Remove common scheduling keywords that are not part of task name
-        working_text = re.sub(
-            r'\b(start|begin|by|before|due|at|on|in|for|complete|finish|the)\b',
-            ' ',
-            working_text,
-            flags=re.IGNORECASE
-        )
+    if anytime:
+        task["arrivaltime"] = None
 
-        # Clean up the task name: remove extra whitespace
-        task_name = re.sub(r'\s+', ' ', working_text).strip()
-
-        if task_name:
-            task["TaskName"] = task_name
-            tasks.append(task)
-
-    # Fallback if no tasks extracted
-    return tasks if tasks else [{
-        "TaskName": nl_entry[:100],
-        "Duration": None,
-        "arrivaltime": None,
-        "arrivaldate": None,
-        "deadlinetime": None,
-        "deadlinedate": None,
-        "importance": "Medium"
-    }]
+    # Clean up the task name: collapse whitespace
+    task["TaskName"] = " ".join(" ".join(name_parts).split())
+    return task, last_date
 
 
 def run_negotiator(extracted_tasks: List[Dict], nl_entry: str) -> str:
@@ -842,7 +900,7 @@ from dotenv import load_dotenv
 load_dotenv()
 # Add Groq API configuration at the top of the file
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")  # Set this environment variable
-GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_API_URL = os.getenv("GROQ_API_URL", "https://api.groq.com/openai/v1/chat/completions")
 GROQ_MODEL = "qwen/qwen3-32b"  # Groq's Qwen model
 
 
@@ -869,17 +927,25 @@ def call_groq(prompt: str, model: str = GROQ_MODEL, temperature: float = 0.1, ma
             "max_tokens": max_tokens
         }
 
-        response = requests.post(
-            GROQ_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=90
-        )
+        start = time.perf_counter()
+        try:
+            response = requests.post(
+                GROQ_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=90
+            )
+        except requests.exceptions.Timeout:
+            record_llm_call("groq", model, time.perf_counter() - start, "timeout")
+            raise
+        elapsed = time.perf_counter() - start
 
         if response.status_code == 200:
             result = response.json()
+            record_llm_call("groq", model, elapsed, "ok", result.get("usage"))
             return result.get("choices", [{}])[0].get("message", {}).get("content", "")
         else:
+            record_llm_call("groq", model, elapsed, "error")
             error_msg = f"Groq API error: {response.status_code}"
             try:
                 error_detail = response.json()
@@ -960,7 +1026,7 @@ NOW EXTRACT FROM THE USER INPUT ABOVE. Return only the JSON array:"""
 
     response = call_groq(prompt)  # Changed from call_ollama
 
-    print(f"Groq Response:\n{response}\n")  # Updated debug message
+    log.debug("Groq Response:\n%s\n", response)
 
     # Rest of the function remains the same
     extracted_tasks = None
@@ -985,7 +1051,7 @@ NOW EXTRACT FROM THE USER INPUT ABOVE. Return only the JSON array:"""
             if isinstance(extracted_tasks, list) and len(extracted_tasks) > 0:
                 return validate_and_clean_tasks(extracted_tasks)
     except Exception as e:
-        print(f"Strategy 2 failed: {e}")
+        log.warning("Strategy 2 failed: %s", e)
 
     # Strategy 3: Try to fix common JSON issues
     try:
@@ -999,9 +1065,9 @@ NOW EXTRACT FROM THE USER INPUT ABOVE. Return only the JSON array:"""
             if isinstance(extracted_tasks, list) and len(extracted_tasks) > 0:
                 return validate_and_clean_tasks(extracted_tasks)
     except Exception as e:
-        print(f"Strategy 3 failed: {e}")
+        log.warning("Strategy 3 failed: %s", e)
 
-    print("All LLM strategies failed, using regex fallback")
+    log.warning("All LLM strategies failed, using regex fallback")
     return regex_based_fallback(nl_entry)
 
 
@@ -1021,7 +1087,7 @@ def apply_modifications_with_llm(
     existing_tasks = current_tasks[:num_existing_tasks]
     new_tasks = current_tasks[num_existing_tasks:]
 
-    print(f"Protecting {len(existing_tasks)} existing tasks, modifying {len(new_tasks)} new tasks")
+    log.info("Protecting %d existing tasks, modifying %d new tasks", len(existing_tasks), len(new_tasks))
 
     prompt = f"""You are a task modification expert. The user wants to modify their task list based on their instructions.
 
@@ -1074,7 +1140,7 @@ Return ONLY a valid JSON array of the MODIFIED NEW TASKS, nothing else:
 NOW APPLY THE MODIFICATION TO THE NEW TASKS ONLY. Return only the JSON array:"""
 
     response = call_groq(prompt)  # Changed from call_ollama
-    print(f"Groq Modification Response:\n{response}\n")
+    log.debug("Groq Modification Response:\n%s\n", response)
 
     # Rest of the function remains the same
     try:
@@ -1097,9 +1163,9 @@ NOW APPLY THE MODIFICATION TO THE NEW TASKS ONLY. Return only the JSON array:"""
                 validated_new_tasks = validate_and_clean_tasks(modified_new_tasks)
                 return existing_tasks + validated_new_tasks
     except Exception as e:
-        print(f"Modification parsing failed: {e}")
+        log.warning("Modification parsing failed: %s", e)
 
-    print("LLM modification failed, attempting rule-based fallback")
+    log.warning("LLM modification failed, attempting rule-based fallback")
     modified_new_tasks = rule_based_task_modification(user_instruction, new_tasks)
     return existing_tasks + modified_new_tasks
 
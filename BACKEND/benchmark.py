@@ -0,0 +1,277 @@
+"""
+Scheduler micro/macro benchmarks with a JSON history.
+
+    python benchmark.py run                          # full matrix, appended to the history
+    python benchmark.py run --sizes 10 1000 --horizons 3 --cases schedule_srtf score_schedule
+    python benchmark.py compare                      # last two runs
+    python benchmark.py compare --base 3 --head -1 --threshold 0.15
+    python benchmark.py list
+    python benchmark.py optimize --sizes 100 1000 --budgets-ms 50 200 1000
+
+Every case runs on task lists from generate_random_task_list (seeded), for
+each size x horizon (days). A size is skipped when extrapolating the previous
+size's time past --max-seconds, so the quadratic cases (score_schedule) do
+not stall the suite at 100k tasks; skipped cases are recorded as such. Every
+case gets one untimed warm-up call first.
+
+`optimize` reports how the local-search optimizer's score grows with its
+budget: the best score found by each checkpoint of one search run for the
+largest budget, gain over the best fixed policy and gain per millisecond. It prints only;
+scores don't belong in the timing history.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from optimizer import ScheduleOptimizer
+from scheduler import schedule_tasks, create_schedule_entries, get_arrival_timestamp, prepare_tasks
+from synthetic_dataset_gen import ALGOS, generate_random_task_list, extract_batch_features, score_schedule
+from workload_gen import PRESETS, generate_preset, to_tasks
+
+HISTORY_PATH = os.getenv("BENCHMARK_HISTORY", "benchmark_history.json")
+DEFAULT_SIZES = [10, 1000, 10000, 100000]
+DEFAULT_HORIZONS = [3, 30, 365]
+
+
+def _schedule_case(algo: str) -> Callable:
+    def run(tasks, schedule):
+        schedule_tasks(tasks, algo, time_quantum=2)
+    return run
+
+
+def _features_case(tasks, schedule):
+    extract_batch_features(tasks)
+
+
+def _score_case(tasks, schedule):
+    score_schedule(schedule, tasks)
+
+
+def _entries_case(tasks, schedule):
+    for t in tasks:
+        create_schedule_entries(get_arrival_timestamp(t), t.duration, t.taskName)
+
+
+# name -> (function(tasks, fcfs_schedule), growth exponent used to extrapolate cost);
+# the engines are O(n log n), which 1.1 covers over the default 10x size steps
+CASES: Dict[str, tuple] = {f"schedule_{algo}": (_schedule_case(algo), 1.1) for algo in ALGOS + ["ps-p", "edf-p"]}
+CASES.update({
+    "extract_batch_features": (_features_case, 1),
+    "score_schedule": (_score_case, 2),
+    "create_schedule_entries": (_entries_case, 1),
+})
+
+
+def time_case(fn: Callable, tasks, schedule, repeat: int, min_time: float) -> Dict:
+    """Run fn up to `repeat` times (at least once, stopping after `min_time` seconds total)."""
+    # Untimed warm-up: first-call imports, caches and allocator growth would otherwise land in run 1
+    fn(tasks, schedule)
+    timings = []
+    began = time.perf_counter()
+    while len(timings) < repeat:
+        start = time.perf_counter()
+        fn(tasks, schedule)
+        timings.append(time.perf_counter() - start)
+        if time.perf_counter() - began >= min_time:
+            break
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "runs": len(timings),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def load_history(path: str = HISTORY_PATH) -> List[Dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_history(history: List[Dict], path: str = HISTORY_PATH) -> None:
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(history, f, indent=1)
+    os.replace(tmp, path)
+
+
+def make_task_list(size: int, horizon: int, seed: int, preset: Optional[str] = None) -> list:
+    if preset:
+        return to_tasks(generate_preset(preset, size, seed=seed, horizon_days=horizon))
+    random.seed(seed)
+    return generate_random_task_list(size, horizon_days=horizon)
+
+
+def run_suite(cases: List[str], sizes: List[int], horizons: List[int], repeat: int,
+              min_time: float, max_seconds: float, seed: int, preset: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Run the benchmark matrix.
+
+    Task lists come from generate_random_task_list, or from a workload_gen
+    scenario preset when `preset` is given.
+
+    Returns:
+        Dict keyed "case/n=<size>/h=<days>[/preset]" with timing stats, or {"skipped": reason}
+    """
+    results = {}
+    for horizon in horizons:
+        last_time: Dict[str, tuple] = {}  # case -> (size, seconds)
+        for size in sorted(sizes):
+            tasks = make_task_list(size, horizon, seed, preset)
+            schedule = schedule_tasks(tasks, "fcfs") if "score_schedule" in cases else None
+
+            for name in cases:
+                fn, exponent = CASES[name]
+                key = f"{name}/n={size}/h={horizon}" + (f"/{preset}" if preset else "")
+                if name in last_time:
+                    prev_size, prev_seconds = last_time[name]
+                    estimate = prev_seconds * (size / prev_size) ** exponent
+                    if estimate > max_seconds:
+                        results[key] = {"skipped": f"estimated {estimate:.0f}s > {max_seconds:.0f}s"}
+                        print(f"{key:55s} skipped (estimated {estimate:.0f}s)")
+                        continue
+                stats = time_case(fn, tasks, schedule, repeat, min_time)
+                last_time[name] = (size, stats["min"])
+                results[key] = stats
+                print(f"{key:55s} min {stats['min'] * 1e3:10.3f} ms  median {stats['median'] * 1e3:10.3f} ms"
+                      f"  ({stats['runs']} runs)")
+    return results
+
+
+def run_optimize(sizes: List[int], horizons: List[int], budgets_ms: List[float], seed: int,
+                 preset: Optional[str] = None) -> None:
+    """Print the optimizer's score against its budget for every size x horizon (iterations are estimated)."""
+    print(f"{'case':32s} {'policy':8s} {'base':>8s} {'budget ms':>10s} {'score':>8s} {'gain':>9s}"
+          f" {'gain/ms':>10s} {'iters':>8s}")
+    for horizon in horizons:
+        for size in sorted(sizes):
+            table = prepare_tasks(make_task_list(size, horizon, seed, preset))
+            optimizer = ScheduleOptimizer(table, seed=seed)
+            algo, tq = optimizer.baseline
+            policy = f"{algo}{tq or ''}"
+            key = f"optimize/n={size}/h={horizon}" + (f"/{preset}" if preset else "")
+            optimizer.run(max(budgets_ms))
+            rate = optimizer.iterations / max(budgets_ms)
+            for budget in sorted(budgets_ms):
+                # Best score found by then, from the improvement trace
+                score = max(s for ms, s in optimizer.trace if ms <= budget)
+                gain = score - optimizer.baseline_score
+                print(f"{key:32s} {policy:8s} {optimizer.baseline_score:8.4f} {budget:10.0f} {score:8.4f}"
+                      f" {gain:+9.4f} {gain / budget:10.2e} {rate * budget:8.0f}")
+
+
+def resolve_run(history: List[Dict], ref: str) -> Dict:
+    """A run is referenced by its position in the history (negative counts from the end) or its id."""
+    try:
+        return history[int(ref)]
+    except (ValueError, IndexError):
+        pass
+    for run in history:
+        if run["id"] == ref:
+            return run
+    raise SystemExit(f"No benchmark run '{ref}' in history")
+
+
+def compare_runs(base: Dict, head: Dict, threshold: float) -> int:
+    """Print per-case ratios head/base (on the min time); return the number of regressions."""
+    regressions = 0
+    print(f"base {base['id']} ({base.get('commit')})  ->  head {head['id']} ({head.get('commit')})")
+    print(f"{'case':55s} {'base ms':>12s} {'head ms':>12s} {'ratio':>8s}")
+    for key, head_stats in head["results"].items():
+        base_stats = base["results"].get(key)
+        if not base_stats or "min" not in base_stats or "min" not in head_stats:
+            continue
+        ratio = head_stats["min"] / base_stats["min"] if base_stats["min"] else float("inf")
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        print(f"{key:55s} {base_stats['min'] * 1e3:12.3f} {head_stats['min'] * 1e3:12.3f} {ratio:8.2f}{flag}")
+    print(f"{regressions} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scheduler benchmarks")
+    parser.add_argument("--history", default=HISTORY_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="run the benchmark matrix and append it to the history")
+    run_p.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    run_p.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    run_p.add_argument("--horizons", nargs="+", type=int, default=DEFAULT_HORIZONS, help="arrival horizon in days")
+    run_p.add_argument("--repeat", type=int, default=5)
+    run_p.add_argument("--min-time", type=float, default=1.0, help="stop repeating a case after this many seconds")
+    run_p.add_argument("--max-seconds", type=float, default=60.0, help="skip cases estimated to take longer")
+    run_p.add_argument("--seed", type=int, default=42)
+    run_p.add_argument("--preset", default=None, choices=list(PRESETS), help="workload_gen scenario instead of "
+                                                                           "generate_random_task_list")
+    run_p.add_argument("--label", default="")
+    run_p.add_argument("--no-save", action="store_true")
+
+    cmp_p = sub.add_parser("compare", help="compare two runs from the history")
+    cmp_p.add_argument("--base", default="-2")
+    cmp_p.add_argument("--head", default="-1")
+    cmp_p.add_argument("--threshold", type=float, default=0.10, help="relative slowdown counted as a regression")
+
+    sub.add_parser("list", help="list runs in the history")
+
+    opt_p = sub.add_parser("optimize", help="optimizer score gain per millisecond of budget")
+    opt_p.add_argument("--sizes", nargs="+", type=int, default=[100, 1000, 10000])
+    opt_p.add_argument("--horizons", nargs="+", type=int, default=[3, 30], help="arrival horizon in days")
+    opt_p.add_argument("--budgets-ms", nargs="+", type=float, default=[10, 50, 200, 1000])
+    opt_p.add_argument("--seed", type=int, default=42)
+    opt_p.add_argument("--preset", default=None, choices=list(PRESETS))
+    args = parser.parse_args()
+
+    history = load_history(args.history)
+    if args.command == "run":
+        results = run_suite(args.cases, args.sizes, args.horizons, args.repeat,
+                            args.min_time, args.max_seconds, args.seed, args.preset)
+        run = {
+            "id": datetime.now().strftime("%Y%m%dT%H%M%S"),
+            "label": args.label,
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "preset": args.preset,
+            "results": results,
+        }
+        if not args.no_save:
+            history.append(run)
+            save_history(history, args.history)
+            print(f"Saved run {run['id']} to {args.history}")
+    elif args.command == "optimize":
+        run_optimize(args.sizes, args.horizons, args.budgets_ms, args.seed, args.preset)
+    elif args.command == "compare":
+        if len(history) < 2 and (args.base == "-2" or args.head == "-1"):
+            raise SystemExit("Need at least two runs in the history to compare")
+        regressions = compare_runs(resolve_run(history, args.base), resolve_run(history, args.head), args.threshold)
+        sys.exit(1 if regressions else 0)
+    else:
+        for i, run in enumerate(history):
+            print(f"{i:3d}  {run['id']}  {run.get('commit') or '-':10s}  {run.get('label', '')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+from starlette.concurrency import iterate_in_threadpool
+
+from ai_agent_claude import call_groq, validate_and_clean_tasks, regex_based_fallback
+from observability import get_logger
+
+# Bulk import configuration (override through environment variables)
+BULK_TOKEN_BUDGET = int(os.getenv("BULK_IMPORT_TOKEN_BUDGET", "3000"))  # input tokens per prompt
+BULK_MAX_LINES_PER_CHUNK = int(os.getenv("BULK_IMPORT_MAX_LINES", "40"))
+BULK_CONCURRENCY = int(os.getenv("BULK_IMPORT_CONCURRENCY", "4"))
+BULK_REQUESTS_PER_SECOND = float(os.getenv("BULK_IMPORT_RPS", "0.5"))  # Groq free tier: 30 req/min
+BULK_OUTPUT_TOKENS_PER_LINE = 90
+
+# Rough token estimate for the fixed instructions wrapped around every chunk
+PROMPT_OVERHEAD_TOKENS = 450
+
+log = get_logger("bulk_import")
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how often LLM calls are started."""
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call may be started."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def split_import_text(text: str) -> List[str]:
+    """Split an uploaded file / pasted text into one NL task entry per line."""
+    return text.splitlines()
+
+
+def pack_lines(lines: List[str], token_budget: int = BULK_TOKEN_BUDGET,
+               max_lines: int = BULK_MAX_LINES_PER_CHUNK) -> List[List[Tuple[int, str]]]:
+    """
+    Greedily pack non-empty lines into chunks that fit one extraction prompt.
+
+    Args:
+        lines: NL task entries, one per line
+        token_budget: Estimated input-token budget per prompt
+        max_lines: Upper bound on lines per prompt (bounds the output size)
+
+    Returns:
+        List of chunks, each a list of (line_index, line_text)
+    """
+    chunks = []
+    current = []
+    used = PROMPT_OVERHEAD_TOKENS
+
+    for idx, line in enumerate(lines):
+        line = line.strip()
+        if not line:
+            continue
+        cost = estimate_tokens(line) + 3  # line number prefix
+        if current and (used + cost > token_budget or len(current) >= max_lines):
+            chunks.append(current)
+            current = []
+            used = PROMPT_OVERHEAD_TOKENS
+        current.append((idx, line))
+        used += cost
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def build_bulk_prompt(chunk: List[Tuple[int, str]]) -> str:
+    """Build one extraction prompt for a chunk of numbered NL lines."""
+    current_date = datetime.now().strftime("%Y-%m-%d")
+    day_of_week = datetime.now().strftime("%A")
+    numbered = "\n".join(f"{n}. {line}" for n, (_, line) in enumerate(chunk, start=1))
+
+    return f"""You are an expert task extraction system. Each numbered line below is an independent task entry.
+
+CURRENT DATE: {current_date} ({day_of_week})
+
+RULES:
+- A line may contain several tasks (separated by commas, "and", or semicolons)
+- "same day" means the previously mentioned date on that line; "anytime" start means null
+- Times use 24-hour hours (6pm = 18); dates like "2/10/2025" are DAY/MONTH/YEAR -> "2025-10-02"
+- Use null for anything not stated; importance is High, Medium or Low (default Medium)
+
+LINES:
+{numbered}
+
+OUTPUT FORMAT:
+Return ONLY a valid JSON array. Every object MUST include "line", the number of the line it came from:
+
+[
+  {{"line": 1, "TaskName": "task", "Duration": hours_or_null, "arrivaltime": hour_or_null, "arrivaldate": "YYYY-MM-DD_or_null", "deadlinetime": hour_or_null, "deadlinedate": "YYYY-MM-DD_or_null", "importance": "Medium"}}
+]
+
+Return only the JSON array:"""
+
+
+def parse_bulk_response(response: str) -> Optional[List[Dict]]:
+    """Parse the LLM response into a list of task dicts, or None if unusable."""
+    cleaned = response.strip()
+    cleaned = re.sub(r'^```(?:json)?\s*', '', cleaned, flags=re.MULTILINE)
+    cleaned = re.sub(r'\s*```$', '', cleaned, flags=re.MULTILINE)
+
+    # Strategy 1: Direct JSON parsing
+    try:
+        parsed = json.loads(cleaned)
+        if isinstance(parsed, list):
+            return parsed
+    except Exception:
+        pass
+
+    # Strategy 2: Outermost JSON array with trailing commas removed
+    match = re.search(r'\[.*\]', cleaned, re.DOTALL)
+    if not match:
+        return None
+    try:
+        parsed = json.loads(re.sub(r',(\s*[}\]])', r'\1', match.group()))
+    except Exception as e:
+        log.warning("Bulk response parsing failed: %s", e)
+        return None
+    return parsed if isinstance(parsed, list) else None
+
+
+def extract_chunk(chunk: List[Tuple[int, str]], limiter: RateLimiter) -> List[Dict]:
+    """
+    Run one packed extraction call and split the result back per line.
+
+    Lines the LLM skipped (or a whole chunk whose response cannot be parsed)
+    fall back to regex_based_fallback so every line yields a result.
+
+    Returns:
+        One result dict per input line, in chunk order
+    """
+    limiter.acquire()
+    prompt = build_bulk_prompt(chunk)
+    max_tokens = min(8000, BULK_OUTPUT_TOKENS_PER_LINE * len(chunk) + 200)
+    response = call_groq(prompt, max_tokens=max_tokens)
+    parsed = parse_bulk_response(response) or []
+
+    by_line: Dict[int, List[Dict]] = {}
+    for item in parsed:
+        if not isinstance(item, dict):
+            continue
+        line_no = item.get("line")
+        try:
+            line_no = int(line_no)
+        except (TypeError, ValueError):
+            continue
+        if 1 <= line_no <= len(chunk):
+            by_line.setdefault(line_no, []).append(item)
+
+    results = []
+    for n, (idx, line) in enumerate(chunk, start=1):
+        tasks = validate_and_clean_tasks(by_line.get(n, []))
+        source = "llm"
+        if not tasks:
+            tasks = regex_based_fallback(line)
+            source = "regex"
+        results.append({"line": idx, "input": line, "source": source, "tasks": tasks})
+    return results
+
+
+def import_tasks(lines: List[str],
+                 token_budget: int = BULK_TOKEN_BUDGET,
+                 concurrency: int = BULK_CONCURRENCY,
+                 requests_per_second: float = BULK_REQUESTS_PER_SECOND,
+                 pool: Optional[ThreadPoolExecutor] = None) -> Iterator[Dict]:
+    """
+    Extract tasks from many NL lines with packed, concurrent LLM calls.
+
+    Args:
+        lines: NL task entries, one per line
+        token_budget: Estimated input-token budget per prompt
+        concurrency: Number of extraction calls in flight
+        requests_per_second: Rate limit for starting LLM calls
+        pool: Executor for the calls, for a caller that needs to cancel them from
+            another thread (default: a private one of `concurrency` threads)
+
+    Yields:
+        Per-line result dicts as chunks complete, then a final summary dict.
+        Closing the generator early cancels the chunks not started yet.
+    """
+    chunks = pack_lines(lines, token_budget)
+    limiter = RateLimiter(requests_per_second, burst=concurrency)
+    log.info("Bulk import: %d lines packed into %d prompts", len(lines), len(chunks))
+
+    total_tasks = 0
+    fallback_lines = 0
+    own_pool = pool is None
+    if own_pool:
+        pool = ThreadPoolExecutor(max_workers=max(1, concurrency))
+    try:
+        futures = [pool.submit(extract_chunk, chunk, limiter) for chunk in chunks]
+        for future in as_completed(futures):
+            for result in future.result():
+                total_tasks += len(result["tasks"])
+                fallback_lines += result["source"] == "regex"
+                yield result
+    finally:
+        # Also reached when the consumer stops early: don't spend LLM calls nobody will read
+        if own_pool:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    yield {
+        "done": True,
+        "lines": sum(len(chunk) for chunk in chunks),
+        "prompts": len(chunks),
+        "tasks": total_tasks,
+        "fallbackLines": fallback_lines
+    }
+
+
+async def stream_import_ndjson(lines: List[str]) -> AsyncIterator[bytes]:
+    """Serialize import_tasks results as newline-delimited JSON, stopping the import if the client goes away."""
+    pool = ThreadPoolExecutor(max_workers=max(1, BULK_CONCURRENCY))
+    try:
+        async for result in iterate_in_threadpool(import_tasks(lines, pool=pool)):
+            yield orjson.dumps(result) + b"\n"
+    finally:
+        # On disconnect the import may still be waiting for a chunk in its thread, so it can't be
+        # closed from here; cancelling through the pool drops the chunks not sent to the LLM yet
+        pool.shutdown(wait=False, cancel_futures=True)
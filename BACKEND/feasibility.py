@@ -0,0 +1,428 @@
+"""
+Deadline feasibility for a single person working the backlog.
+
+Preemptive EDF is optimal for one worker with arrival times (Jackson /
+Horn): if any schedule meets every deadline, EDF does, and its maximum
+lateness is the smallest any schedule can reach. So instead of running and
+scoring a full schedule, check_feasibility simulates preemptive EDF with a
+heap, O(n log n), and reports whether the set is feasible, the first task
+that misses and how many extra hours of work time would be needed.
+Dependencies are folded in first by the usual release / deadline
+adjustment (a task can't start before its predecessors could have
+finished, and must finish early enough for its successors), after which
+EDF stays optimal.
+
+For admission control FeasibilityTracker keeps the backlog in a treap
+ordered by deadline, with per-subtree sums of work and minimum slack, so
+adding or removing a task and asking "still feasible?" are O(log n). Its
+view is the work left at one moment `now`, which is exact when every task
+is available by then. With arrival times, ReleaseTracker keeps one of them
+per distinct arrival time (Horn's condition), O(R log n) per task for R
+arrival times. With dependencies every candidate gets the full O(n log n)
+check, so admit_tasks caps candidates x tasks at ADMIT_MAX_CELLS.
+"""
+import heapq
+import os
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from scheduler import TaskTable, epoch_day_to_date, table_from_columns, tick_hours
+from task_graph import successor_lists, topological_order
+from work_calendar import CalendarIndex, WorkCalendar
+
+# Upper bound on candidates x tasks when admission can't use the O(log n) trackers
+ADMIT_MAX_CELLS = int(os.getenv("ADMIT_MAX_CELLS", "2000000"))
+
+
+def effective_windows(releases: Sequence[int], durations: Sequence[int], deadlines: Sequence[int],
+                      predecessors: Optional[List[List[int]]]) -> Tuple[List[int], List[int]]:
+    """
+    Releases and deadlines with precedence folded in: a task is released no
+    earlier than its predecessors can finish and is due early enough for its
+    successors to make their own deadlines.
+    """
+    releases, deadlines = list(releases), list(deadlines)
+    if predecessors is None:
+        return releases, deadlines
+    order = topological_order(predecessors)
+    for i in order:
+        for p in predecessors[i]:
+            if releases[p] + durations[p] > releases[i]:
+                releases[i] = releases[p] + durations[p]
+    successors = successor_lists(predecessors)
+    for i in reversed(order):
+        for s in successors[i]:
+            if deadlines[s] - durations[s] < deadlines[i]:
+                deadlines[i] = deadlines[s] - durations[s]
+    return releases, deadlines
+
+
+def edf_finishes(releases: Sequence[int], durations: Sequence[int], deadlines: Sequence[int]) -> List[int]:
+    """Finish time of every task under preemptive EDF (ties by index)."""
+    n = len(releases)
+    order = sorted(range(n), key=releases.__getitem__)
+    remaining = list(durations)
+    finishes = [0] * n
+    ready: List[Tuple[int, int]] = []
+    t = 0
+    pos = 0
+    while pos < n or ready:
+        if not ready and releases[order[pos]] > t:
+            t = releases[order[pos]]
+        while pos < n and releases[order[pos]] <= t:
+            idx = order[pos]
+            heapq.heappush(ready, (deadlines[idx], idx))
+            pos += 1
+        idx = ready[0][1]
+        next_release = releases[order[pos]] if pos < n else None
+        if next_release is None or t + remaining[idx] <= next_release:
+            heapq.heappop(ready)
+            t += remaining[idx]
+            finishes[idx] = t
+        else:
+            remaining[idx] -= next_release - t
+            t = next_release
+    return finishes
+
+
+def working_windows(table: TaskTable,
+                    calendar: Optional[WorkCalendar]) -> Tuple[List[int], List[int], Optional[CalendarIndex]]:
+    """Arrivals and deadlines in working ticks when there is a calendar, else as they are."""
+    if calendar is None or len(table) == 0:
+        return table.arrivals, table.deadlines, None
+    last = max(max(table.arrivals), max(table.deadlines))
+    index = calendar.index(min(table.arrivals), last, sum(table.durations), table.tick)
+    return ([index.working_before(a) for a in table.arrivals],
+            [index.working_before(d) for d in table.deadlines], index)
+
+
+def check_feasibility(table: TaskTable, calendar: Optional[WorkCalendar] = None) -> Dict[str, Any]:
+    """
+    Can one person meet every deadline of the table?
+
+    Returns:
+        {"feasible", "extraHours": work hours short of meeting every deadline (0 when feasible),
+         "firstViolation": None or {"id", "finish", "deadline", "lateHours"} of the task EDF
+         finishes late first}; finish / deadline are {"date", "hrs"}. Dependencies tighten a
+        task's deadline to what its successors need, and lateHours is measured against that.
+        With a calendar, hours are working hours.
+    """
+    if len(table) == 0:
+        return {"feasible": True, "extraHours": 0, "firstViolation": None}
+    arrivals, deadlines, index = working_windows(table, calendar)
+    releases, deadlines = effective_windows(arrivals, table.durations, deadlines, table.depends)
+    finishes = edf_finishes(releases, table.durations, deadlines)
+
+    late = [i for i in range(len(table)) if finishes[i] > deadlines[i]]
+    hours = tick_hours(table.tick) or int
+    if not late:
+        return {"feasible": True, "extraHours": 0, "firstViolation": None}
+    first = min(late, key=finishes.__getitem__)
+    finish = finishes[first] if index is None else index.real_time(finishes[first] - 1) + 1
+    return {
+        "feasible": False,
+        "extraHours": hours(max(finishes[i] - deadlines[i] for i in late)),
+        "firstViolation": {
+            "id": table.ids[first],
+            "finish": _moment(finish, table.tick),
+            "deadline": _moment(table.deadlines[first], table.tick),
+            "lateHours": hours(finishes[first] - deadlines[first]),
+        },
+    }
+
+
+def summary_table(tasks: List[Dict[str, Any]]) -> TaskTable:
+    """
+    TaskTable of the agent's task summary entries ({"TaskName", "Duration",
+    "arrivaldate", "arrivaltime", "deadlinedate", "deadlinetime", ...}),
+    skipping any with a field still missing; ids are 1-based list positions.
+    """
+    rows = []
+    for position, task in enumerate(tasks, 1):
+        fields = [task.get(k) for k in ("Duration", "arrivaldate", "arrivaltime", "deadlinedate", "deadlinetime")]
+        if all(f is not None for f in fields):
+            rows.append((position, task.get("TaskName", ""), *fields, task.get("importance", "Medium")))
+    return table_from_columns(*(list(column) for column in zip(*rows))) if rows else TaskTable([], [], [], [], [], [])
+
+
+def _moment(t: int, tick: int) -> Dict[str, Any]:
+    per_day = 1440 // tick
+    return {"date": epoch_day_to_date(t // per_day), "hrs": (tick_hours(tick) or int)(t % per_day)}
+
+
+class _Node:
+    __slots__ = ("key", "task_id", "work", "prio", "left", "right", "total", "slack")
+
+    def __init__(self, key: Tuple[int, int], task_id: Any, work: int):
+        self.key = key
+        self.task_id = task_id
+        self.work = work
+        self.prio = random.random()
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+        self.total = work
+        self.slack = key[0] - work
+
+
+def _update(node: _Node) -> None:
+    # total: work in the subtree; slack: min over its tasks of deadline - work up to and including it
+    left, right = node.left, node.right
+    before = node.work if left is None else left.total + node.work
+    slack = node.key[0] - before
+    if left is not None and left.slack < slack:
+        slack = left.slack
+    if right is not None:
+        if right.slack - before < slack:
+            slack = right.slack - before
+        node.total = before + right.total
+    else:
+        node.total = before
+    node.slack = slack
+
+
+def _split(node: Optional[_Node], key: Tuple[int, int]) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """(keys < key, keys >= key)"""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update(node)
+    return left, node
+
+
+def _merge(a: Optional[_Node], b: Optional[_Node]) -> Optional[_Node]:
+    """Merge treaps where every key of a is below every key of b."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    _update(b)
+    return b
+
+
+def _build(nodes: List[_Node]) -> Optional[_Node]:
+    """Treap of nodes already sorted by key, in O(n) (Cartesian tree on the priorities)."""
+    stack: List[_Node] = []
+    for node in nodes:
+        last = None
+        while stack and stack[-1].prio < node.prio:
+            last = stack.pop()
+        node.left = last
+        if stack:
+            stack[-1].right = node
+        stack.append(node)
+    # Children before parents: reverse preorder
+    order, pending = [], stack[:1]
+    while pending:
+        node = pending.pop()
+        order.append(node)
+        pending.extend(child for child in (node.left, node.right) if child is not None)
+    for node in reversed(order):
+        _update(node)
+    return stack[0] if stack else None
+
+
+class FeasibilityTracker:
+    """
+    Incremental EDF feasibility of the work left at time `now`.
+
+    With every task available, EDF meets all deadlines iff for each task
+    now + (work of the tasks due no later than it) <= its deadline. The
+    tasks sit in a treap keyed by deadline whose nodes carry the minimum of
+    deadline - work-so-far over their subtree, so that condition, the extra
+    time needed and the first task to miss all come off the root in
+    O(log n) after each add / remove. Times are plain ints (ticks).
+    """
+
+    def __init__(self, now: int = 0):
+        self.now = now
+        self.root: Optional[_Node] = None
+        self.keys: Dict[Any, Tuple[int, int]] = {}
+        self.seq = 0
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, task_id: Any, work: int, deadline: int) -> None:
+        if task_id in self.keys:
+            raise ValueError(f"Task {task_id} is already tracked")
+        key = (deadline, self.seq)
+        self.seq += 1
+        self.keys[task_id] = key
+        left, right = _split(self.root, key)
+        self.root = _merge(_merge(left, _Node(key, task_id, work)), right)
+
+    def extend(self, tasks: Sequence[Tuple[Any, int, int]]) -> None:
+        """add() for many (task_id, work, deadline) at once: O(m log m) into an empty tracker."""
+        if self.root is not None:
+            for task in tasks:
+                self.add(*task)
+            return
+        nodes = []
+        for task_id, work, deadline in tasks:
+            if task_id in self.keys:
+                raise ValueError(f"Task {task_id} is already tracked")
+            key = (deadline, self.seq)
+            self.seq += 1
+            self.keys[task_id] = key
+            nodes.append(_Node(key, task_id, work))
+        nodes.sort(key=lambda node: node.key)
+        self.root = _build(nodes)
+
+    def remove(self, task_id: Any) -> None:
+        key = self.keys.pop(task_id)
+        left, rest = _split(self.root, key)
+        _, right = _split(rest, (key[0], key[1] + 1))
+        self.root = _merge(left, right)
+
+    def feasible(self) -> bool:
+        return self.root is None or self.root.slack >= self.now
+
+    def extra(self) -> int:
+        """Work time short of meeting every deadline (0 when feasible)."""
+        return 0 if self.root is None else max(self.now - self.root.slack, 0)
+
+    def first_violation(self) -> Optional[Any]:
+        """Id of the earliest-due task that would finish late, or None."""
+        node, before = self.root, 0
+        if node is None or node.slack >= self.now:
+            return None
+        while True:
+            left = node.left
+            if left is not None and left.slack - before < self.now:
+                node = left
+                continue
+            before += node.work if left is None else left.total + node.work
+            if node.key[0] - before < self.now:
+                return node.task_id
+            node = node.right
+
+
+class ReleaseTracker:
+    """
+    Incremental EDF feasibility with arrival times.
+
+    One person can meet every deadline iff for every arrival time r and
+    deadline d the tasks arriving at or after r and due by d fit in d - r
+    (Horn). That is a FeasibilityTracker with now = r over the tasks arriving
+    at or after r, one per distinct arrival time, so add / remove cost
+    O(R log n) and feasible() O(R) for R arrival times.
+    """
+
+    def __init__(self, releases: Sequence[int]):
+        self.levels = sorted(set(releases))
+        self.trackers = [FeasibilityTracker(r) for r in self.levels]
+        self.releases: Dict[Any, int] = {}
+
+    def add(self, task_id: Any, work: int, release: int, deadline: int) -> None:
+        self.releases[task_id] = release
+        for level, tracker in zip(self.levels, self.trackers):
+            if level > release:
+                break
+            tracker.add(task_id, work, deadline)
+
+    def extend(self, tasks: Sequence[Tuple[Any, int, int, int]]) -> None:
+        """add() for many (task_id, work, release, deadline) at once."""
+        for task_id, _, release, _ in tasks:
+            self.releases[task_id] = release
+        for level, tracker in zip(self.levels, self.trackers):
+            tracker.extend([(task_id, work, deadline) for task_id, work, release, deadline in tasks
+                            if release >= level])
+
+    def remove(self, task_id: Any) -> None:
+        release = self.releases.pop(task_id)
+        for level, tracker in zip(self.levels, self.trackers):
+            if level > release:
+                break
+            tracker.remove(task_id)
+
+    def feasible(self) -> bool:
+        return all(tracker.feasible() for tracker in self.trackers)
+
+
+def admit_tasks(table: TaskTable, base: int, calendar: Optional[WorkCalendar] = None) -> Dict[str, Any]:
+    """
+    Admission control: the first `base` tasks of the table are committed, the
+    rest are candidates admitted in order as long as everything stays feasible.
+
+    Without dependencies the tasks go on a ReleaseTracker: building it costs
+    O(R n log n) and each candidate O(R log n) for R distinct arrival times,
+    so O(log n) when everything is available at once. When there are more
+    arrival times than candidates, one full O(n log n) EDF check per
+    candidate is cheaper and used instead. With dependencies every candidate
+    gets the full check, and one depending on a rejected (or later)
+    candidate is rejected.
+
+    Returns:
+        check_feasibility of the committed tasks plus "admitted" / "rejected" candidate ids
+
+    Raises:
+        ValueError: A committed task depends on a candidate, or candidates x tasks
+            is over ADMIT_MAX_CELLS for more than one arrival time
+    """
+    n = len(table)
+    admitted = list(range(base))
+    rejected: List[int] = []
+    if table.depends is not None and any(p >= base for i in range(base) for p in table.depends[i]):
+        raise ValueError("Committed tasks can't depend on candidates")
+    if n > base:
+        arrivals, deadlines, _ = working_windows(table, calendar)
+        durations, depends = table.durations, table.depends
+        levels = len(set(arrivals))
+        if (depends is not None or levels > 1) and (n - base) * n > ADMIT_MAX_CELLS:
+            raise ValueError(f"{n - base} candidates x {n} tasks is over the limit of {ADMIT_MAX_CELLS}; "
+                             f"admit fewer candidates at a time")
+        tracker = None
+        if depends is None and levels <= max(n - base, 1):
+            tracker = ReleaseTracker(arrivals)
+            tracker.extend([(i, durations[i], arrivals[i], deadlines[i]) for i in range(base)])
+        included = set(admitted)
+        for i in range(base, n):
+            if depends is not None and any(p not in included for p in depends[i]):
+                ok = False
+            elif tracker is not None:
+                tracker.add(i, durations[i], arrivals[i], deadlines[i])
+                ok = tracker.feasible()
+                if not ok:
+                    tracker.remove(i)
+            else:
+                ok = _feasible_subset(arrivals, durations, deadlines, depends, admitted + [i])
+            if ok:
+                admitted.append(i)
+                included.add(i)
+            else:
+                rejected.append(i)
+
+    report = check_feasibility(_subset(table, admitted), calendar)
+    report["admitted"] = [table.ids[i] for i in admitted[base:]]
+    report["rejected"] = [table.ids[i] for i in rejected]
+    return report
+
+
+def _feasible_subset(arrivals: List[int], durations: List[int], deadlines: List[int],
+                     depends: Optional[List[List[int]]], indices: List[int]) -> bool:
+    position = {idx: pos for pos, idx in enumerate(indices)}
+    predecessors = None if depends is None else [[position[p] for p in depends[i]] for i in indices]
+    releases, due = effective_windows([arrivals[i] for i in indices], [durations[i] for i in indices],
+                                      [deadlines[i] for i in indices], predecessors)
+    work = [durations[i] for i in indices]
+    return all(f <= d for f, d in zip(edf_finishes(releases, work, due), due))
+
+
+def _subset(table: TaskTable, indices: List[int]) -> TaskTable:
+    position = {idx: pos for pos, idx in enumerate(indices)}
+    depends = None
+    if table.depends is not None:
+        depends = [[position[p] for p in table.depends[i]] for i in indices]
+        depends = depends if any(depends) else None
+    return TaskTable(*([column[i] for i in indices] for column in (
+        table.ids, table.names, table.durations, table.arrivals, table.deadlines, table.priorities)),
+        tick=table.tick, depends=depends)
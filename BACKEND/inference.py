@@ -0,0 +1,119 @@
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from models import Task
+from observability import get_logger, span
+
+# xgboost and the feature code (numpy/scipy) cost over a second to import,
+# so they load with the models rather than with the server
+if TYPE_CHECKING:
+    import numpy as np
+    from xgboost import Booster
+
+ALGO_MODEL_PATH = os.getenv("ALGO_MODEL_PATH", "xgb_model_algo.json")
+TQ_MODEL_PATH = os.getenv("TQ_MODEL_PATH", "xgb_model_tq.json")
+
+# Label tables the classifiers were trained against (models trained before
+# mlfq / ps-aging joined the dataset only predict the first six)
+ALGOS = ["fcfs", "sjf", "srtf", "rr", "ps", "edf", "mlfq", "ps-aging"]
+TQS = [1, 2, 4, 6]
+# Feature order the classifiers were trained on (the training CSVs minus the label column)
+FEATURE_COLUMNS = ["num_tasks", "std_duration", "total_workload", "workload_density", "density_x_tasks",
+                   "arrival_spread", "duration_range_ratio", "workload_x_density", "density_x_tightness"]
+
+log = get_logger("inference")
+
+_models: Dict[str, "Booster"] = {}
+_lock = threading.Lock()
+
+
+def _load(path: str) -> "Booster":
+    # The raw booster reads the XGBClassifier model files without the sklearn wrapper
+    from xgboost import Booster
+    return Booster(model_file=path)
+
+
+def load_models(force: bool = False) -> Dict[str, "Booster"]:
+    """
+    Load (once) and return the algorithm and time-quantum classifiers.
+
+    Args:
+        force: Re-read the model files even if they are already cached
+
+    Returns:
+        Dict with "algo" and "tq" models
+    """
+    if _models and not force:
+        return _models
+    with _lock:
+        if force or not _models:
+            models = {"algo": _load(ALGO_MODEL_PATH), "tq": _load(TQ_MODEL_PATH)}
+            _models.clear()
+            _models.update(models)
+    return _models
+
+
+def preload() -> bool:
+    """
+    Load models and warm the feature pipeline.
+
+    Meant to run in the server's master process before workers fork, so the
+    boosters are shared copy-on-write instead of loaded per worker/request.
+
+    Returns:
+        True if the models were loaded, False if the model files are missing
+    """
+    try:
+        load_models()
+    except Exception as e:
+        log.warning("Model preload skipped: %s", e)
+        return False
+    # One dummy prediction so lazily-built predictor state exists before fork
+    predict_suggestion([Task(
+        id=0, taskName="warmup", duration=1,
+        arrivalTime={"hrs": 0, "date": "2025-01-01"},
+        deadlineTime={"hrs": 1, "date": "2025-01-01"},
+        importance="Medium"
+    )])
+    return True
+
+
+def reload_models() -> bool:
+    """Re-read the model files (e.g. after retraining); used by the reload hook."""
+    try:
+        load_models(force=True)
+    except Exception as e:
+        log.error("Model reload failed, keeping previous models: %s", e)
+        return False
+    return True
+
+
+def feature_vector(features: Dict[str, float]) -> "np.ndarray":
+    """One C-contiguous float32 row of `features` in FEATURE_COLUMNS order."""
+    import numpy as np
+    return np.array([[features[name] for name in FEATURE_COLUMNS]], dtype=np.float32)
+
+
+def _predict_class(booster: "Booster", row: "np.ndarray") -> int:
+    output = booster.inplace_predict(row)
+    # multi:softmax returns the class index, multi:softprob one probability per class
+    return int(output[0].argmax()) if output.ndim > 1 else int(output[0])
+
+
+def predict_suggestion(task_list: List) -> Dict[str, Optional[int]]:
+    """
+    Predict the best scheduling algorithm (and RR / MLFQ time quantum) for a task list.
+
+    Returns:
+        {"algo": algorithm name, "tq": time quantum, or 0 when not applicable}
+    """
+    from synthetic_dataset_gen import extract_batch_features
+
+    models = load_models()
+    with span("feature_extraction"):
+        row = feature_vector(extract_batch_features(task_list))
+    with span("model_predict"):
+        algo = ALGOS[_predict_class(models["algo"], row)]
+        tq = TQS[_predict_class(models["tq"], row)] if algo in ("rr", "mlfq") else 0
+    return {"algo": algo, "tq": tq}
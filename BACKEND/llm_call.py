@@ -1,15 +1,19 @@
 import json
 import requests
 import os
+import time
 from typing import List
 from models import Chat_req, TaskItem
+from observability import get_logger, record_llm_call
 from dotenv import load_dotenv
 load_dotenv()
 # Groq API Configuration
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
+GROQ_API_URL = os.getenv("GROQ_API_URL", "https://api.groq.com/openai/v1/chat/completions")
 GROQ_MODEL = "qwen/qwen3-32b"
 
+log = get_logger("llm_call")
+
 
 def call_groq_chat(prompt: str, model: str = GROQ_MODEL, temperature: float = 0.1, max_tokens: int = 2000) -> str:
     """Call Groq API with chat completion format."""
@@ -34,17 +38,25 @@ def call_groq_chat(prompt: str, model: str = GROQ_MODEL, temperature: float = 0.
             "max_tokens": max_tokens
         }
 
-        response = requests.post(
-            GROQ_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=90
-        )
+        start = time.perf_counter()
+        try:
+            response = requests.post(
+                GROQ_API_URL,
+                headers=headers,
+                json=payload,
+                timeout=90
+            )
+        except requests.exceptions.Timeout:
+            record_llm_call("groq", model, time.perf_counter() - start, "timeout")
+            raise
+        elapsed = time.perf_counter() - start
 
         if response.status_code == 200:
             result = response.json()
+            record_llm_call("groq", model, elapsed, "ok", result.get("usage"))
             return result.get("choices", [{}])[0].get("message", {}).get("content", "")
         else:
+            record_llm_call("groq", model, elapsed, "error")
             error_msg = f"Groq API error: {response.status_code}"
             try:
                 error_detail = response.json()
@@ -158,7 +170,7 @@ def update_tasklist_with_llm(user_message: str, schedule_list: List[TaskItem]):
     }}
     """
 
-    print(prompt)
+    log.debug("chat prompt: %s", prompt)
 
     # Call Groq API instead of Ollama
     model_output = call_groq_chat(prompt)
@@ -166,7 +178,7 @@ def update_tasklist_with_llm(user_message: str, schedule_list: List[TaskItem]):
     # Try to parse JSON
     try:
         result = json.loads(model_output)
-        print(result)
+        log.debug("chat result: %s", result)
     except json.JSONDecodeError:
         # In case model outputs extra text around JSON
         json_start = model_output.find("{")
@@ -0,0 +1,120 @@
+"""
+OpenAI-compatible (and Ollama-compatible) LLM stub for load testing.
+
+    uvicorn llm_stub:app --port 8100
+    GROQ_API_URL=http://127.0.0.1:8100/openai/v1/chat/completions \\
+    OLLAMA_API_URL=http://127.0.0.1:8100/api/generate GROQ_API_KEY=stub python serve.py
+
+Replies are shaped like what each backend prompt expects (task JSON arrays,
+the chat {"agent_response", "tasklist"} object, plain text otherwise) and are
+delayed to mimic a real provider:
+
+    delay = STUB_LATENCY_MS (+/- STUB_JITTER_MS) + completion_tokens / STUB_TOKENS_PER_SECOND
+
+STUB_ERROR_RATE makes that share of requests fail with HTTP 500.
+"""
+import asyncio
+import json
+import os
+import random
+import re
+import time
+from datetime import datetime
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+STUB_LATENCY_MS = float(os.getenv("STUB_LATENCY_MS", "300"))  # time to first token
+STUB_JITTER_MS = float(os.getenv("STUB_JITTER_MS", "100"))
+STUB_TOKENS_PER_SECOND = float(os.getenv("STUB_TOKENS_PER_SECOND", "400"))  # 0 = instant generation
+STUB_ERROR_RATE = float(os.getenv("STUB_ERROR_RATE", "0"))
+
+SCHEDULE_PATTERN = re.compile(r"\*\*CURRENT SCHEDULE:\*\*\s*(\[.*?\])\s*\*\*OUTPUT REQUIREMENT", re.DOTALL)
+NUMBERED_LINE_PATTERN = re.compile(r"^(\d+)\. ", re.MULTILINE)
+
+app = FastAPI()
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def stub_task(line: int = None) -> dict:
+    today = datetime.now().strftime("%Y-%m-%d")
+    task = {
+        "TaskName": f"Stub task {random.randint(1, 9999)}",
+        "Duration": random.randint(1, 4),
+        "arrivaltime": 9,
+        "arrivaldate": today,
+        "deadlinetime": 17,
+        "deadlinedate": today,
+        "importance": random.choice(["High", "Medium", "Low"]),
+    }
+    if line is not None:
+        task = {"line": line, **task}
+    return task
+
+
+def completion_for(prompt: str) -> str:
+    """Pick a reply in the format the prompt asks for."""
+    if '"agent_response"' in prompt:
+        match = SCHEDULE_PATTERN.search(prompt)
+        tasklist = json.loads(match.group(1)) if match else []
+        return json.dumps({"agent_response": "Done (stub).", "tasklist": tasklist})
+    if "JSON array" in prompt:
+        if '"line"' in prompt:
+            lines = sorted({int(n) for n in NUMBERED_LINE_PATTERN.findall(prompt)})
+            return json.dumps([stub_task(n) for n in lines])
+        return json.dumps([stub_task()])
+    return "The schedule looks feasible. No conflicts found."
+
+
+async def simulate(prompt: str):
+    """Return (content, usage) after the configured delay, or None for an injected error."""
+    content = completion_for(prompt)
+    usage = {"prompt_tokens": estimate_tokens(prompt), "completion_tokens": estimate_tokens(content)}
+    usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+    delay = max(0.0, STUB_LATENCY_MS + random.uniform(-STUB_JITTER_MS, STUB_JITTER_MS)) / 1000
+    if STUB_TOKENS_PER_SECOND > 0:
+        delay += usage["completion_tokens"] / STUB_TOKENS_PER_SECOND
+    await asyncio.sleep(delay)
+
+    if random.random() < STUB_ERROR_RATE:
+        return None
+    return content, usage
+
+
+@app.post("/v1/chat/completions")
+@app.post("/openai/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+    result = await simulate(prompt)
+    if result is None:
+        return JSONResponse({"error": {"message": "stub injected error"}}, status_code=500)
+    content, usage = result
+    return {
+        "id": f"chatcmpl-stub-{random.getrandbits(32):08x}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "stub"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": usage,
+    }
+
+
+@app.post("/api/generate")
+async def ollama_generate(request: Request):
+    body = await request.json()
+    result = await simulate(body.get("prompt", ""))
+    if result is None:
+        return JSONResponse({"error": "stub injected error"}, status_code=500)
+    content, usage = result
+    return {
+        "model": body.get("model", "stub"),
+        "response": content,
+        "done": True,
+        "prompt_eval_count": usage["prompt_tokens"],
+        "eval_count": usage["completion_tokens"],
+    }
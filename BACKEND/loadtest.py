@@ -0,0 +1,227 @@
+"""
+Asyncio HTTP load-test driver for the backend.
+
+    # against a running server
+    python loadtest.py --base-url http://127.0.0.1:8000 --endpoints chat validateTask --concurrency 32 --duration 30
+
+    # start the LLM stub and a backend pointed at it, run, tear both down
+    python loadtest.py --spawn --workers 4 --endpoints chat validateTask run_scheduler --concurrency 64
+
+Each of --concurrency virtual users loops over the selected endpoints until
+--duration seconds (or --requests in total) have elapsed. Reports p50/p95/p99
+latency, throughput and errors per endpoint.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from workload_gen import generate_preset, to_task_dicts
+
+NL_ENTRIES = [
+    "Write report 3hrs start 9am by 5pm tomorrow, call vendor 1hr before 12pm",
+    "Gym 2 hours anytime today and groceries 1hr by 8pm",
+    "Prepare slides 4hrs by friday high priority",
+    "Review PRs 2hrs start 10am, deploy 1hr same day by 6pm",
+]
+CHAT_PROMPTS = [
+    "Move the first task to 10am",
+    "Remove the last task and rearrange",
+    "How many tasks do I have tomorrow?",
+]
+
+
+class VirtualUser:
+    """Per-connection request builder (keeps its validateTask session)."""
+
+    def __init__(self, preset: str, num_tasks: int):
+        self.tasks = to_task_dicts(generate_preset(preset, num_tasks, seed=random.getrandbits(32)))
+        self.session_id: Optional[str] = None
+
+    def chat(self):
+        schedule = [{"task": t["taskName"], "start": t["arrivalTime"]["hrs"],
+                     "end": min(24, t["arrivalTime"]["hrs"] + t["duration"]), "date": t["arrivalTime"]["date"]}
+                    for t in self.tasks[:20]]
+        return "POST", "/api/chat", {"task_list": schedule, "user_prompt": random.choice(CHAT_PROMPTS)}
+
+    def validate_task(self):
+        body = {"nlTask": random.choice(NL_ENTRIES), "nlResponse": "", "warningMsg": "", "suggestionMsg": "",
+                "sessionId": self.session_id}
+        if self.session_id is None:
+            body["tasksSummaryMsg"] = []
+        return "POST", "/api/validateTask", body
+
+    def run_scheduler(self):
+        return "POST", "/api/run_scheduler", {"task_list": self.tasks, "algo": random.choice(["fcfs", "sjf", "srtf",
+                                                                                              "rr", "ps", "edf"]),
+                                              "tq": 2}
+
+    def ai_suggest(self):
+        return "POST", "/api/ai_suggest", {"task_list": self.tasks}
+
+    def import_tasks(self):
+        return "POST", "/api/importTasks", {"lines": random.sample(NL_ENTRIES, len(NL_ENTRIES))}
+
+    def after(self, endpoint: str, response: httpx.Response) -> None:
+        if endpoint == "validateTask" and response.status_code == 200:
+            self.session_id = response.json().get("sessionId", self.session_id)
+
+
+ENDPOINTS: Dict[str, Callable[[VirtualUser], tuple]] = {
+    "chat": VirtualUser.chat,
+    "validateTask": VirtualUser.validate_task,
+    "run_scheduler": VirtualUser.run_scheduler,
+    "ai_suggest": VirtualUser.ai_suggest,
+    "importTasks": VirtualUser.import_tasks,
+}
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return float("nan")
+    rank = max(0, min(len(sorted_values) - 1, int(round(q / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[rank]
+
+
+async def user_loop(client: httpx.AsyncClient, user: VirtualUser, endpoints: List[str], deadline: float,
+                    budget: Dict[str, int], results: Dict[str, Dict]) -> None:
+    while time.monotonic() < deadline and budget["remaining"] != 0:
+        if budget["remaining"] > 0:
+            budget["remaining"] -= 1
+        endpoint = random.choice(endpoints)
+        method, path, body = ENDPOINTS[endpoint](user)
+        stats = results[endpoint]
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body)
+            await response.aread()
+            elapsed = time.perf_counter() - start
+            if response.status_code >= 400:
+                stats["errors"][str(response.status_code)] = stats["errors"].get(str(response.status_code), 0) + 1
+            else:
+                stats["latencies"].append(elapsed)
+                user.after(endpoint, response)
+        except httpx.HTTPError as e:
+            stats["errors"][type(e).__name__] = stats["errors"].get(type(e).__name__, 0) + 1
+
+
+async def run_load(base_url: str, endpoints: List[str], concurrency: int, duration: float,
+                   total_requests: Optional[int], preset: str, num_tasks: int, timeout: float) -> Dict[str, Dict]:
+    results = {name: {"latencies": [], "errors": {}} for name in endpoints}
+    budget = {"remaining": total_requests if total_requests else -1}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        users = [VirtualUser(preset, num_tasks) for _ in range(concurrency)]
+        began = time.monotonic()
+        await asyncio.gather(*(user_loop(client, u, endpoints, began + duration, budget, results) for u in users))
+        wall = time.monotonic() - began
+    for stats in results.values():
+        stats["wall"] = wall
+    return results
+
+
+def report(results: Dict[str, Dict], concurrency: int) -> Dict[str, Dict]:
+    summary = {}
+    print(f"\nconcurrency {concurrency}")
+    print(f"{'endpoint':15s} {'ok':>7s} {'err':>6s} {'req/s':>9s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s}")
+    for name, stats in results.items():
+        latencies = sorted(stats["latencies"])
+        errors = sum(stats["errors"].values())
+        row = {
+            "ok": len(latencies),
+            "errors": stats["errors"],
+            "throughput": len(latencies) / stats["wall"] if stats["wall"] else 0.0,
+            "p50": percentile(latencies, 50) * 1e3,
+            "p95": percentile(latencies, 95) * 1e3,
+            "p99": percentile(latencies, 99) * 1e3,
+        }
+        summary[name] = row
+        print(f"{name:15s} {row['ok']:7d} {errors:6d} {row['throughput']:9.2f} "
+              f"{row['p50']:9.1f} {row['p95']:9.1f} {row['p99']:9.1f}"
+              + (f"  {stats['errors']}" if errors else ""))
+    return summary
+
+
+def wait_ready(url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(url, timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.25)
+    raise SystemExit(f"{url} did not come up within {timeout:.0f}s")
+
+
+def spawn_stack(backend_port: int, stub_port: int, workers: int) -> List[subprocess.Popen]:
+    """Start the LLM stub and a backend whose LLM URLs point at it."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    stub = subprocess.Popen([sys.executable, "-m", "uvicorn", "llm_stub:app", "--port", str(stub_port),
+                             "--log-level", "warning"], cwd=here)
+    env = dict(os.environ)
+    env["GROQ_API_URL"] = f"http://127.0.0.1:{stub_port}/openai/v1/chat/completions"
+    env["OLLAMA_API_URL"] = f"http://127.0.0.1:{stub_port}/api/generate"
+    env.setdefault("GROQ_API_KEY", "stub")
+    env.setdefault("STRUCTURED_LOGGING", "1")
+    env.setdefault("LOG_LEVEL", "WARNING")
+    backend = subprocess.Popen([sys.executable, "serve.py", "--port", str(backend_port), "--workers", str(workers)],
+                               cwd=here, env=env)
+    processes = [stub, backend]
+    try:
+        wait_ready(f"http://127.0.0.1:{stub_port}/docs")
+        wait_ready(f"http://127.0.0.1:{backend_port}/")
+    except SystemExit:
+        for p in processes:
+            p.terminate()
+        raise
+    return processes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTTP load test for the backend")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--endpoints", nargs="+", default=["chat", "validateTask"], choices=list(ENDPOINTS))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[16],
+                        help="one run per value, e.g. --concurrency 1 8 32")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per run")
+    parser.add_argument("--requests", type=int, default=None, help="stop after this many requests per run")
+    parser.add_argument("--preset", default="uniform", help="workload_gen preset for task payloads")
+    parser.add_argument("--tasks", type=int, default=50, help="tasks per payload")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--json", default=None, help="write the summary to this file")
+    parser.add_argument("--spawn", action="store_true", help="start llm_stub and serve.py locally")
+    parser.add_argument("--stub-port", type=int, default=8100)
+    parser.add_argument("--workers", type=int, default=2, help="backend workers with --spawn")
+    args = parser.parse_args()
+
+    processes = []
+    base_url = args.base_url
+    if args.spawn:
+        port = httpx.URL(base_url).port or 8000
+        processes = spawn_stack(port, args.stub_port, args.workers)
+    try:
+        summaries = {}
+        for concurrency in args.concurrency:
+            results = asyncio.run(run_load(base_url, args.endpoints, concurrency, args.duration, args.requests,
+                                           args.preset, args.tasks, args.timeout))
+            summaries[concurrency] = report(results, concurrency)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(summaries, f, indent=1)
+    finally:
+        for p in processes:
+            p.terminate()
+        for p in processes:
+            p.wait()
+
+
+if __name__ == "__main__":
+    main()
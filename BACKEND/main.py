@@ -1,15 +1,43 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Query, Request
+from pydantic import ValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from scheduler import schedule_tasks
-from ai_agent_claude import run_agentic_ai
-from llm_call import llm_call
-from synthetic_dataset_gen import extract_batch_features
-import pandas as pd
+from fastapi.responses import StreamingResponse, Response
+from responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from scheduler import critical_path_report, prepare_tasks, table_from_columns
+from work_calendar import WorkCalendar
+from scheduler_pool import scheduler_pool, SchedulerBusy
+from session_store import session_store, apply_delta, diff_tasks
+from storage import storage, to_epoch_hours
+from typing import Optional
+from inference import predict_suggestion
+from oracle import oracle_suggest
+from optimizer import optimizer_suggest
+from feasibility import admit_tasks, check_feasibility, summary_table
+from observability import TimedRoute, get_logger, metrics_response
 # from ai_agent import run_agentic_ai
-import json
-from xgboost import XGBClassifier, XGBRegressor
-from models import TaskRequest, SuggestionRequest, SchedulerRequest, RlFeedback, Chat_req
-app = FastAPI()
+# The LLM agents (ai_agent_claude, llm_call, bulk_import) are imported inside
+# their endpoints and the ML stack inside inference, so startup stays fast;
+# warm_up() loads them in the background once the server is accepting requests
+import os
+import threading
+import time
+from anyio import to_thread
+from models import (TaskRequest, SuggestionRequest, SchedulerRequest, RlFeedback, Chat_req, BulkImportRequest,
+                    Task, TaskListRequest, ScheduleCreateRequest, SchedulePage, ScheduleResult,
+                    SchedulerColumnsRequest, scheduler_columns_adapter, CriticalPathRequest,
+                    FeasibilityRequest, WhatIfRequest, MAX_IMPORT_LINE_CHARS, MAX_IMPORT_LINES, MAX_PAGE_SIZE)
+app = FastAPI(default_response_class=ORJSONResponse)
+app.router.route_class = TimedRoute
+log = get_logger("main")
+
+DEFAULT_PAGE_SIZE = 500
+
+# Size of the threadpool that runs the sync `def` endpoints (per worker process)
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "40"))
+
+# Import the LLM agents and load the XGBoost models right after startup (0 = on first use)
+BACKGROUND_WARMUP = os.getenv("BACKGROUND_WARMUP", "1") != "0"
 
 app.add_middleware(
     CORSMiddleware,
@@ -26,79 +54,387 @@ def root():
     return {"message": "Hello from FastAPI backend!"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return metrics_response()
+
+
 
 
 
 @app.post("/api/validateTask")
 def validate_task(request: TaskRequest):
-    # i/o----> nlp entry,warnings, suggestions, task summary, suggestion response by user
-    # o/p----> warningMsg, suggestionMsg, tasksSummaryMsg: demotaskssummary
+    # i/o----> nlp entry,warnings, suggestions, session id (+ optional delta), suggestion response by user
+    #          409 for a session id the server no longer has: resend with tasksSummaryMsg
+    # o/p----> warningMsg, suggestionMsg, sessionId, tasksDelta (+ full tasksSummaryMsg on first call / resync),
+    #          feasibility: can the complete tasks of the updated list still all meet their deadlines
     nl_entry = request.nlTask
     user_suggestion_response = request.nlResponse
     warnings = request.warningMsg
     suggestions = request.suggestionMsg
-    task_summary = str(request.tasksSummaryMsg)
-    print(type(request.tasksSummaryMsg))
-    print(task_summary)
-    updated_summary, warning_msg, suggestion_msg = run_agentic_ai(
+
+    session_id = request.sessionId
+    task_list = session_store.get(session_id) if session_id else None
+    full_sync = task_list is None
+    if full_sync:
+        if session_id and request.tasksSummaryMsg is None:
+            # Lost (expired, restarted) session and nothing to rebuild it from: the client resends its summary
+            raise HTTPException(status_code=409, detail="Unknown session")
+        # New or unknown session: seed it from the summary the client sent
+        session_id = session_id or session_store.new_session_id()
+        task_list = [t for t in (request.tasksSummaryMsg or []) if isinstance(t, dict)]
+    if request.tasksDelta is not None:
+        task_list = apply_delta(task_list, request.tasksDelta.model_dump())
+    log.info("Session %s: %d tasks", session_id, len(task_list))
+
+    from ai_agent_claude import run_agentic_ai
+    updated_list, warning_msg, suggestion_msg = run_agentic_ai(
         nl_entry,
         warnings,
         suggestions,
         user_suggestion_response,
-        task_summary
+        task_list
     )
-    task_summary = updated_summary
-    return {
+    session_store.put(session_id, updated_list)
+
+    response = {
             "warningMsg": warning_msg,
             "suggestionMsg": suggestion_msg,
-            "tasksSummaryMsg": json.loads(task_summary)
+            "sessionId": session_id,
+            "tasksDelta": diff_tasks(task_list, updated_list),
+            "feasibility": summary_feasibility(updated_list)
         }
+    if full_sync:
+        response["tasksSummaryMsg"] = updated_list
+    return ORJSONResponse(response)
+
+
+def summary_feasibility(task_list) -> Optional[dict]:
+    try:
+        return check_feasibility(summary_table(task_list))
+    except (ValueError, TypeError) as e:
+        log.warning("Feasibility check skipped: %s", e)
+        return None
+
+
+@app.delete("/api/session/{session_id}")
+def delete_session(session_id: str):
+    session_store.delete(session_id)
+    return {"success": True}
+
+
+def warm_up():
+    # i/p----> none
+    # o/p----> none; heavy modules and models are loaded for the first requests that need them
+    began = time.perf_counter()
+    import ai_agent_claude, llm_call, bulk_import, robustness  # noqa: F401
+    import inference
+    try:
+        inference.preload()
+    except Exception as e:
+        log.warning("Model warmup failed: %s", e)
+    log.info("Background warmup done in %.2fs", time.perf_counter() - began)
+
+
+@app.on_event("startup")
+def on_startup():
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    scheduler_pool.start()
+    if BACKGROUND_WARMUP:
+        threading.Thread(target=warm_up, name="warmup", daemon=True).start()
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+    session_store.flush()
+    scheduler_pool.shutdown()
+
+
+@app.post("/api/importTasks")
+def import_tasks_bulk(request: BulkImportRequest):
+    # i/p----> lines: list of nl entries and/or text: raw file contents
+    # o/p----> ndjson stream, one {"line", "input", "source", "tasks"} per line, then a {"done": true} summary
+    from bulk_import import stream_import_ndjson, split_import_text
+    lines = list(request.lines)
+    if request.text:
+        lines.extend(split_import_text(request.text))
+    if len(lines) > MAX_IMPORT_LINES:
+        raise HTTPException(status_code=422, detail=f"{len(lines)} lines is over the limit of {MAX_IMPORT_LINES}")
+    if any(len(line) > MAX_IMPORT_LINE_CHARS for line in lines):
+        raise HTTPException(status_code=422, detail=f"Lines are limited to {MAX_IMPORT_LINE_CHARS} characters")
+    return StreamingResponse(stream_import_ndjson(lines), media_type="application/x-ndjson")
 
 
 @app.post("/api/ai_suggest")
-def get_ai_suggestion(request: SuggestionRequest):
+async def get_ai_suggestion(request: SuggestionRequest):
+    # i/p----> task_list, mode ("model" | "oracle" | "optimize"), optional budget_ms
+    # o/p----> {algo, tq}; oracle mode adds mode, scores (every candidate) and the winning schedule,
+    #          or answers from the model with mode "model" when the search does not fit the budget;
+    #          optimize mode returns the best schedule local search finds within the budget, with
+    #          score, baselineScore (of algo / tq, where it started), iterations and elapsedMs
     task_list = request.task_list
-    print(task_list)
-    # print(type(task_list))
-    algo = "RR"
-    tq = 6
-    model = XGBClassifier()
-    model.load_model("xgb_model_algo.json")
-    features = extract_batch_features(task_list)
-    suggested_algo = model.predict(pd.DataFrame([features]))[0]
-    ALGOS = ["fcfs", "sjf", "srtf", "rr", "ps", "edf"]
-    algo = ALGOS[suggested_algo]
-    tq_regressor = XGBClassifier()
-    tq_regressor.load_model("xgb_model_tq.json")
-    if algo == "rr":
-        tq_pred = tq_regressor.predict(features)
-        tqs = [1,2,4,6]
-        tq_pred = tqs[tq_pred]
-    else:
-        tq_pred = 0  # not applicable
+    log.debug("ai_suggest mode=%s tasks: %s", request.mode, task_list)
+    if request.mode == "optimize":
+        try:
+            return ORJSONResponse(await optimizer_suggest(task_list, request.budget_ms))
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        except SchedulerBusy as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    if request.mode == "oracle":
+        try:
+            result = await oracle_suggest(task_list, request.budget_ms)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if result is not None:
+            return ORJSONResponse(result)
+    # Models are loaded once per process (preloaded before fork under serve.py)
+    suggestion = await run_in_threadpool(predict_suggestion, task_list)
+    return {**suggestion, "mode": "model"} if request.mode == "oracle" else suggestion
 
-    return {"algo": algo,
-            "tq": tq_pred
-            }
 
-
-@app.post("/api/run_scheduler")
-def running_scheduler(request: SchedulerRequest):
+@app.post("/api/run_scheduler", response_model=ScheduleResult)
+async def running_scheduler(request: SchedulerRequest, http_request: Request):
     task_list = request.task_list
     algo = request.algo
     tq = request.tq
-    print(task_list)
-    print(algo)
-    print(tq)
+    log.debug("run_scheduler algo=%s tq=%s tasks=%s", algo, tq, task_list)
+    return await run_schedule_request(task_list, request, http_request)
+
+
+@app.post("/api/run_scheduler/columns", response_model=ScheduleResult, openapi_extra={
+    "requestBody": {"content": {"application/json": {"schema": SchedulerColumnsRequest.model_json_schema()}},
+                    "required": True}
+})
+async def running_scheduler_columns(http_request: Request):
+    # i/p----> {"tasks": {"id": [...], "taskName": [...], "duration": [...], "arrivalDate": [...], "arrivalHrs": [...],
+    #           "deadlineDate": [...], "deadlineHrs": [...], "importance": [...],
+    #           optional "arrivalMins" / "deadlineMins": [...]}, "algo", "tq", ...}
+    # o/p----> same as /api/run_scheduler
+    # The body is validated in bulk and dates become epoch ticks once, then go straight to the engine
+    body = await http_request.body()
+    try:
+        request = scheduler_columns_adapter.validate_json(body)
+        columns = request.tasks
+        table = table_from_columns(columns.id, columns.taskName, columns.duration,
+                                   columns.arrivalDate, columns.arrivalHrs,
+                                   columns.deadlineDate, columns.deadlineHrs, columns.importance,
+                                   columns.arrivalMins, columns.deadlineMins, request.tick_minutes,
+                                   columns.dependsOn)
+    except ValidationError as e:
+        # include_input=False: json_invalid errors carry the raw body as bytes, which can't be serialized
+        raise HTTPException(status_code=422,
+                            detail=e.errors(include_url=False, include_context=False, include_input=False))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    log.debug("run_scheduler/columns algo=%s tq=%s tasks=%d", request.algo, request.tq, len(table))
+    return await run_schedule_request(table, request, http_request)
+
+
+def build_calendar(config) -> Optional[WorkCalendar]:
+    # CalendarConfig -> WorkCalendar; bad weekdays, hours or dates are the client's fault
+    if config is None:
+        return None
+    try:
+        return WorkCalendar.from_config(config.weekly_hours, config.holidays,
+                                        [(slot.date, slot.start, slot.end) for slot in config.blocked])
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid calendar: {e}")
+
+
+async def run_schedule_request(tasks, request, http_request: Request):
+    algo = request.algo
+    tq = request.tq
+    calendar = build_calendar(request.calendar)
+
+    # Large task lists run in the scheduler process pool; small ones inline on the threadpool
+    try:
+        schedule = await scheduler_pool.run(tasks, algo, tq, is_disconnected=http_request.is_disconnected,
+                                            workers=request.workers, calendar=calendar, tick=request.tick_minutes)
+    except SchedulerBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except ValueError as e:
+        # Unknown algorithm, bad dates or dependencies (unknown ids, cycles)
+        raise HTTPException(status_code=422, detail=str(e))
+    if schedule is None:
+        return Response(status_code=499)  # client closed the request
+    log.debug("schedule: %s", schedule)
+    windowed = request.from_date is not None or request.to_date is not None
+    if not windowed and (request.page_size is None or len(schedule) <= request.page_size):
+        # Segments are built by the scheduler itself, so they go straight to orjson
+        return ORJSONResponse(schedule)
 
-    schedule = schedule_tasks(task_list, algo, time_quantum=tq)
-    print(schedule)
+    # Large or windowed result: persist it and hand back the first page plus the date index
+    return ORJSONResponse(await run_in_threadpool(store_schedule_page, algo, tq, schedule, request))
+
+
+def store_schedule_page(algo: str, tq: int, schedule: list, request):
+    schedule_id = storage.save_schedule(algo, tq, schedule, request.workers)
+    # page_size is capped at MAX_PAGE_SIZE like the segments endpoint; the rest follows through nextCursor
+    limit = request.page_size or DEFAULT_PAGE_SIZE
+    segments, next_cursor = storage.segments_window(schedule_id, request.from_date, request.to_date, limit=limit)
+    return {
+        "scheduleId": schedule_id,
+        "dates": storage.segment_dates(schedule_id),
+        "segments": segments,
+        "nextCursor": next_cursor
+    }
+
+@app.post("/api/what_if")
+async def what_if_schedule(request: WhatIfRequest):
+    # i/p----> task_list, algo, tq, workers, calendar, tick_minutes, samples, sigma (lognormal spread), seed
+    # o/p----> {samples, sigma, plannedMakespan, makespan: {p50, p90, p95, p99}, expectedMisses,
+    #          tasks: [{id, missProbability}]} of the schedule replayed under random durations
+    from robustness import what_if
+    calendar = build_calendar(request.calendar)
+    try:
+        return await what_if(request.task_list, request.algo, request.tq, request.workers, calendar,
+                             request.tick_minutes, request.samples, request.sigma, request.seed)
+    except SchedulerBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@app.post("/api/critical_path")
+def critical_path(request: CriticalPathRequest):
+    # i/p----> task_list (with dependsOn), optional tick_minutes
+    # o/p----> {criticalPath: [ids], length, finish: {date, hrs}, slack: [{id, earliestStart, latestStart, slack}]}
+    #          for unlimited workers; 422 on unknown dependencies or cycles
+    try:
+        table = prepare_tasks(request.task_list, request.tick_minutes)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return critical_path_report(table)
+
+
+@app.post("/api/feasibility")
+def feasibility(request: FeasibilityRequest):
+    # i/p----> task_list, optional candidates (new tasks, admitted in order), calendar, tick_minutes
+    # o/p----> {feasible, extraHours, firstViolation: null | {id, finish, deadline, lateHours}} for one person
+    #          (task_list plus the admitted candidates), with candidates also {admitted: [ids], rejected: [ids]}
+    try:
+        table = prepare_tasks(request.task_list + request.candidates, request.tick_minutes)
+        calendar = build_calendar(request.calendar)
+        if request.candidates:
+            return admit_tasks(table, len(request.task_list), calendar)
+        return check_feasibility(table, calendar)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@app.post("/api/tasks")
+def create_tasks(request: TaskListRequest):
+    count = storage.upsert_tasks(request.task_list)
+    return {"success": True, "count": count}
+
+
+@app.get("/api/tasks")
+def list_stored_tasks(limit: int = 100, offset: int = 0,
+                      from_date: Optional[str] = None, to_date: Optional[str] = None,
+                      due_within_hours: Optional[int] = None):
+    # from_date / to_date filter on arrival date; due_within_hours on deadline from now
+    if due_within_hours is not None:
+        return storage.tasks_due_within(due_within_hours)
+    try:
+        arrival_from = to_epoch_hours(from_date, 0) if from_date else None
+        arrival_to = to_epoch_hours(to_date, 23) if to_date else None
+    except ValueError:
+        raise HTTPException(status_code=422, detail="from_date / to_date must be YYYY-MM-DD")
+    return storage.list_tasks(limit, offset, arrival_from=arrival_from, arrival_to=arrival_to)
+
+
+@app.get("/api/tasks/{task_id}")
+def get_stored_task(task_id: int):
+    task = storage.get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
+
+
+@app.put("/api/tasks/{task_id}")
+def update_stored_task(task_id: int, task: Task):
+    task.id = task_id
+    storage.upsert_tasks([task])
+    return storage.get_task(task_id)
+
+
+@app.delete("/api/tasks/{task_id}")
+def delete_stored_task(task_id: int):
+    if not storage.delete_task(task_id):
+        raise HTTPException(status_code=404, detail="Task not found")
+    return {"success": True}
+
+
+@app.post("/api/schedules")
+async def create_schedule(request: ScheduleCreateRequest, http_request: Request):
+    # Runs the scheduler (on the given or stored tasks) and persists the segments
+    if request.task_list is not None:
+        task_list = request.task_list
+    else:
+        stored = await run_in_threadpool(storage.list_tasks, limit=-1)
+        task_list = [Task(**t) for t in stored]
+    calendar = build_calendar(request.calendar)
+    # Same path as /api/run_scheduler: large lists go to the process pool
+    try:
+        schedule = await scheduler_pool.run(task_list, request.algo, request.tq,
+                                            is_disconnected=http_request.is_disconnected,
+                                            workers=request.workers, calendar=calendar, tick=request.tick_minutes)
+    except SchedulerBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except ValueError as e:
+        # Unknown algorithm, bad dates or dependencies (unknown ids, cycles)
+        raise HTTPException(status_code=422, detail=str(e))
+    if schedule is None:
+        return Response(status_code=499)  # client closed the request
+    schedule_id = await run_in_threadpool(storage.save_schedule, request.algo, request.tq, schedule, request.workers)
+    return await run_in_threadpool(storage.get_schedule, schedule_id)
+
+
+@app.get("/api/schedules/{schedule_id}")
+def get_stored_schedule(schedule_id: int):
+    schedule = storage.get_schedule(schedule_id)
+    if schedule is None:
+        raise HTTPException(status_code=404, detail="Schedule not found")
     return schedule
 
+
+@app.get("/api/schedules/{schedule_id}/dates")
+def get_schedule_dates(schedule_id: int):
+    if not storage.has_schedule(schedule_id):
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    return storage.segment_dates(schedule_id)
+
+
+@app.get("/api/schedules/{schedule_id}/segments", response_model=SchedulePage)
+def get_schedule_segments(schedule_id: int, date: Optional[str] = None,
+                          from_date: Optional[str] = None, to_date: Optional[str] = None,
+                          cursor: Optional[str] = None,
+                          limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)):
+    # Unknown or pruned id: fail loudly rather than look like an empty day
+    if not storage.has_schedule(schedule_id):
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    # date is shorthand for from_date == to_date
+    if date is not None:
+        from_date = to_date = date
+    try:
+        segments, next_cursor = storage.segments_window(schedule_id, from_date, to_date, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return ORJSONResponse({"segments": segments, "nextCursor": next_cursor})
+
+
+@app.delete("/api/schedules/{schedule_id}")
+def delete_stored_schedule(schedule_id: int):
+    if not storage.delete_schedule(schedule_id):
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    return {"success": True}
+
+
 @app.post("/api/rl_feedback")
 def getting_feedback(request: RlFeedback):
     choice = request.choice     # manual  |  AI
-    print(choice)
+    log.info("rl feedback: %s", choice)
     return {"success": True}
 
 
@@ -106,11 +442,11 @@ def getting_feedback(request: RlFeedback):
 def chat_with_bot(request: Chat_req):
     user_msg = request.user_prompt
     task_list = request.task_list
-    print(user_msg)
-    print(task_list)
+    log.debug("chat message=%s tasks=%s", user_msg, task_list)
 
+    from llm_call import llm_call
     schedule_list, res = llm_call(user_msg, task_list)
 
-    return {"chat_response": res,
-            "task_list": schedule_list
-            }
\ No newline at end of file
+    return ORJSONResponse({"chat_response": res,
+                           "task_list": schedule_list
+                           })
\ No newline at end of file
@@ -1,37 +1,190 @@
-from pydantic import BaseModel
-from typing import List
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter, model_validator
+from datetime import date
+from typing import Annotated, Dict, List, Literal, Optional, Tuple, Union
+
+
+class TaskDelta(BaseModel):
+    truncate: int  # keep the first `truncate` tasks of the session summary
+    append: List[dict] = []
+
+
 class TaskRequest(BaseModel):
     nlTask: str
     nlResponse: str
     warningMsg: str
     suggestionMsg: str
-    tasksSummaryMsg: List
+    tasksSummaryMsg: Optional[List] = None  # full summary, only for clients without a session
+    sessionId: Optional[str] = None
+    tasksDelta: Optional[TaskDelta] = None  # client-side edits to the session summary
+
+
+# One bulk import is at most this many entries (lines plus the lines of text), each up to MAX_IMPORT_LINE_CHARS
+MAX_IMPORT_LINES = 5000
+MAX_IMPORT_LINE_CHARS = 2000
+
+
+class BulkImportRequest(BaseModel):
+    lines: List[Annotated[str, Field(max_length=MAX_IMPORT_LINE_CHARS)]] = Field([], max_length=MAX_IMPORT_LINES)
+    # raw file contents, one NL task entry per line
+    text: str = Field("", max_length=MAX_IMPORT_LINES * MAX_IMPORT_LINE_CHARS)
+
+
+def _check_tick(minutes: int) -> int:
+    if minutes < 1 or 60 % minutes:
+        raise ValueError("tick_minutes must be a whole divisor of 60 (1, 2, 3, 4, 5, 6, 10, 12, 15, 20, 30 or 60)")
+    return minutes
+
+
+# Scheduler resolution in minutes; 60 = whole hours
+TickMinutes = Annotated[int, AfterValidator(_check_tick)]
+# Hours, fractional at sub-hour resolution (1.5 = 1h30, 9.25 = 9:15)
+Hours = Union[int, float]
+
+
+def _check_date(value: str) -> str:
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        raise ValueError("must be a YYYY-MM-DD date")
+    return value
+
+
+# YYYY-MM-DD schedule window bound
+IsoDate = Annotated[str, AfterValidator(_check_date)]
+
+# Largest page of segments one response carries (the rest follows through nextCursor)
+MAX_PAGE_SIZE = 5000
 
 
 class ArrivalTime(BaseModel):
     hrs: int
     date: str  # you can later convert this to datetime.date if needed
+    mins: int = Field(0, ge=0, lt=60)
 
 class DeadlineTime(BaseModel):
     hrs: int
     date: str  # you can later convert this to datetime.date if needed
+    mins: int = Field(0, ge=0, lt=60)
 
 class Task(BaseModel):
     id: int
     taskName: str
-    duration: int
+    duration: Hours
     arrivalTime: ArrivalTime
     deadlineTime: DeadlineTime
     importance: str
+    dependsOn: List[int] = []  # ids of tasks that must finish before this one starts
+
+class BlockedSlot(BaseModel):
+    date: str  # YYYY-MM-DD
+    start: int  # hours [start, end) of that day
+    end: int
+
+
+class CalendarConfig(BaseModel):
+    # {"mon": [[9, 12], [13, 17]], ...}; days left out are off. None -> Monday-Friday 9-17
+    weekly_hours: Optional[Dict[str, List[Tuple[int, int]]]] = None
+    holidays: List[str] = []  # YYYY-MM-DD
+    blocked: List[BlockedSlot] = []
 
 class SuggestionRequest(BaseModel):
     task_list: List[Task]
+    # oracle: simulate every algorithm and return the best; optimize: improve on the best by local search
+    mode: Literal["model", "oracle", "optimize"] = "model"
+    # oracle latency budget before falling back to the model / optimizer budget; capped so one
+    # request can't hold a worker (an abandoned request keeps running until its budget is spent)
+    budget_ms: Optional[float] = Field(None, gt=0, le=10_000)
+
+
+class TaskListRequest(BaseModel):
+    task_list: List[Task]
+
+
+class CriticalPathRequest(BaseModel):
+    task_list: List[Task]
+    tick_minutes: TickMinutes = 60
+
+
+class FeasibilityRequest(BaseModel):
+    task_list: List[Task]
+    candidates: List[Task] = []  # new tasks to admit in order while the whole set stays feasible
+    calendar: Optional[CalendarConfig] = None
+    tick_minutes: TickMinutes = 60
+
+
+class ScheduleCreateRequest(BaseModel):
+    algo: str
+    tq: Hours
+    workers: int = Field(1, ge=1)  # people working the backlog in parallel
+    calendar: Optional[CalendarConfig] = None  # working hours; None -> round the clock
+    tick_minutes: TickMinutes = 60  # simulation resolution; durations / arrivals round to whole ticks
+    task_list: Optional[List[Task]] = None  # None -> schedule the stored tasks
 
 
 class SchedulerRequest(BaseModel):
     task_list: List[Task]
     algo: str
-    tq: int
+    tq: Hours
+    workers: int = Field(1, ge=1)  # people working the backlog in parallel; segments get a "worker" (1..workers)
+    calendar: Optional[CalendarConfig] = None  # only schedule within these working hours
+    tick_minutes: TickMinutes = 60  # < 60 gives fractional segment start / end
+    from_date: Optional[IsoDate] = None  # YYYY-MM-DD window, returns a paged handle
+    to_date: Optional[IsoDate] = None
+    # return a paged handle when the schedule is larger than this
+    page_size: Optional[int] = Field(None, ge=1, le=MAX_PAGE_SIZE)
+
+
+class WhatIfRequest(BaseModel):
+    task_list: List[Task]
+    algo: str
+    tq: Hours
+    workers: int = Field(1, ge=1)
+    calendar: Optional[CalendarConfig] = None
+    tick_minutes: TickMinutes = 60
+    samples: int = Field(1000, ge=1)  # duration draws per task
+    sigma: float = Field(0.25, gt=0, le=3)  # log-space spread of the lognormal duration factor
+    seed: Optional[int] = None
+
+
+class TaskColumns(BaseModel):
+    # Columnar task list: one array per Task field, all the same length
+    id: List[int]
+    taskName: List[str]
+    duration: List[Hours]
+    arrivalDate: List[str]
+    arrivalHrs: List[int]
+    deadlineDate: List[str]
+    deadlineHrs: List[int]
+    importance: List[str]
+    arrivalMins: Optional[List[int]] = None
+    deadlineMins: Optional[List[int]] = None
+    dependsOn: Optional[List[List[int]]] = None
+
+    @model_validator(mode="after")
+    def check_lengths(self):
+        lengths = {len(column) for column in (self.id, self.taskName, self.duration, self.arrivalDate,
+                                              self.arrivalHrs, self.deadlineDate, self.deadlineHrs,
+                                              self.importance, self.arrivalMins or self.id,
+                                              self.deadlineMins or self.id, self.dependsOn or self.id)}
+        if len(lengths) > 1:
+            raise ValueError("all task columns must have the same length")
+        return self
+
+
+class SchedulerColumnsRequest(BaseModel):
+    tasks: TaskColumns
+    algo: str
+    tq: Hours
+    workers: int = Field(1, ge=1)
+    calendar: Optional[CalendarConfig] = None
+    tick_minutes: TickMinutes = 60
+    from_date: Optional[IsoDate] = None
+    to_date: Optional[IsoDate] = None
+    page_size: Optional[int] = Field(None, ge=1, le=MAX_PAGE_SIZE)
+
+
+# Validates a raw JSON body in one pass (no per-task model objects)
+scheduler_columns_adapter = TypeAdapter(SchedulerColumnsRequest)
 
 
 class RlFeedback(BaseModel):
@@ -39,9 +192,30 @@ class RlFeedback(BaseModel):
 
 class TaskItem(BaseModel):
     task: str
-    start: int
-    end: int
+    start: Hours
+    end: Hours
     date: str
 class Chat_req(BaseModel):
     task_list: List[TaskItem]
-    user_prompt: str
\ No newline at end of file
+    user_prompt: str
+
+
+class ScheduleSegment(BaseModel):
+    task: str
+    start: Hours
+    end: Hours
+    date: str
+    worker: Optional[int] = None  # only for multi-worker schedules
+
+
+class SchedulePage(BaseModel):
+    segments: List[ScheduleSegment]
+    nextCursor: Optional[str] = None
+
+
+class ScheduleHandle(SchedulePage):
+    scheduleId: int
+    dates: List[dict]  # [{"date", "count"}]
+
+
+ScheduleResult = Union[List[ScheduleSegment], ScheduleHandle]
@@ -0,0 +1,201 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import random
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+try:
+    from prometheus_client import (CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram,
+                                   generate_latest, multiprocess)
+    PROMETHEUS_AVAILABLE = True
+except ImportError:  # metrics are optional; spans still feed the logs
+    PROMETHEUS_AVAILABLE = False
+
+# Logging configuration (override through environment variables)
+STRUCTURED_LOGGING = os.getenv("STRUCTURED_LOGGING", "0") == "1"  # 0 keeps the plain print() output
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "0.01"))  # share of DEBUG payload logs kept
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+if STRUCTURED_LOGGING:
+    logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+
+if PROMETHEUS_AVAILABLE:
+    REQUEST_SECONDS = Histogram("http_request_duration_seconds", "End-to-end request latency",
+                                ["method", "route", "status"], buckets=LATENCY_BUCKETS)
+    STAGE_SECONDS = Histogram("stage_duration_seconds", "Latency of one request stage",
+                              ["stage"], buckets=LATENCY_BUCKETS)
+    LLM_SECONDS = Histogram("llm_call_duration_seconds", "LLM API call latency",
+                            ["provider", "model", "outcome"], buckets=LATENCY_BUCKETS)
+    LLM_TOKENS = Counter("llm_tokens_total", "Tokens used by LLM calls", ["provider", "model", "kind"])
+
+# Per-request stage timings, shared with threadpool workers through the copied context
+_request_stages: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "request_stages", default=None
+)
+
+
+class SampledLogger:
+    """
+    Leveled logger that replaces the debugging print() calls.
+
+    With STRUCTURED_LOGGING off it prints exactly as before. With it on,
+    messages go through `logging`; DEBUG messages (which carry whole task
+    lists, prompts and schedules) are additionally sampled at LOG_SAMPLE_RATE
+    and only formatted when they are actually emitted.
+    """
+
+    def __init__(self, name: str):
+        self.logger = logging.getLogger(name)
+
+    def _log(self, level: int, msg: str, args: tuple) -> None:
+        if not STRUCTURED_LOGGING:
+            print(msg % args if args else msg)
+            return
+        if not self.logger.isEnabledFor(level):
+            return
+        if level <= logging.DEBUG and random.random() >= LOG_SAMPLE_RATE:
+            return
+        self.logger.log(level, msg, *args)
+
+    def debug(self, msg: str, *args) -> None:
+        self._log(logging.DEBUG, msg, args)
+
+    def info(self, msg: str, *args) -> None:
+        self._log(logging.INFO, msg, args)
+
+    def warning(self, msg: str, *args) -> None:
+        self._log(logging.WARNING, msg, args)
+
+    def error(self, msg: str, *args) -> None:
+        self._log(logging.ERROR, msg, args)
+
+
+def get_logger(name: str) -> SampledLogger:
+    return SampledLogger(name)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    if PROMETHEUS_AVAILABLE:
+        STAGE_SECONDS.labels(stage).observe(seconds)
+    stages = _request_stages.get()
+    if stages is not None:
+        stages[stage] = stages.get(stage, 0.0) + seconds
+
+
+@contextmanager
+def span(stage: str):
+    """Time a block and record it as `stage` (histogram + current request's breakdown)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+
+def record_llm_call(provider: str, model: str, seconds: float, outcome: str,
+                    usage: Optional[Dict] = None) -> None:
+    """
+    Record one LLM API call.
+
+    Args:
+        provider: "groq" or "ollama"
+        model: Model name sent in the request
+        seconds: Wall time of the HTTP call
+        outcome: "ok", "error" or "timeout"
+        usage: Token usage from the response ({"prompt_tokens", "completion_tokens"})
+    """
+    observe_stage("llm_call", seconds)
+    if not PROMETHEUS_AVAILABLE:
+        return
+    LLM_SECONDS.labels(provider, model, outcome).observe(seconds)
+    for kind in ("prompt_tokens", "completion_tokens"):
+        count = (usage or {}).get(kind)
+        if count:
+            LLM_TOKENS.labels(provider, model, kind.split("_")[0]).inc(count)
+
+
+def _timed_endpoint(endpoint: Callable) -> Callable:
+    # Marks when the endpoint body starts and ends so the route can split the
+    # remaining time into request parsing (before) and response encoding (after)
+    if asyncio.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def timed(*args, **kwargs):
+            stages = _request_stages.get()
+            if stages is not None:
+                stages["_handler_start"] = time.perf_counter()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                if stages is not None:
+                    stages["_handler_end"] = time.perf_counter()
+    else:
+        @functools.wraps(endpoint)
+        def timed(*args, **kwargs):
+            stages = _request_stages.get()
+            if stages is not None:
+                stages["_handler_start"] = time.perf_counter()
+            try:
+                return endpoint(*args, **kwargs)
+            finally:
+                if stages is not None:
+                    stages["_handler_end"] = time.perf_counter()
+    return timed
+
+
+class TimedRoute(APIRoute):
+    """
+    APIRoute recording request latency plus parse / handler / encode stages.
+
+    "parse" covers body reading and pydantic validation, "handler" the
+    endpoint function and "encode" response serialization.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        route_path = self.path
+
+        async def timed_handler(request: Request) -> Response:
+            stages: Dict[str, float] = {}
+            token = _request_stages.set(stages)
+            start = time.perf_counter()
+            status = 500
+            try:
+                response = await handler(request)
+                status = response.status_code
+                return response
+            finally:
+                end = time.perf_counter()
+                _request_stages.reset(token)
+                handler_start = stages.pop("_handler_start", None)
+                handler_end = stages.pop("_handler_end", None)
+                if handler_start is not None and handler_end is not None:
+                    observe_stage("parse", handler_start - start)
+                    observe_stage("handler", handler_end - handler_start)
+                    observe_stage("encode", end - handler_end)
+                if PROMETHEUS_AVAILABLE:
+                    REQUEST_SECONDS.labels(request.method, route_path, str(status)).observe(end - start)
+
+        return timed_handler
+
+
+def metrics_response() -> Response:
+    """Prometheus exposition of this process (or all workers in multiprocess mode)."""
+    if not PROMETHEUS_AVAILABLE:
+        return Response("prometheus_client is not installed\n", status_code=501, media_type="text/plain")
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
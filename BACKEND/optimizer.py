@@ -0,0 +1,386 @@
+"""
+Anytime schedule optimizer for the score_schedule objective.
+
+The fixed policies each follow one rule, and under the composite score
+(turnaround, waiting, deadlines met, importance-weighted completion) the
+best of them usually leaves something on the table. ScheduleOptimizer
+starts from the best-scoring oracle candidate and improves it by simulated
+annealing over task orderings: an ordering is run back to back, one task
+at a time, each starting as soon as it has arrived and the previous one
+is done.
+
+A move (swap two tasks, or move one to another position, at most
+MOVE_WINDOW apart) only changes finish times from its first position
+onwards, and usually only within its window: past it the old timeline
+resumes unless the move opened or closed idle time. Turnaround and waiting
+depend on the finish times only through their sum, so a move is scored
+from the positions it touches (delta-scoring) rather than the whole
+schedule; one that would shift more than TAIL_LIMIT positions after it is
+skipped, which bounds the cost of every step. The search stops when its
+wall-clock budget runs out; result() gives the best schedule found so far
+at any point, never worse than the starting policy.
+"""
+import math
+import os
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from starlette.concurrency import run_in_threadpool
+
+from observability import get_logger, span
+from oracle import CANDIDATES, score_runs
+from scheduler import TaskTable, prepare_tasks, render_runs, schedule_runs, schedule_table
+from scheduler_pool import scheduler_pool
+from task_graph import topological_order
+
+OPTIMIZER_BUDGET_MS = float(os.getenv("OPTIMIZER_BUDGET_MS", "500"))
+MOVE_WINDOW = 32  # positions between the two ends of a move
+TAIL_LIMIT = 128  # positions past a move it may shift before the move is skipped
+CHECK_EVERY = 256  # iterations between clock reads / temperature updates
+
+log = get_logger("optimizer")
+
+
+class ScheduleOptimizer:
+    """
+    Simulated annealing over the order one worker does the tasks in.
+
+    Zero-duration tasks leave no runs, so score_schedule counts them as never
+    scheduled whatever the order; they stay out of the ordering (a dependency
+    through one becomes a dependency on its predecessors, and its arrival
+    holds back its successors).
+
+    Attributes:
+        baseline: (algo, tq) of the best fixed policy, the starting point
+        baseline_score: Its score_runs score
+        iterations / accepted: Moves tried / taken so far
+        trace: (elapsed ms, best score so far) every time the best improved
+    """
+
+    def __init__(self, table: TaskTable, seed: Optional[int] = None):
+        self.table = table
+        self.rng = random.Random(seed)
+        self.iterations = 0
+        self.accepted = 0
+        self.elapsed = 0.0
+        n = len(table)
+        durations = table.durations
+
+        candidate_runs = [schedule_runs(table, algo, tq) for algo, tq in CANDIDATES]
+        scores = [score_runs(table, runs) for runs in candidate_runs]
+        best = max(range(len(CANDIDATES)), key=lambda i: (scores[i], -i))
+        self.baseline = CANDIDATES[best]
+        self.baseline_score = scores[best]
+        self.trace: List[Tuple[float, float]] = [(0.0, self.baseline_score)]
+
+        self.releases = list(table.arrivals)
+        self.preds: List[List[int]] = [[] for _ in range(n)]
+        self.succs: List[List[int]] = [[] for _ in range(n)]
+        if table.depends is not None:
+            self._fold_milestones()
+        self.zero = sum(1 for d in durations if d == 0)
+        self.weights = [4 - p for p in table.priorities]
+        self.hours = table.tick / 60
+        self.sum_arrivals = sum(table.arrivals[i] for i in range(n) if durations[i])
+        self.sum_durations = sum(durations)
+
+        # Start from the policy whose completion order (valid for dependencies: predecessors
+        # finish first) scores best when run back to back
+        rank = [0] * n
+        for r, i in enumerate(topological_order(table.depends) if table.depends is not None else range(n)):
+            rank[i] = r
+        start = None
+        for runs in candidate_runs:
+            finish = [0] * n
+            for idx, _, end in runs:
+                if end > finish[idx]:
+                    finish[idx] = end
+            perm = sorted((i for i in range(n) if durations[i]), key=lambda i: (finish[i], rank[i]))
+            decoded = self._decode(perm)
+            if start is None or decoded[-1] > start[1][-1]:
+                start = perm, decoded
+        self._load(*start)
+        self.pos = [0] * n
+        for k, idx in enumerate(self.perm):
+            self.pos[idx] = k
+        self.best_perm = self.perm[:]
+        self.best_raw = self.raw
+        self.at_best = True
+        self.temperature: Optional[float] = None
+
+    def _fold_milestones(self) -> None:
+        # Dependencies between tasks with work, bridging zero-duration ones
+        table = self.table
+        durations = table.durations
+        through: List[List[int]] = [[] for _ in range(len(table))]  # positive predecessors, via milestones
+        for i in topological_order(table.depends):
+            preds = set()
+            for p in table.depends[i]:
+                if durations[p]:
+                    preds.add(p)
+                else:
+                    preds.update(through[p])
+                    if self.releases[p] > self.releases[i]:
+                        self.releases[i] = self.releases[p]
+            through[i] = sorted(preds)
+            if durations[i]:
+                self.preds[i] = through[i]
+                for p in through[i]:
+                    self.succs[p].append(i)
+
+    def _raw(self, sum_end: int, met: int, importance: float, first: int, last: int) -> float:
+        # score_runs before clipping to [0, 1]; zero-duration tasks carry its "never scheduled" penalty
+        n = len(self.table)
+        span_ticks = (last - first) or 1
+        turnaround = sum_end - self.sum_arrivals + 2 * span_ticks * self.zero
+        waiting = turnaround - self.sum_durations
+        return (0.25 * (1 - turnaround / n / span_ticks) +
+                0.25 * (1 - waiting / n / span_ticks) +
+                0.30 * met / n +
+                0.20 * importance / n)
+
+    def _decode(self, perm: List[int]) -> tuple:
+        """Finish times and score terms of every position of an ordering, and its totals."""
+        releases, durations, deadlines = self.releases, self.table.durations, self.table.deadlines
+        weights, hours = self.weights, self.hours
+        end_at = [0] * len(perm)
+        met_at = [False] * len(perm)
+        imp_at = [0.0] * len(perm)
+        if not perm:
+            return end_at, met_at, imp_at, 0, 0, 0, 0, 0.0, 0.0  # nothing runs: score_runs gives 0
+        first = t = releases[perm[0]]
+        for k, idx in enumerate(perm):
+            if releases[idx] > t:
+                t = releases[idx]
+            t += durations[idx]
+            end_at[k] = t
+            met_at[k] = t <= deadlines[idx]
+            imp_at[k] = weights[idx] / ((t - first) * hours + 1e-5)
+        sum_end, met, importance = sum(end_at), sum(met_at), sum(imp_at)
+        return (end_at, met_at, imp_at, first, t, sum_end, met, importance,
+                self._raw(sum_end, met, importance, first, t))
+
+    def _load(self, perm: List[int], decoded: tuple) -> None:
+        self.perm = perm
+        (self.end_at, self.met_at, self.imp_at, self.first, self.last,
+         self.sum_end, self.met, self.importance, self.raw) = decoded
+
+    def _propose(self) -> Optional[Tuple[int, int, List[int]]]:
+        """A random valid move: (first position, last position, new order of that window)."""
+        perm, pos = self.perm, self.pos
+        n = len(perm)
+        i = self.rng.randrange(n - 1)
+        j = min(n - 1, i + self.rng.randint(1, MOVE_WINDOW))
+        kind = self.rng.randrange(3)
+        a, b = perm[i], perm[j]
+        if kind != 2 and any(i < pos[s] <= j for s in self.succs[a]):
+            return None  # a can't move past one of its successors
+        if kind != 1 and any(i <= pos[p] < j for p in self.preds[b]):
+            return None  # b can't move before one of its predecessors
+        if kind == 0:
+            window = [b, *perm[i + 1:j], a]  # swap
+        elif kind == 1:
+            window = [*perm[i + 1:j + 1], a]  # a moves to j
+        else:
+            window = [b, *perm[i:j]]  # b moves to i
+        return i, j, window
+
+    def _evaluate(self, i: int, j: int, window: List[int]) -> Optional[Tuple[float, int, list]]:
+        """
+        Score of the ordering with positions i..j replaced by window, recomputing
+        only from i until the new timeline meets the old one again.
+
+        Returns:
+            (raw score, positions recomputed, their new terms and the total deltas),
+            or None if the move shifts more than TAIL_LIMIT positions past j
+        """
+        perm, end_at, met_at, imp_at = self.perm, self.end_at, self.met_at, self.imp_at
+        releases, durations, deadlines = self.releases, self.table.durations, self.table.deadlines
+        weights, hours, first = self.weights, self.hours, self.first
+        n = len(perm)
+        limit = min(n, j + 1 + TAIL_LIMIT)
+        t = end_at[i - 1]
+        ends, mets, imps = [], [], []
+        d_end = d_met = 0
+        d_imp = 0.0
+        k = i
+        while k < n:
+            idx = window[k - i] if k <= j else perm[k]
+            if releases[idx] > t:
+                t = releases[idx]
+            t += durations[idx]
+            if k > j and t == end_at[k]:
+                break  # back on the old timeline: nothing further changes
+            met = t <= deadlines[idx]
+            imp = weights[idx] / ((t - first) * hours + 1e-5)
+            ends.append(t)
+            mets.append(met)
+            imps.append(imp)
+            d_end += t - end_at[k]
+            d_met += met - met_at[k]
+            d_imp += imp - imp_at[k]
+            k += 1
+            if k == limit and k < n:
+                return None
+        last = t if k == n else self.last
+        raw = self._raw(self.sum_end + d_end, self.met + d_met, self.importance + d_imp, first, last)
+        return raw, k - i, [ends, mets, imps, d_end, d_met, d_imp, last]
+
+    def _apply(self, i: int, j: int, window: List[int], raw: float, changed: int, update: list) -> None:
+        if self.at_best and raw <= self.best_raw:
+            self.best_perm = self.perm[:]  # leaving the best ordering: keep a copy
+            self.at_best = False
+        perm, pos = self.perm, self.pos
+        perm[i:j + 1] = window
+        for k in range(i, j + 1):
+            pos[perm[k]] = k
+        ends, mets, imps, d_end, d_met, d_imp, last = update
+        self.end_at[i:i + changed] = ends
+        self.met_at[i:i + changed] = mets
+        self.imp_at[i:i + changed] = imps
+        self.sum_end += d_end
+        self.met += d_met
+        self.importance += d_imp
+        self.last = last
+        self.raw = raw
+        if raw > self.best_raw:
+            self.best_raw = raw
+            self.at_best = True
+
+    def _step(self) -> None:
+        self.iterations += 1
+        move = self._propose()
+        if move is None:
+            return
+        i, j, window = move
+        if i == 0:
+            # The first task sets the start every importance term is measured from: rescore everything
+            perm = [*window, *self.perm[j + 1:]]
+            decoded = self._decode(perm)
+            if self._accept(decoded[-1] - self.raw):
+                if self.at_best and decoded[-1] <= self.best_raw:
+                    self.best_perm, self.at_best = self.perm, False
+                self._load(perm, decoded)
+                for k in range(j + 1):
+                    self.pos[perm[k]] = k
+                if self.raw > self.best_raw:
+                    self.best_raw, self.at_best = self.raw, True
+                self.accepted += 1
+            return
+        evaluated = self._evaluate(i, j, window)
+        if evaluated is not None and self._accept(evaluated[0] - self.raw):
+            self._apply(i, j, window, *evaluated)
+            self.accepted += 1
+
+    def _accept(self, delta: float) -> bool:
+        return delta >= 0 or self.rng.random() < math.exp(delta / self.temperature)
+
+    def _calibrate(self) -> float:
+        # Starting temperature: an average worsening move is accepted one time in ten
+        worse = []
+        for _ in range(200):
+            move = self._propose()
+            evaluated = None if move is None or move[0] == 0 else self._evaluate(*move)
+            if evaluated is not None and evaluated[0] < self.raw:
+                worse.append(self.raw - evaluated[0])
+        return (sum(worse) / len(worse) if worse else 1e-9) / math.log(10)
+
+    def run(self, budget_ms: float) -> "ScheduleOptimizer":
+        """
+        Anneal for up to budget_ms milliseconds, cooling from the start temperature
+        to 1/1000 of it. Calling it again runs another pass from the best-so-far
+        state's neighbourhood (the current ordering), keeping the best found.
+        """
+        if len(self.perm) < 2:
+            return self
+        began = time.perf_counter()
+        budget = budget_ms / 1000
+        if self.temperature is None:
+            self.temperature = self.start_temperature = self._calibrate()
+        start_temperature = self.start_temperature
+        best = self.trace[-1][1]
+        while True:
+            elapsed = time.perf_counter() - began
+            if elapsed >= budget:
+                break
+            # Geometric cooling over the budget, down to 1/1000 of the start
+            self.temperature = start_temperature * 1e-3 ** (elapsed / budget)
+            for _ in range(CHECK_EVERY):
+                self._step()
+            if min(1.0, self.best_raw) > best:
+                best = min(1.0, self.best_raw)
+                self.trace.append(((self.elapsed + elapsed) * 1000, best))
+        self.elapsed += time.perf_counter() - began
+        return self
+
+    def best_runs(self) -> List[Tuple[int, int, int]]:
+        """(task index, start, end) runs of the best ordering found."""
+        order = self.perm if self.at_best else self.best_perm
+        releases, durations = self.releases, self.table.durations
+        runs = []
+        t = releases[order[0]] if order else 0
+        for idx in order:
+            if releases[idx] > t:
+                t = releases[idx]
+            runs.append((idx, t, t + durations[idx]))
+            t += durations[idx]
+        return runs
+
+    def result(self) -> Dict[str, Any]:
+        """
+        The best schedule so far.
+
+        Returns:
+            {"algo", "tq" of the starting policy, "mode": "optimize", "score", "baselineScore",
+             "iterations", "elapsedMs", "schedule"}; the policy's own schedule while the search
+            has not beaten it
+        """
+        algo, tq = self.baseline
+        runs = self.best_runs()
+        score = score_runs(self.table, runs)
+        if score > self.baseline_score:
+            schedule = render_runs(runs, self.table.names, self.table.tick)
+        else:
+            score, schedule = self.baseline_score, schedule_table(self.table, algo, tq)
+        return {
+            "algo": algo,
+            "tq": tq,
+            "mode": "optimize",
+            "score": score,
+            "baselineScore": self.baseline_score,
+            "iterations": self.iterations,
+            "elapsedMs": round(self.elapsed * 1000, 1),
+            "schedule": schedule,
+        }
+
+
+def optimize_table(table: TaskTable, budget_ms: float, seed: Optional[int] = None) -> Dict[str, Any]:
+    # Module level so it can run inside a scheduler pool process; the budget covers the policy runs too
+    began = time.perf_counter()
+    optimizer = ScheduleOptimizer(table, seed)
+    optimizer.run(budget_ms - (time.perf_counter() - began) * 1000)
+    return optimizer.result()
+
+
+async def optimizer_suggest(tasks: Union[list, TaskTable], budget_ms: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Best schedule the optimizer finds within the budget.
+
+    Args:
+        tasks: Task models or a prepared TaskTable
+        budget_ms: Wall-clock budget (default OPTIMIZER_BUDGET_MS)
+
+    Returns:
+        ScheduleOptimizer.result()
+    """
+    budget_ms = OPTIMIZER_BUDGET_MS if budget_ms is None else budget_ms
+    table = tasks if isinstance(tasks, TaskTable) else await run_in_threadpool(prepare_tasks, tasks)
+    with span("schedule_optimize"):
+        if len(table) <= scheduler_pool.inline_threshold or scheduler_pool.executor is None:
+            result = await run_in_threadpool(optimize_table, table, budget_ms)
+        else:
+            result = (await scheduler_pool.map(optimize_table, [(table, budget_ms)]))[0]
+    log.info("Optimized %d tasks: %s %.4f -> %.4f in %d iterations", len(table), result["algo"],
+             result["baselineScore"], result["score"], result["iterations"])
+    return result
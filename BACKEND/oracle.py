@@ -0,0 +1,150 @@
+"""
+"Simulate everything and keep the best" algorithm suggestion.
+
+Instead of asking the XGBoost model, every candidate (each algorithm, and
+round robin with each time quantum the model knows) is simulated on the
+prepared TaskTable and scored with the same formula as
+synthetic_dataset_gen.score_schedule, i.e. the way the training labels were
+produced. Small lists are evaluated inline; large ones are spread over the
+scheduler process pool. If the whole search does not fit in the latency
+budget, oracle_suggest returns None and the caller falls back to the model.
+"""
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from starlette.concurrency import run_in_threadpool
+
+from observability import get_logger, span
+from scheduler import TaskTable, prepare_tasks, schedule_runs
+from scheduler_pool import scheduler_pool, SchedulerBusy
+
+ORACLE_BUDGET_MS = float(os.getenv("ORACLE_BUDGET_MS", "300"))
+
+# Same order as generate_dataset_algo, so ties resolve to the same label the model was trained on
+CANDIDATES: List[Tuple[str, int]] = [
+    ("fcfs", 0), ("sjf", 0), ("srtf", 0),
+    ("rr", 1), ("rr", 2), ("rr", 4), ("rr", 6),
+    ("ps", 0), ("edf", 0),
+    ("mlfq", 1), ("mlfq", 2), ("mlfq", 4), ("mlfq", 6),
+    ("ps-aging", 0),
+]
+
+log = get_logger("oracle")
+
+
+def score_runs(table: TaskTable, runs: List[Tuple[int, int, int]]) -> float:
+    """
+    score_schedule computed from raw (task index, start, end) runs.
+
+    Works on epoch ticks directly instead of re-parsing the rendered segments
+    (the importance term is in hours, as in score_schedule); like
+    score_schedule, executions are matched to tasks by name.
+    """
+    last_end: Dict[str, int] = {}
+    first, last = None, None
+    names = table.names
+    for idx, start, end in runs:
+        if end <= start:
+            continue
+        name = names[idx]
+        if name not in last_end or end > last_end[name]:
+            last_end[name] = end
+        first = start if first is None or start < first else first
+        last = end if last is None or end > last else last
+    n = len(table)
+    if first is None or n == 0:
+        return 0.0
+
+    span_hours = (last - first) or 1
+    turnaround = waiting = importance = 0.0
+    deadlines_met = 0
+    for i in range(n):
+        end = last_end.get(names[i])
+        if end is None:
+            # Never scheduled: penalize heavily
+            turnaround += span_hours * 2
+            waiting += span_hours * 2
+            continue
+        tat = end - table.arrivals[i]
+        turnaround += max(tat, 0)
+        waiting += max(tat - table.durations[i], 0)
+        if end <= table.deadlines[i]:
+            deadlines_met += 1
+        # priorities run 1 (high) .. 3 (low), score_schedule weighs High 3 .. Low 1
+        importance += (4 - table.priorities[i]) / ((end - first) * table.tick / 60 + 1e-5)
+
+    score = (
+        0.25 * (1 - turnaround / n / span_hours) +
+        0.25 * (1 - waiting / n / span_hours) +
+        0.30 * deadlines_met / n +
+        0.20 * importance / n
+    )
+    return max(0.0, min(1.0, score))
+
+
+def score_candidate(table: TaskTable, algo: str, time_quantum: int) -> float:
+    # Module level so it can run inside a scheduler pool process
+    return score_runs(table, schedule_runs(table, algo, time_quantum))
+
+
+def score_candidates(table: TaskTable, deadline: float) -> Optional[List[float]]:
+    """Score every candidate in turn; None as soon as `deadline` (time.monotonic) has passed."""
+    scores = []
+    for algo, tq in CANDIDATES:
+        if time.monotonic() > deadline:
+            return None
+        scores.append(score_candidate(table, algo, tq))
+    return scores
+
+
+async def _search(table: TaskTable, deadline: float) -> Optional[Dict[str, Any]]:
+    if len(table) <= scheduler_pool.inline_threshold or scheduler_pool.executor is None:
+        scores = await run_in_threadpool(score_candidates, table, deadline)
+        if scores is None:
+            return None
+    else:
+        scores = await scheduler_pool.map(score_candidate, [(table, algo, tq) for algo, tq in CANDIDATES])
+
+    # First maximum wins, matching the strict ">" of generate_dataset_algo
+    best = max(range(len(CANDIDATES)), key=lambda i: (scores[i], -i))
+    algo, tq = CANDIDATES[best]
+    schedule = await scheduler_pool.run(table, algo, tq)
+    return {
+        "algo": algo,
+        "tq": tq,
+        "mode": "oracle",
+        "scores": [{"algo": a, "tq": q, "score": s} for (a, q), s in zip(CANDIDATES, scores)],
+        "schedule": schedule,
+    }
+
+
+async def oracle_suggest(tasks: Union[list, TaskTable],
+                         budget_ms: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    """
+    Find the best-scoring algorithm by simulating every candidate.
+
+    Args:
+        tasks: Task models or a prepared TaskTable
+        budget_ms: Latency budget for the whole search (default ORACLE_BUDGET_MS)
+
+    Returns:
+        {"algo", "tq", "mode": "oracle", "scores": [{"algo", "tq", "score"}, ...],
+         "schedule": the winning schedule}, or None if the budget ran out
+         (or the pool was busy) and the model should answer instead
+    """
+    budget = (ORACLE_BUDGET_MS if budget_ms is None else budget_ms) / 1000
+    deadline = time.monotonic() + budget
+    table = tasks if isinstance(tasks, TaskTable) else await run_in_threadpool(prepare_tasks, tasks)
+    if len(table) == 0:
+        return None
+    try:
+        with span("oracle_search"):
+            return await asyncio.wait_for(_search(table, deadline), max(0.0, deadline - time.monotonic()))
+    except asyncio.TimeoutError:
+        log.info("Oracle search over %d tasks exceeded %.0fms, falling back to the model", len(table),
+                 budget * 1000)
+    except SchedulerBusy as e:
+        log.info("Oracle search skipped: %s", e)
+    return None
@@ -0,0 +1,160 @@
+"""
+Monte Carlo what-if analysis of a schedule under uncertain durations.
+
+The deterministic schedule assumes every task takes exactly its duration.
+what_if_report draws K realized durations per task (lognormal, with the
+planned duration as the median) and replays the plan under each draw: every
+worker keeps the plan's sequence of runs, and each run starts as soon as the
+worker is free, the task has arrived, its previous piece is done and its
+predecessors have finished, stretched or shrunk by the task's draw (the
+usual right-shift repair of a plan). All K samples advance together as
+numpy vectors, one step per run of the plan, so the cost is O(runs) vector
+operations rather than K separate simulations.
+
+It reports each task's probability of missing its deadline and percentiles
+of the makespan (first arrival to last finish).
+"""
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from starlette.concurrency import run_in_threadpool
+
+from observability import span
+from scheduler import TaskTable, prepare_tasks, schedule_runs, working_time_runs
+from scheduler_pool import scheduler_pool
+from task_graph import topological_order
+from work_calendar import CalendarIndex, WorkCalendar
+
+MAKESPAN_PERCENTILES = (50, 90, 95, 99)
+# Upper bound on tasks x samples (two float64 matrices of that size are held at once)
+WHAT_IF_MAX_CELLS = int(os.getenv("WHAT_IF_MAX_CELLS", "10000000"))
+
+
+def replay_runs(runs: List[Tuple[int, ...]], table: TaskTable, arrivals: List[int], factors: "np.ndarray",
+                workers: int = 1) -> "np.ndarray":
+    """
+    Finish times (tasks x samples) of the plan's runs replayed with every task's
+    work scaled by its row of factors. Times are in the same ticks as the runs.
+    """
+    durations, depends = table.durations, table.depends
+    num_samples = factors.shape[1]
+    finish = np.empty((len(table), num_samples))
+    finish[:] = np.asarray(arrivals, dtype=float)[:, None]  # zero-duration tasks: done on arrival
+    worker_free = np.full((workers, num_samples), -np.inf)
+    started = [False] * len(table)
+    settled = [False] * len(table)
+
+    def settle(i: int) -> None:
+        # Milestones have no runs: they are done on arrival once their predecessors are
+        if not settled[i]:
+            settled[i] = True
+            for p in depends[i]:
+                if durations[p] == 0:
+                    settle(p)
+                np.maximum(finish[i], finish[p], out=finish[i])
+
+    for r in sorted(range(len(runs)), key=lambda r: runs[r][1]):  # the plan's timeline, ties in run order
+        run = runs[r]
+        idx, start, end = run[0], run[1], run[2]
+        worker = run[3] - 1 if len(run) > 3 else 0
+        # Earliest start: worker free, task arrived (or its previous piece done), predecessors finished
+        begin = np.maximum(worker_free[worker], finish[idx])
+        if not started[idx]:
+            started[idx] = True
+            if depends is not None:
+                for p in depends[idx]:
+                    if durations[p] == 0:
+                        settle(p)
+                    np.maximum(begin, finish[p], out=begin)
+        done = begin + (end - start) * factors[idx]
+        finish[idx] = done
+        worker_free[worker] = done
+    if depends is not None:
+        for i in topological_order(depends):
+            if durations[i] == 0:
+                settle(i)
+    return finish
+
+
+def what_if_report(table: TaskTable, algo: str, time_quantum: Union[int, float] = 1, workers: int = 1,
+                   calendar: Optional[WorkCalendar] = None, samples: int = 1000, sigma: float = 0.25,
+                   seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Deadline-miss risk and makespan spread of a schedule under lognormal durations.
+
+    Args:
+        table, algo, time_quantum, workers, calendar: The schedule, as for schedule_table
+        samples: Number of duration draws
+        sigma: Log-space standard deviation of the duration factor (0.25: ~1 in 6 tasks overrun by 28%+)
+        seed: Random seed for reproducible reports
+
+    Returns:
+        {"samples", "sigma", "plannedMakespan", "makespan": {"p50", "p90", "p95", "p99"},
+         "expectedMisses", "tasks": [{"id", "missProbability"}]}; makespans in hours
+         (real hours from the first arrival, also with a calendar)
+
+    Raises:
+        ValueError: Unknown algorithm, or more than WHAT_IF_MAX_CELLS tasks x samples
+    """
+    n = len(table)
+    if n * samples > WHAT_IF_MAX_CELLS:
+        raise ValueError(f"{n} tasks x {samples} samples is over the limit of {WHAT_IF_MAX_CELLS}; use fewer samples")
+    if n == 0:
+        return {"samples": samples, "sigma": sigma, "plannedMakespan": 0,
+                "makespan": {f"p{q}": 0.0 for q in MAKESPAN_PERCENTILES}, "expectedMisses": 0.0, "tasks": []}
+    algo = algo.lower().strip()
+    rng = np.random.default_rng(seed)
+    factors = rng.lognormal(0.0, sigma, size=(n, samples))
+
+    if calendar is None:
+        runs = schedule_runs(table, algo, time_quantum, workers)
+        arrivals, deadlines = table.arrivals, np.asarray(table.deadlines, dtype=float)
+        index = None
+    else:
+        runs, _ = working_time_runs(table, algo, time_quantum, workers, calendar)
+        # Room for the overruns: the realized work can exceed what the plan's index covers
+        last = max(max(table.arrivals), max(table.deadlines))
+        index = calendar.index(min(table.arrivals), last, int(np.ceil(factors.max() * sum(table.durations))) + 1,
+                               table.tick)
+        arrivals = [index.working_before(a) for a in table.arrivals]
+        deadlines = np.asarray([index.working_before(d) for d in table.deadlines], dtype=float)
+
+    finish = replay_runs(runs, table, arrivals, factors, workers)
+    miss = (finish > deadlines[:, None]).mean(axis=1)
+    makespan_end = finish.max(axis=0)
+    planned_end = float(max([arrivals[i] for i in range(n)] + [run[2] for run in runs]))
+    if index is not None:
+        makespan_end = real_times(index, makespan_end)
+        planned_end = float(real_times(index, np.array([planned_end]))[0])
+    first = min(table.arrivals)
+    hours = table.tick / 60
+    percentiles = np.percentile((makespan_end - first) * hours, MAKESPAN_PERCENTILES)
+    return {
+        "samples": samples,
+        "sigma": sigma,
+        "plannedMakespan": (planned_end - first) * hours,
+        "makespan": {f"p{q}": float(v) for q, v in zip(MAKESPAN_PERCENTILES, percentiles)},
+        "expectedMisses": float(miss.sum()),
+        "tasks": [{"id": table.ids[i], "missProbability": float(miss[i])} for i in range(n)],
+    }
+
+
+def real_times(index: CalendarIndex, work: "np.ndarray") -> "np.ndarray":
+    """Epoch ticks at which `work` (fractional) working ticks of the index are done."""
+    prefix = np.asarray(index.prefix)
+    # The working tick the work ends in: the last one starting before it
+    tick = np.clip(np.searchsorted(prefix, work, side="left") - 1, 0, len(prefix) - 2)
+    return index.start + tick + (work - prefix[tick])
+
+
+async def what_if(tasks: Union[list, TaskTable], algo: str, time_quantum: Union[int, float] = 1,
+                  workers: int = 1, calendar: Optional[WorkCalendar] = None, tick: int = 60,
+                  samples: int = 1000, sigma: float = 0.25, seed: Optional[int] = None) -> Dict[str, Any]:
+    """what_if_report off the event loop: large plans in the scheduler pool, small ones on the threadpool."""
+    table = tasks if isinstance(tasks, TaskTable) else await run_in_threadpool(prepare_tasks, tasks, tick)
+    args = (table, algo, time_quantum, workers, calendar, samples, sigma, seed)
+    with span("what_if"):
+        if len(table) <= scheduler_pool.inline_threshold or scheduler_pool.executor is None:
+            return await run_in_threadpool(what_if_report, *args)
+        return (await scheduler_pool.map(what_if_report, [args]))[0]
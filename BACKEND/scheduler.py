@@ -1,60 +1,477 @@
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
-from dataclasses import dataclass
+import heapq
+from collections import deque
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field, replace
+
+from task_graph import critical_path, predecessor_lists, successor_lists
+from work_calendar import CalendarIndex, WorkCalendar
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+PREEMPTIVE_ALGOS = ('srtf', 'ps-p', 'edf-p')
+# Priority aging (ps-aging): a waiting task gains one importance level per AGING_HOURS
+AGING_HOURS = 8
+# Multi-level feedback queue: one level per importance, all waiting tasks back to the top every MLFQ_BOOST_HOURS
+MLFQ_LEVELS = 3
+MLFQ_BOOST_HOURS = 24
 
 
 @dataclass
 class ArrivalTime:
     hrs: int
     date: str
+    mins: int = 0
 
 
 @dataclass
 class DeadlineTime:
     hrs: int
     date: str
+    mins: int = 0
 
 
 @dataclass
 class Task:
     id: int
     taskName: str
-    duration: int
+    duration: Union[int, float]  # hours
     arrivalTime: ArrivalTime
     deadlineTime: DeadlineTime
     importance: str
+    dependsOn: List[int] = field(default_factory=list)  # ids of tasks that must finish first
 
 
-def schedule_tasks(task_list: List[Task], algo: str, time_quantum: int = 1) -> List[Dict[str, Any]]:
+@dataclass
+class TaskTable:
+    """
+    Column-oriented task list with times in epoch ticks (ticks since 1970-01-01).
+
+    A tick is `tick` minutes; the default of 60 makes times epoch hours.
+    Built once at the API boundary (prepare_tasks / the columnar request) so
+    the engines below work on plain ints instead of re-parsing date strings.
+    They are event-driven, so a finer tick costs nothing extra to simulate.
+    """
+    ids: List[int]
+    names: List[str]
+    durations: List[int]
+    arrivals: List[int]
+    deadlines: List[int]
+    priorities: List[int]  # 1 = high ... 3 = low
+    tick: int = 60  # minutes per time unit, a divisor of 60
+    depends: Optional[List[List[int]]] = None  # predecessor indices per task; None = no dependencies
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def schedule_tasks(task_list: List[Task], algo: str, time_quantum: Union[int, float] = 1,
+                   workers: int = 1, calendar: Optional[WorkCalendar] = None,
+                   tick: int = 60) -> List[Dict[str, Any]]:
     """
     Schedule tasks using various scheduling algorithms.
 
     Args:
-        task_list: List of Task objects
-        algo: Algorithm name ('fcfs', 'sjf', 'srtf', 'rr', 'priority', 'edf')
-        time_quantum: Time quantum for Round Robin (default: 1)
+        task_list: List of Task objects (or an already prepared TaskTable)
+        algo: Algorithm name ('fcfs', 'sjf', 'srtf', 'rr', 'ps', 'edf', the
+            preemptive 'ps-p' / 'edf-p', 'ps-aging' (priority with aging) or
+            'mlfq' (multi-level feedback queue))
+        time_quantum: Time quantum for Round Robin in hours, the top-level one for MLFQ (default: 1)
+        workers: Number of people working the shared backlog in parallel (default: 1)
+        calendar: Working hours to schedule within (default: round the clock)
+        tick: Simulation resolution in minutes, a divisor of 60 (default: 60)
 
     Returns:
         List of dictionaries with task schedule including dates
+        (plus the 1-based "worker" of each entry when workers > 1).
+        start / end are hours, fractional (9.5 = 9:30) when tick < 60
+    """
+    table = task_list if isinstance(task_list, TaskTable) else prepare_tasks(task_list, tick)
+    return schedule_table(table, algo, time_quantum, workers, calendar)
+
+
+def schedule_table(table: TaskTable, algo: str, time_quantum: Union[int, float] = 1, workers: int = 1,
+                   calendar: Optional[WorkCalendar] = None) -> List[Dict[str, Any]]:
+    """Run a scheduling algorithm on a prepared TaskTable."""
+    algo = algo.lower().strip()
+    if calendar is None:
+        runs = schedule_runs(table, algo, time_quantum, workers)
+    else:
+        runs = calendar_runs(table, algo, time_quantum, workers, calendar)
+    if workers > 1:
+        return render_worker_runs(runs, table.names, table.tick)
+    schedule = render_runs(runs, table.names, table.tick)
+    # Preemptive engines cut the running task at every arrival; glue those pieces back together
+    return merge_consecutive(schedule) if algo in PREEMPTIVE_ALGOS else schedule
+
+
+def schedule_runs(table: TaskTable, algo: str, time_quantum: Union[int, float] = 1,
+                  workers: int = 1) -> List[Tuple[int, ...]]:
+    """
+    Raw runs in epoch ticks, before they are split into daily segments.
+
+    (task index, start, end) for a single worker, (task index, start, end, worker)
+    when workers > 1. time_quantum is in hours.
     """
     algo = algo.lower().strip()
+    if workers < 1:
+        raise ValueError(f"Number of workers must be at least 1, got {workers}")
+    time_quantum = to_ticks(time_quantum, table.tick)
+
+    if workers > 1:
+        if algo == 'fcfs':
+            return parallel_nonpreemptive_runs(table, None, workers)
+        elif algo == 'sjf':
+            return parallel_nonpreemptive_runs(table, table.durations, workers)
+        elif algo == 'srtf':
+            return parallel_srtf_runs(table, workers)
+        elif algo == 'rr':
+            return parallel_rr_runs(table, time_quantum, workers)
+        elif algo == 'ps':
+            return parallel_nonpreemptive_runs(table, table.priorities, workers)
+        elif algo == 'edf':
+            return parallel_nonpreemptive_runs(table, table.deadlines, workers)
+        elif algo == 'ps-p':
+            return parallel_preemptive_runs(table, workers, table.priorities)
+        elif algo == 'edf-p':
+            return parallel_preemptive_runs(table, workers, table.deadlines)
+        elif algo == 'ps-aging':
+            return parallel_nonpreemptive_runs(table, aged_priorities(table), workers)
+        elif algo == 'mlfq':
+            return parallel_mlfq_runs(table, time_quantum, workers, to_ticks(MLFQ_BOOST_HOURS, table.tick))
+        raise ValueError(f"Unknown algorithm: {algo}")
 
     if algo == 'fcfs':
-        return fcfs_schedule(task_list)
+        return fcfs_runs(table)
     elif algo == 'sjf':
-        return sjf_schedule(task_list)
+        return nonpreemptive_runs(table, table.durations)
     elif algo == 'srtf':
-        return srtf_schedule(task_list)
+        return srtf_runs(table)
     elif algo == 'rr':
-        return rr_schedule(task_list, time_quantum)
+        return rr_runs(table, time_quantum)
     elif algo == 'ps':
-        return priority_schedule(task_list)
+        return nonpreemptive_runs(table, table.priorities)
     elif algo == 'edf':
-        return edf_schedule(task_list)
+        return nonpreemptive_runs(table, table.deadlines)
+    elif algo == 'ps-p':
+        return preemptive_runs(table, table.priorities)
+    elif algo == 'edf-p':
+        return preemptive_runs(table, table.deadlines)
+    elif algo == 'ps-aging':
+        return nonpreemptive_runs(table, aged_priorities(table))
+    elif algo == 'mlfq':
+        return mlfq_runs(table, time_quantum, to_ticks(MLFQ_BOOST_HOURS, table.tick))
     else:
         raise ValueError(f"Unknown algorithm: {algo}")
 
 
+def calendar_runs(table: TaskTable, algo: str, time_quantum: Union[int, float], workers: int,
+                  calendar: WorkCalendar) -> List[Tuple[int, ...]]:
+    """
+    schedule_runs restricted to the calendar's working hours.
+
+    The engines run unchanged in working time (hours of work since the start of
+    the horizon), where nights, weekends and blocked slots simply don't exist;
+    a task arriving outside working hours becomes available at the next working
+    hour. The runs are then expanded back to epoch hours, split at every
+    non-working gap. Deadlines and priorities stay keys in real time.
+    """
+    if len(table) == 0:
+        return []
+    runs, index = working_time_runs(table, algo, time_quantum, workers, calendar)
+    return index.expand_runs(runs)
+
+
+def working_time_runs(table: TaskTable, algo: str, time_quantum: Union[int, float], workers: int,
+                      calendar: WorkCalendar) -> Tuple[List[Tuple[int, ...]], CalendarIndex]:
+    """The runs of calendar_runs before expansion: in working ticks of the returned index."""
+    index = calendar.index(min(table.arrivals), max(table.arrivals), sum(table.durations), table.tick)
+    working = replace(table, arrivals=[index.working_before(a) for a in table.arrivals])
+    if algo not in ('fcfs', 'rr', 'mlfq'):
+        return schedule_runs(working, algo, time_quantum, workers), index
+
+    # Tasks arriving in the same non-working gap become simultaneous; queue them in real arrival order
+    order = arrival_order(table)
+    position = {idx: pos for pos, idx in enumerate(order)}
+    working = TaskTable(*([column[i] for i in order] for column in (
+        working.ids, working.names, working.durations, working.arrivals, working.deadlines, working.priorities)),
+        tick=table.tick,
+        depends=None if table.depends is None else [[position[p] for p in table.depends[i]] for i in order])
+    runs = schedule_runs(working, algo, time_quantum, workers)
+    return [(order[idx], *rest) for idx, *rest in runs], index
+
+
+@lru_cache(maxsize=65536)
+def date_to_epoch_day(date_str: str) -> int:
+    """Days since 1970-01-01 for a YYYY-MM-DD string (cached: task lists repeat few dates)."""
+    return datetime.strptime(date_str, "%Y-%m-%d").toordinal() - EPOCH_ORDINAL
+
+
+@lru_cache(maxsize=65536)
+def epoch_day_to_date(day: int) -> str:
+    return date.fromordinal(day + EPOCH_ORDINAL).strftime("%Y-%m-%d")
+
+
+def to_ticks(hours: Union[int, float], tick: int) -> int:
+    """Whole ticks needed to cover `hours` (rounded to the minute first)."""
+    if tick == 60 and isinstance(hours, int):
+        return hours
+    return -(-round(hours * 60) // tick)
+
+
+def epoch_ticks(day: int, hrs: int, mins: int, tick: int, round_up: bool) -> int:
+    """A date / hour / minute as epoch ticks; arrivals round up (a task can't start early), deadlines down."""
+    minutes = (day * 24 + hrs) * 60 + mins
+    return -(-minutes // tick) if round_up else minutes // tick
+
+
+def check_tick(tick: int) -> None:
+    if tick < 1 or 60 % tick:
+        raise ValueError(f"Tick must be a whole divisor of 60 minutes, got {tick}")
+
+
+def prepare_tasks(task_list: List[Task], tick: int = 60) -> TaskTable:
+    """Convert Task objects to a TaskTable, parsing every date exactly once."""
+    check_tick(tick)
+    return TaskTable(
+        ids=[t.id for t in task_list],
+        names=[t.taskName for t in task_list],
+        durations=[to_ticks(t.duration, tick) for t in task_list],
+        arrivals=[epoch_ticks(date_to_epoch_day(t.arrivalTime.date), t.arrivalTime.hrs, t.arrivalTime.mins,
+                              tick, True) for t in task_list],
+        deadlines=[epoch_ticks(date_to_epoch_day(t.deadlineTime.date), t.deadlineTime.hrs, t.deadlineTime.mins,
+                               tick, False) for t in task_list],
+        priorities=[get_priority_value(t.importance) for t in task_list],
+        tick=tick,
+        depends=predecessor_lists([t.id for t in task_list], [t.dependsOn for t in task_list]),
+    )
+
+
+def table_from_columns(ids: List[int], names: List[str], durations: List[Union[int, float]],
+                       arrival_dates: List[str], arrival_hrs: List[int],
+                       deadline_dates: List[str], deadline_hrs: List[int],
+                       importances: List[str], arrival_mins: Optional[List[int]] = None,
+                       deadline_mins: Optional[List[int]] = None, tick: int = 60,
+                       depends_on: Optional[List[List[int]]] = None) -> TaskTable:
+    """Build a TaskTable from the columnar wire format (raises ValueError on bad dates or dependencies)."""
+    check_tick(tick)
+    arrival_mins = arrival_mins or [0] * len(ids)
+    deadline_mins = deadline_mins or [0] * len(ids)
+    return TaskTable(
+        ids=ids,
+        names=names,
+        durations=[to_ticks(d, tick) for d in durations],
+        arrivals=[epoch_ticks(date_to_epoch_day(d), h, m, tick, True)
+                  for d, h, m in zip(arrival_dates, arrival_hrs, arrival_mins)],
+        deadlines=[epoch_ticks(date_to_epoch_day(d), h, m, tick, False)
+                   for d, h, m in zip(deadline_dates, deadline_hrs, deadline_mins)],
+        priorities=[get_priority_value(i) for i in importances],
+        tick=tick,
+        depends=predecessor_lists(ids, depends_on) if depends_on else None,
+    )
+
+
+def tick_hours(tick: int):
+    """
+    Converter from ticks since midnight to the hour values segments carry:
+    ints for whole hours, fractions otherwise (9.5 = 9:30). None for hourly ticks.
+    """
+    if tick == 60:
+        return None
+
+    def hours(ticks: int) -> Union[int, float]:
+        minutes = ticks * tick
+        return minutes // 60 if minutes % 60 == 0 else minutes / 60
+    return hours
+
+
+def render_runs(runs: List[Tuple[int, int, int]], names: List[str], tick: int = 60) -> List[Dict[str, Any]]:
+    """
+    Turn (task index, start, end) runs in epoch ticks into schedule entries.
+
+    Runs crossing midnight are split per day, the first part ending at 24,
+    exactly like create_schedule_entries.
+    """
+    schedule = []
+    append = schedule.append
+    per_day = 1440 // tick
+    hours = tick_hours(tick)
+    for idx, start, end in runs:
+        name = names[idx]
+        while start < end:
+            day_start = start - start % per_day
+            segment_end = min(end, day_start + per_day)
+            append({
+                "task": name,
+                "start": start - day_start if hours is None else hours(start - day_start),
+                "end": segment_end - day_start if hours is None else hours(segment_end - day_start),
+                "date": epoch_day_to_date(day_start // per_day)
+            })
+            start = segment_end
+    return schedule
+
+
+def render_worker_runs(runs: List[Tuple[int, int, int, int]], names: List[str],
+                       tick: int = 60) -> List[Dict[str, Any]]:
+    """render_runs for multi-worker (task index, start, end, worker) runs."""
+    schedule = []
+    append = schedule.append
+    per_day = 1440 // tick
+    hours = tick_hours(tick)
+    for idx, start, end, worker in runs:
+        name = names[idx]
+        while start < end:
+            day_start = start - start % per_day
+            segment_end = min(end, day_start + per_day)
+            append({
+                "task": name,
+                "start": start - day_start if hours is None else hours(start - day_start),
+                "end": segment_end - day_start if hours is None else hours(segment_end - day_start),
+                "date": epoch_day_to_date(day_start // per_day),
+                "worker": worker
+            })
+            start = segment_end
+    return schedule
+
+
+def arrival_order(table: TaskTable) -> List[int]:
+    """Task indices by arrival (stable, so ties keep list order)."""
+    return sorted(range(len(table)), key=table.arrivals.__getitem__)
+
+
+def critical_path_report(table: TaskTable) -> Dict[str, Any]:
+    """
+    Critical path and per-task slack of a TaskTable (see task_graph.critical_path).
+
+    Returns:
+        {"criticalPath": [task ids, first to last], "length": hours of work on it,
+         "finish": {"date", "hrs"} of the project's earliest finish,
+         "slack": [{"id", "earliestStart", "latestStart", "slack"}, ...]}, starts as
+        {"date", "hrs"}; hours are fractional at sub-hour ticks
+    """
+    if len(table) == 0:
+        return {"criticalPath": [], "length": 0, "finish": None, "slack": []}
+    predecessors = table.depends or [[] for _ in range(len(table))]
+    path, earliest, latest = critical_path(table.arrivals, table.durations, predecessors)
+    per_day = 1440 // table.tick
+    hours = tick_hours(table.tick) or int
+
+    def moment(t: int) -> Dict[str, Any]:
+        return {"date": epoch_day_to_date(t // per_day), "hrs": hours(t % per_day)}
+
+    ids, durations = table.ids, table.durations
+    return {
+        "criticalPath": [ids[i] for i in path],
+        "length": hours(sum(durations[i] for i in path)),
+        "finish": moment(max(earliest[i] + durations[i] for i in range(len(table)))),
+        "slack": [{"id": ids[i], "earliestStart": moment(earliest[i]), "latestStart": moment(latest[i]),
+                   "slack": hours(latest[i] - earliest[i])} for i in range(len(table))],
+    }
+
+
+class Releases:
+    """
+    Tasks in the order they become available to an engine: by arrival (ties
+    in list order), and a task with predecessors only once the last of them
+    has completed, at max(arrival, that completion).
+
+    Tasks without predecessors are read off the static arrival order; the
+    others enter a heap when their indegree counter drops to zero, so the
+    whole dependency graph is released in O(V + E) plus the heap operations.
+    Engines call complete() when a task finishes (non-preemptive ones as soon
+    as they know when). With dependencies, zero-duration tasks (milestones)
+    need no worker and complete the moment they are released.
+    """
+
+    def __init__(self, table: TaskTable):
+        self.arrivals = table.arrivals
+        self.durations = table.durations
+        order = arrival_order(table)
+        self.successors: Optional[List[List[int]]] = None
+        if table.depends is not None:
+            self.indegree = [len(preds) for preds in table.depends]
+            self.successors = successor_lists(table.depends)
+            # Latest of arrival and predecessor finishes; parallel engines report finishes out of time order
+            self.ready_at = list(self.arrivals)
+            order = [idx for idx in order if not self.indegree[idx]]
+        self.order = order
+        self.position = 0
+        self.released: List[Tuple[int, int]] = []  # (release time, index) of tasks freed by completions
+
+    def __bool__(self) -> bool:
+        """Whether tasks are waiting for their release time (ones blocked on a predecessor are not)."""
+        if self.successors is not None:
+            self._settle()
+        return self.position < len(self.order) or bool(self.released)
+
+    def next_time(self) -> Optional[int]:
+        """Release time of the next task, None if nothing is waiting."""
+        if self.successors is not None:
+            self._settle()
+        return self._next_time()
+
+    def pop(self) -> int:
+        """Index of the next task to be released."""
+        if self.successors is not None:
+            self._settle()
+        return self._pop()
+
+    def due(self, current_time: int) -> List[int]:
+        """Pop every task released by `current_time`, in release order."""
+        if self.successors is None:
+            # No dependencies: a slice of the arrival order
+            start = end = self.position
+            order, arrivals = self.order, self.arrivals
+            while end < len(order) and arrivals[order[end]] <= current_time:
+                end += 1
+            self.position = end
+            return order[start:end]
+        due = []
+        while self and self._next_time() <= current_time:
+            due.append(self._pop())
+        return due
+
+    def complete(self, idx: int, at: int) -> None:
+        """Task `idx` finishes at `at`: release the successors it was the last predecessor of."""
+        if self.successors is None:
+            return
+        for successor in self.successors[idx]:
+            if at > self.ready_at[successor]:
+                self.ready_at[successor] = at
+            self.indegree[successor] -= 1
+            if not self.indegree[successor]:
+                heapq.heappush(self.released, (self.ready_at[successor], successor))
+
+    def _next_time(self) -> Optional[int]:
+        static = self.arrivals[self.order[self.position]] if self.position < len(self.order) else None
+        if self.released and (static is None or self.released[0][0] < static):
+            return self.released[0][0]
+        return static
+
+    def _pop(self) -> int:
+        if self.position < len(self.order):
+            idx = self.order[self.position]
+            if not self.released or (self.arrivals[idx], idx) < self.released[0]:
+                self.position += 1
+                return idx
+        return heapq.heappop(self.released)[1]
+
+    def _settle(self) -> None:
+        # Complete milestones at the head at their release time
+        while self.position < len(self.order) or self.released:
+            release = self._next_time()
+            if self.durations[self._peek()]:
+                return
+            self.complete(self._pop(), release)
+
+    def _peek(self) -> int:
+        if self.position < len(self.order):
+            idx = self.order[self.position]
+            if not self.released or (self.arrivals[idx], idx) < self.released[0]:
+                return idx
+        return self.released[0][1]
+
+
 def get_arrival_timestamp(task: Task) -> datetime:
     """Convert arrival time to datetime timestamp."""
     return datetime.strptime(f"{task.arrivalTime.date} {task.arrivalTime.hrs:02d}:00", "%Y-%m-%d %H:%M")
@@ -75,8 +492,16 @@ def get_priority_value(importance: str) -> int:
     return importance_map.get(importance.lower().strip(), 2)
 
 
-def create_schedule_entries(start_dt: datetime, duration: int, task_name: str) -> List[Dict[str, Any]]:
-    """Create schedule entries for a task, handling multi-day spans."""
+def create_schedule_entries(start_dt: datetime, duration: int, task_name: str,
+                            calendar: Optional[WorkCalendar] = None) -> List[Dict[str, Any]]:
+    """Create schedule entries for a task, handling multi-day spans (and skipping non-working hours)."""
+    if calendar is not None:
+        start = date_to_epoch_day(start_dt.strftime("%Y-%m-%d")) * 24 + start_dt.hour
+        index = calendar.index(start, start, duration)
+        work_start = index.working_before(start)
+        runs = [(0, s, e) for s, e in index.expand(work_start, work_start + duration)]
+        return render_runs(runs, [task_name])
+
     entries = []
     end_dt = start_dt + timedelta(hours=duration)
     current = start_dt
@@ -114,234 +539,522 @@ def create_schedule_entries(start_dt: datetime, duration: int, task_name: str) -
     return entries
 
 
-def fcfs_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
-    """First Come First Served scheduling."""
-    if not task_list:
-        return []
+def fcfs_runs(table: TaskTable) -> List[Tuple[int, int, int]]:
+    """First Come First Served: tasks run to completion in the order they are released."""
+    runs = []
+    releases = Releases(table)
+    durations, complete = table.durations, releases.complete
+    current_time = releases.next_time() or 0
 
-    # Sort by arrival time
-    sorted_tasks = sorted(task_list, key=lambda t: get_arrival_timestamp(t))
+    while releases:
+        # Wait for task to arrive if necessary
+        release = releases.next_time()
+        if release > current_time:
+            current_time = release
+        # Everything released by now goes in release order; what their completions release comes later
+        for idx in releases.due(current_time):
+            runs.append((idx, current_time, current_time + durations[idx]))
+            current_time += durations[idx]
+            complete(idx, current_time)
 
-    schedule = []
-    current_time = get_arrival_timestamp(sorted_tasks[0])
+    return runs
 
-    for task in sorted_tasks:
-        task_arrival = get_arrival_timestamp(task)
 
-        # Wait for task to arrive if necessary
-        if task_arrival > current_time:
-            current_time = task_arrival
+def nonpreemptive_runs(table: TaskTable, keys: List[int]) -> List[Tuple[int, int, int]]:
+    """
+    Non-preemptive selection: whenever the worker is free, run the arrived
+    task with the smallest key (ties go to the earlier task in the list).
 
-        # Schedule the task
-        entries = create_schedule_entries(current_time, task.duration, task.taskName)
-        schedule.extend(entries)
+    SJF uses durations as keys, priority scheduling importance and EDF deadlines.
+    """
+    runs = []
+    releases = Releases(table)
+    durations = table.durations
+    ready: List[Tuple[int, int]] = []
+    current_time = releases.next_time() or 0
 
-        # Update current time
-        current_time = current_time + timedelta(hours=task.duration)
+    while ready or releases:
+        for idx in releases.due(current_time):
+            heapq.heappush(ready, (keys[idx], idx))
 
-    return schedule
+        if not ready:
+            # Jump to the next task arrival
+            current_time = releases.next_time()
+            continue
 
+        _, idx = heapq.heappop(ready)
+        runs.append((idx, current_time, current_time + durations[idx]))
+        current_time += durations[idx]
+        releases.complete(idx, current_time)
 
-def sjf_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
-    """Shortest Job First (non-preemptive) scheduling."""
-    if not task_list:
-        return []
+    return runs
 
-    schedule = []
-    remaining = task_list.copy()
-    current_time = get_arrival_timestamp(min(task_list, key=lambda t: get_arrival_timestamp(t)))
 
-    while remaining:
-        # Find all tasks that have arrived by current_time
-        available = [t for t in remaining if get_arrival_timestamp(t) <= current_time]
+def preemptive_runs(table: TaskTable, keys: Optional[List[int]] = None) -> List[Tuple[int, int, int]]:
+    """
+    Preemptive selection: the arrived task with the smallest key holds the
+    worker until it finishes or a task with a smaller key arrives (ties go to
+    the earlier task in the list). keys=None uses the remaining time (SRTF);
+    EDF-P passes deadlines and PS-P importance.
 
-        if not available:
-            # Jump to the next task arrival
-            next_task = min(remaining, key=lambda t: get_arrival_timestamp(t))
-            current_time = get_arrival_timestamp(next_task)
+    The choice can only change when a task arrives, so the running task
+    keeps the worker until it finishes or the next arrival, not hour by hour.
+    """
+    runs = []
+    releases = Releases(table)
+    remaining = list(table.durations)
+    ready: List[Tuple[int, int]] = []  # (key, index)
+    current_time = releases.next_time() or 0
+
+    while ready or releases:
+        for idx in releases.due(current_time):
+            if remaining[idx] > 0:
+                heapq.heappush(ready, (remaining[idx] if keys is None else keys[idx], idx))
+            else:
+                releases.complete(idx, current_time)
+
+        if not ready:
+            if releases:
+                current_time = releases.next_time()
             continue
 
-        # Select the shortest job
-        selected = min(available, key=lambda t: t.duration)
+        idx = ready[0][1]
+        run = remaining[idx]
+        next_release = releases.next_time()
+        if next_release is not None:
+            run = min(run, next_release - current_time)
+        runs.append((idx, current_time, current_time + run))
+        current_time += run
+        remaining[idx] -= run
 
-        # Schedule it
-        entries = create_schedule_entries(current_time, selected.duration, selected.taskName)
-        schedule.extend(entries)
+        if remaining[idx] == 0:
+            heapq.heappop(ready)
+            releases.complete(idx, current_time)
+        elif keys is None:
+            # Still the shortest: its key only shrank
+            heapq.heapreplace(ready, (remaining[idx], idx))
 
-        # Update time and remove task
-        current_time = current_time + timedelta(hours=selected.duration)
-        remaining.remove(selected)
+    return runs
 
-    return schedule
 
+def srtf_runs(table: TaskTable) -> List[Tuple[int, int, int]]:
+    """Shortest Remaining Time First (preemptive SJF)."""
+    return preemptive_runs(table)
 
-def srtf_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
-    """Shortest Remaining Time First (preemptive SJF) scheduling."""
-    if not task_list:
-        return []
 
-    # Track remaining time for each task
-    remaining_time = {task.id: task.duration for task in task_list}
-    completed = set()
+def rr_runs(table: TaskTable, time_quantum: int) -> List[Tuple[int, int, int]]:
+    """Round Robin: newly arrived tasks queue ahead of the task just preempted."""
+    if time_quantum <= 0:
+        raise ValueError(f"Time quantum must be positive, got {time_quantum}")
 
-    schedule = []
-    current_time = get_arrival_timestamp(min(task_list, key=lambda t: get_arrival_timestamp(t)))
-
-    while len(completed) < len(task_list):
-        # Find all available tasks
-        available = [
-            t for t in task_list
-            if t.id not in completed and get_arrival_timestamp(t) <= current_time
-        ]
-
-        if not available:
-            # Jump to next arrival
-            unarrived = [t for t in task_list if t.id not in completed]
-            if unarrived:
-                next_task = min(unarrived, key=lambda t: get_arrival_timestamp(t))
-                current_time = get_arrival_timestamp(next_task)
-            continue
+    runs = []
+    releases = Releases(table)
+    remaining = list(table.durations)
+    ready_queue = deque()
+    current_time = releases.next_time() or 0
 
-        # Select task with shortest remaining time
-        selected = min(available, key=lambda t: remaining_time[t.id])
+    while ready_queue or releases:
+        if not ready_queue:
+            # Jump to next arrival (anything released earlier was queued after the last quantum)
+            current_time = max(current_time, releases.next_time())
+            ready_queue.extend(releases.due(current_time))
+
+        idx = ready_queue.popleft()
+        exec_time = min(time_quantum, remaining[idx])
+        runs.append((idx, current_time, current_time + exec_time))
+        remaining[idx] -= exec_time
+        current_time += exec_time
+        if remaining[idx] == 0:
+            releases.complete(idx, current_time)
 
-        # Execute for 1 hour
-        entries = create_schedule_entries(current_time, 1, selected.taskName)
-        schedule.extend(entries)
+        # Add newly arrived tasks
+        ready_queue.extend(releases.due(current_time))
 
-        remaining_time[selected.id] -= 1
-        current_time = current_time + timedelta(hours=1)
+        # Re-add current task if not finished
+        if remaining[idx] > 0:
+            ready_queue.append(idx)
 
-        if remaining_time[selected.id] == 0:
-            completed.add(selected.id)
+    return runs
 
-    # Merge consecutive entries of same task on same date
-    return merge_consecutive(schedule)
 
+def aged_priorities(table: TaskTable) -> List[int]:
+    """
+    Keys for priority scheduling with aging (ps-aging): a waiting task gains
+    one importance level per AGING_HOURS, so a Low task that has waited twice
+    that long ranks with a High one that just arrived.
+
+    Every waiting task has aged by (now - arrival) / interval at any moment, so
+    comparing priority - (now - arrival) / interval is comparing
+    priority * interval + arrival: the keys are fixed per task and the plain
+    heap of the non-preemptive engines applies, O(log n) per decision.
+    """
+    interval = to_ticks(AGING_HOURS, table.tick)
+    return [priority * interval + arrival for priority, arrival in zip(table.priorities, table.arrivals)]
 
-def rr_schedule(task_list: List[Task], time_quantum: int) -> List[Dict[str, Any]]:
-    """Round Robin scheduling."""
-    if not task_list:
-        return []
 
-    # Sort by arrival
-    sorted_tasks = sorted(task_list, key=lambda t: get_arrival_timestamp(t))
+class FeedbackQueues:
+    """Ready tasks of a multi-level feedback queue: a FIFO deque per level, level 0 served first."""
 
-    # Track remaining time
-    remaining_time = {task.id: task.duration for task in task_list}
+    def __init__(self, levels: int):
+        self.levels = [deque() for _ in range(levels)]
 
-    schedule = []
-    current_time = get_arrival_timestamp(sorted_tasks[0])
-    ready_queue = []
-    next_arrival_idx = 0
+    def __bool__(self) -> bool:
+        return any(self.levels)
 
-    # Add first arrived task
-    while next_arrival_idx < len(sorted_tasks) and get_arrival_timestamp(
-            sorted_tasks[next_arrival_idx]) <= current_time:
-        ready_queue.append(sorted_tasks[next_arrival_idx])
-        next_arrival_idx += 1
+    def push(self, idx: int, level: int) -> None:
+        self.levels[level].append(idx)
 
-    while ready_queue or next_arrival_idx < len(sorted_tasks):
-        if not ready_queue:
-            # Jump to next arrival
-            current_time = get_arrival_timestamp(sorted_tasks[next_arrival_idx])
-            while next_arrival_idx < len(sorted_tasks) and get_arrival_timestamp(
-                    sorted_tasks[next_arrival_idx]) <= current_time:
-                ready_queue.append(sorted_tasks[next_arrival_idx])
-                next_arrival_idx += 1
-            continue
+    def pop(self) -> Tuple[int, int]:
+        """(index, level) of the head of the highest non-empty level."""
+        for level, queue in enumerate(self.levels):
+            if queue:
+                return queue.popleft(), level
+        raise IndexError("pop from empty FeedbackQueues")
+
+    def boost(self) -> None:
+        """Move every waiting task to the top level, keeping the order they are served in."""
+        top = self.levels[0]
+        for queue in self.levels[1:]:
+            top.extend(queue)
+            queue.clear()
 
-        # Get next task from queue
-        current_task = ready_queue.pop(0)
 
-        # Execute for time quantum or remaining time
-        exec_time = min(time_quantum, remaining_time[current_task.id])
+def mlfq_runs(table: TaskTable, time_quantum: int, boost_period: int) -> List[Tuple[int, int, int]]:
+    """
+    Multi-level feedback queue: round robin within a level, the highest
+    non-empty level first. Tasks enter at the level of their importance (High
+    at the top) and drop a level whenever they use up a whole quantum, which
+    doubles at every level down. At each multiple of `boost_period` every
+    waiting task goes back to the top, so nothing waits behind a stream of
+    High tasks for longer than that. As in rr_runs, tasks arriving during a
+    quantum queue ahead of the task it preempts.
+    """
+    if time_quantum <= 0:
+        raise ValueError(f"Time quantum must be positive, got {time_quantum}")
+
+    runs = []
+    releases = Releases(table)
+    remaining = list(table.durations)
+    priorities = table.priorities
+    queues = FeedbackQueues(MLFQ_LEVELS)
+    current_time = releases.next_time() or 0
+    boost_epoch = current_time // boost_period
+
+    while queues or releases:
+        if not queues:
+            # Jump to next arrival (anything released earlier was queued after the last quantum)
+            current_time = max(current_time, releases.next_time())
+            for idx in releases.due(current_time):
+                queues.push(idx, priorities[idx] - 1)
+        if current_time // boost_period > boost_epoch:
+            boost_epoch = current_time // boost_period
+            queues.boost()
+
+        idx, level = queues.pop()
+        exec_time = min(time_quantum << level, remaining[idx])
+        runs.append((idx, current_time, current_time + exec_time))
+        remaining[idx] -= exec_time
+        current_time += exec_time
+        if remaining[idx] == 0:
+            releases.complete(idx, current_time)
+
+        for arrived in releases.due(current_time):
+            queues.push(arrived, priorities[arrived] - 1)
+
+        # Used up its quantum: one level down
+        if remaining[idx] > 0:
+            queues.push(idx, min(level + 1, MLFQ_LEVELS - 1))
+
+    return runs
+
+
+# ---------------- Multiple workers ----------------
+# The same policies for k people pulling from one shared backlog. Workers are
+# numbered 1..k; a free worker is picked from a heap, so every decision costs
+# O(log n + log k).
+
+def parallel_nonpreemptive_runs(table: TaskTable, keys: Optional[List[int]],
+                                workers: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Non-preemptive selection on `workers` workers: the worker that frees up
+    first takes the arrived task with the smallest key (ties go to the earlier
+    task in the list); with nothing ready it waits for the next arrival.
+    keys=None takes tasks in the order they were released (FCFS).
+    """
+    runs = []
+    releases = Releases(table)
+    durations = table.durations
+    ready: List[Tuple[int, int]] = []
+    released = 0
+    first_arrival = releases.next_time() or 0
+    free = [(first_arrival, worker) for worker in range(1, workers + 1)]  # (free from, worker), already a heap
+    clock = first_arrival  # time of the latest decision; an idle worker cannot start before it
+
+    while ready or releases:
+        free_from, worker = heapq.heappop(free)
+        current_time = max(free_from, clock)
+        if not ready and releases.next_time() > current_time:
+            current_time = releases.next_time()
+        clock = current_time
+        for idx in releases.due(current_time):
+            heapq.heappush(ready, (released if keys is None else keys[idx], idx))
+            released += 1
+
+        _, idx = heapq.heappop(ready)
+        end = current_time + durations[idx]
+        runs.append((idx, current_time, end, worker))
+        heapq.heappush(free, (end, worker))
+        releases.complete(idx, end)
+
+    return runs
+
+
+def parallel_preemptive_runs(table: TaskTable, workers: int,
+                             keys: Optional[List[int]] = None) -> List[Tuple[int, int, int, int]]:
+    """
+    Preemptive selection on `workers` workers: the arrived tasks with the
+    smallest keys hold the workers (keys=None: remaining time, i.e. SRTF).
+
+    Decisions only change at arrivals and completions, and a running task is
+    preempted only by a strictly smaller key (so it does not bounce between
+    equal tasks). Running tasks all progress at the same rate, so for SRTF
+    their order by remaining time is their order by finish time; two lazy
+    heaps track the next completion and the running task to preempt first.
+    """
+    runs = []
+    releases = Releases(table)
+    remaining = list(table.durations)
+    ready: List[Tuple[int, int]] = []  # (key, index)
+    idle = list(range(1, workers + 1))  # free worker ids, already a heap
+    running: Dict[int, Tuple[int, int, int]] = {}  # worker -> (index, segment start, finish)
+    soonest: List[Tuple[int, int, int]] = []  # (finish, worker, index): completions
+    latest: List[Tuple[int, int, int, int, int]] = []  # (-rank, -index, worker, index, finish): preemption order
+
+    def start(worker: int, idx: int, at: int) -> None:
+        finish = at + remaining[idx]
+        running[worker] = (idx, at, finish)
+        heapq.heappush(soonest, (finish, worker, idx))
+        heapq.heappush(latest, (-(finish if keys is None else keys[idx]), -idx, worker, idx, finish))
+
+    def is_current(worker: int, idx: int, finish: int) -> bool:
+        state = running.get(worker)
+        return state is not None and state[0] == idx and state[2] == finish
+
+    while ready or running or releases:
+        while soonest and not is_current(soonest[0][1], soonest[0][2], soonest[0][0]):
+            heapq.heappop(soonest)
+        current_time = soonest[0][0] if soonest else releases.next_time()
+        next_release = releases.next_time()
+        if next_release is not None and next_release < current_time:
+            current_time = next_release
+
+        # Completions
+        while soonest and soonest[0][0] <= current_time:
+            finish, worker, idx = heapq.heappop(soonest)
+            if not is_current(worker, idx, finish):
+                continue
+            _, segment_start, _ = running.pop(worker)
+            runs.append((idx, segment_start, finish, worker))
+            remaining[idx] = 0
+            heapq.heappush(idle, worker)
+            releases.complete(idx, finish)
+
+        # Arrivals
+        for idx in releases.due(current_time):
+            if remaining[idx] > 0:
+                heapq.heappush(ready, (remaining[idx] if keys is None else keys[idx], idx))
+            else:
+                releases.complete(idx, current_time)
+
+        while idle and ready:
+            _, idx = heapq.heappop(ready)
+            start(heapq.heappop(idle), idx, current_time)
+
+        # Preempt the running tasks with the largest keys while a smaller one is waiting
+        while ready:
+            while latest and not is_current(latest[0][2], latest[0][3], latest[0][4]):
+                heapq.heappop(latest)
+            if not latest:
+                break
+            rank, _, worker, idx, finish = latest[0]
+            running_key = finish - current_time if keys is None else -rank
+            if ready[0][0] >= running_key:
+                break
+            heapq.heappop(latest)
+            _, segment_start, _ = running.pop(worker)
+            runs.append((idx, segment_start, current_time, worker))
+            remaining[idx] = finish - current_time
+            _, next_idx = heapq.heapreplace(ready, (remaining[idx] if keys is None else keys[idx], idx))
+            start(worker, next_idx, current_time)
+
+    runs.sort(key=lambda run: (run[1], run[3]))
+    return runs
+
+
+def parallel_srtf_runs(table: TaskTable, workers: int) -> List[Tuple[int, int, int, int]]:
+    """Shortest Remaining Time First on `workers` workers."""
+    return parallel_preemptive_runs(table, workers)
+
+
+def parallel_rr_runs(table: TaskTable, time_quantum: int, workers: int) -> List[Tuple[int, int, int, int]]:
+    """
+    Round Robin over one shared queue: a free worker takes the head for one
+    quantum, then the task rejoins the tail when that quantum ends. Tasks
+    arriving by then queue ahead of it, as in rr_runs.
+    """
+    if time_quantum <= 0:
+        raise ValueError(f"Time quantum must be positive, got {time_quantum}")
+
+    runs = []
+    releases = Releases(table)
+    remaining = list(table.durations)
+    ready_queue = deque()
+    requeued: List[Tuple[int, int, int]] = []  # (quantum end, sequence, index)
+    sequence = 0
+    first_arrival = releases.next_time() or 0
+    free = [(first_arrival, worker) for worker in range(1, workers + 1)]
+    clock = first_arrival
+
+    while ready_queue or releases or requeued:
+        free_from, worker = heapq.heappop(free)
+        current_time = max(free_from, clock)
+        if not ready_queue:
+            # Idle until the next arrival or the next quantum to end elsewhere
+            upcoming = requeued[0][0] if requeued else None
+            next_release = releases.next_time()
+            if next_release is not None and (upcoming is None or next_release < upcoming):
+                upcoming = next_release
+            current_time = max(current_time, upcoming)
+        clock = current_time
+
+        # Everything that joined the queue by now, in time order (arrivals first on ties)
+        while True:
+            arrival = releases.next_time()
+            if arrival is not None and arrival <= current_time and (not requeued or arrival <= requeued[0][0]):
+                ready_queue.append(releases.pop())
+            elif requeued and requeued[0][0] <= current_time:
+                ready_queue.append(heapq.heappop(requeued)[2])
+            else:
+                break
+
+        idx = ready_queue.popleft()
+        exec_time = min(time_quantum, remaining[idx])
+        end = current_time + exec_time
+        runs.append((idx, current_time, end, worker))
+        remaining[idx] -= exec_time
+        if remaining[idx] > 0:
+            heapq.heappush(requeued, (end, sequence, idx))
+            sequence += 1
+        else:
+            releases.complete(idx, end)
+        heapq.heappush(free, (end, worker))
 
-        entries = create_schedule_entries(current_time, exec_time, current_task.taskName)
-        schedule.extend(entries)
+    return runs
 
-        remaining_time[current_task.id] -= exec_time
-        current_time = current_time + timedelta(hours=exec_time)
 
-        # Add newly arrived tasks
-        while next_arrival_idx < len(sorted_tasks) and get_arrival_timestamp(
-                sorted_tasks[next_arrival_idx]) <= current_time:
-            ready_queue.append(sorted_tasks[next_arrival_idx])
-            next_arrival_idx += 1
+def parallel_mlfq_runs(table: TaskTable, time_quantum: int, workers: int,
+                       boost_period: int) -> List[Tuple[int, int, int, int]]:
+    """
+    mlfq_runs over one shared set of queues: a free worker takes the head of
+    the highest non-empty level for that level's quantum, and the task rejoins
+    one level down when the quantum ends, behind the tasks that arrived by
+    then (as in parallel_rr_runs).
+    """
+    if time_quantum <= 0:
+        raise ValueError(f"Time quantum must be positive, got {time_quantum}")
+
+    runs = []
+    releases = Releases(table)
+    remaining = list(table.durations)
+    priorities = table.priorities
+    queues = FeedbackQueues(MLFQ_LEVELS)
+    requeued: List[Tuple[int, int, int, int]] = []  # (quantum end, sequence, index, level)
+    sequence = 0
+    first_arrival = releases.next_time() or 0
+    free = [(first_arrival, worker) for worker in range(1, workers + 1)]
+    clock = first_arrival
+    boost_epoch = first_arrival // boost_period
+
+    while queues or releases or requeued:
+        free_from, worker = heapq.heappop(free)
+        current_time = max(free_from, clock)
+        if not queues:
+            # Idle until the next arrival or the next quantum to end elsewhere
+            upcoming = requeued[0][0] if requeued else None
+            next_release = releases.next_time()
+            if next_release is not None and (upcoming is None or next_release < upcoming):
+                upcoming = next_release
+            current_time = max(current_time, upcoming)
+        clock = current_time
+
+        # Everything that joined the queues by now, in time order (arrivals first on ties)
+        while True:
+            arrival = releases.next_time()
+            if arrival is not None and arrival <= current_time and (not requeued or arrival <= requeued[0][0]):
+                idx = releases.pop()
+                queues.push(idx, priorities[idx] - 1)
+            elif requeued and requeued[0][0] <= current_time:
+                _, _, idx, level = heapq.heappop(requeued)
+                queues.push(idx, level)
+            else:
+                break
+        if current_time // boost_period > boost_epoch:
+            boost_epoch = current_time // boost_period
+            queues.boost()
+
+        idx, level = queues.pop()
+        exec_time = min(time_quantum << level, remaining[idx])
+        end = current_time + exec_time
+        runs.append((idx, current_time, end, worker))
+        remaining[idx] -= exec_time
+        if remaining[idx] > 0:
+            heapq.heappush(requeued, (end, sequence, idx, min(level + 1, MLFQ_LEVELS - 1)))
+            sequence += 1
+        else:
+            releases.complete(idx, end)
+        heapq.heappush(free, (end, worker))
 
-        # Re-add current task if not finished
-        if remaining_time[current_task.id] > 0:
-            ready_queue.append(current_task)
+    return runs
 
-    return schedule
 
+def fcfs_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
+    """First Come First Served scheduling."""
+    return schedule_tasks(task_list, 'fcfs')
 
-def priority_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
-    """Priority scheduling based on importance (High > Medium > Low)."""
-    if not task_list:
-        return []
 
-    schedule = []
-    remaining = task_list.copy()
-    current_time = get_arrival_timestamp(min(task_list, key=lambda t: get_arrival_timestamp(t)))
+def sjf_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
+    """Shortest Job First (non-preemptive) scheduling."""
+    return schedule_tasks(task_list, 'sjf')
 
-    while remaining:
-        # Find available tasks
-        available = [t for t in remaining if get_arrival_timestamp(t) <= current_time]
 
-        if not available:
-            # Jump to next arrival
-            next_task = min(remaining, key=lambda t: get_arrival_timestamp(t))
-            current_time = get_arrival_timestamp(next_task)
-            continue
+def srtf_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
+    """Shortest Remaining Time First (preemptive SJF) scheduling."""
+    return schedule_tasks(task_list, 'srtf')
 
-        # Select highest priority (lowest priority value)
-        selected = min(available, key=lambda t: get_priority_value(t.importance))
 
-        # Schedule it
-        entries = create_schedule_entries(current_time, selected.duration, selected.taskName)
-        schedule.extend(entries)
+def rr_schedule(task_list: List[Task], time_quantum: int) -> List[Dict[str, Any]]:
+    """Round Robin scheduling."""
+    return schedule_tasks(task_list, 'rr', time_quantum)
 
-        # Update time
-        current_time = current_time + timedelta(hours=selected.duration)
-        remaining.remove(selected)
 
-    return schedule
+def priority_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
+    """Priority scheduling based on importance (High > Medium > Low)."""
+    return schedule_tasks(task_list, 'ps')
 
 
 def edf_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
     """Earliest Deadline First scheduling."""
-    if not task_list:
-        return []
-
-    schedule = []
-    remaining = list(task_list)  # Create a fresh copy
-    current_time = get_arrival_timestamp(min(task_list, key=lambda t: get_arrival_timestamp(t)))
+    return schedule_tasks(task_list, 'edf')
 
-    while remaining:
-        # Find tasks that have arrived
-        available = [t for t in remaining if get_arrival_timestamp(t) <= current_time]
 
-        if not available:
-            # No tasks available, jump to next arrival
-            next_task = min(remaining, key=lambda t: get_arrival_timestamp(t))
-            current_time = get_arrival_timestamp(next_task)
-            # Don't use continue here, let it check available again
-            available = [t for t in remaining if get_arrival_timestamp(t) <= current_time]
+def aging_priority_schedule(task_list: List[Task]) -> List[Dict[str, Any]]:
+    """Priority scheduling where waiting tasks gain importance over time."""
+    return schedule_tasks(task_list, 'ps-aging')
 
-        if available:
-            # Select task with earliest deadline
-            selected = min(available, key=lambda t: get_deadline_timestamp(t))
 
-            # Schedule the task
-            entries = create_schedule_entries(current_time, selected.duration, selected.taskName)
-            schedule.extend(entries)
-
-            # Update time and remove from remaining
-            current_time = current_time + timedelta(hours=selected.duration)
-            remaining.remove(selected)
-
-    return schedule
+def mlfq_schedule(task_list: List[Task], time_quantum: int) -> List[Dict[str, Any]]:
+    """Multi-level feedback queue scheduling (time_quantum: top-level quantum)."""
+    return schedule_tasks(task_list, 'mlfq', time_quantum)
 
 
 def merge_consecutive(schedule: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
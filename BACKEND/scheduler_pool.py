@@ -0,0 +1,165 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from starlette.concurrency import run_in_threadpool
+
+from observability import span
+from scheduler import TaskTable, prepare_tasks, schedule_table
+from work_calendar import WorkCalendar
+
+# Process pool configuration (override through environment variables)
+SCHEDULER_POOL_WORKERS = int(os.getenv("SCHEDULER_POOL_WORKERS", str(min(4, os.cpu_count() or 1))))
+SCHEDULER_INLINE_THRESHOLD = int(os.getenv("SCHEDULER_INLINE_THRESHOLD", "200"))  # tasks
+SCHEDULER_MAX_PENDING = int(os.getenv("SCHEDULER_MAX_PENDING", str(2 * SCHEDULER_POOL_WORKERS)))
+SCHEDULER_QUEUE_TIMEOUT = float(os.getenv("SCHEDULER_QUEUE_TIMEOUT", "10"))  # seconds
+DISCONNECT_POLL_INTERVAL = 0.25
+
+class SchedulerBusy(Exception):
+    """Raised when the pool's pending queue stays full for SCHEDULER_QUEUE_TIMEOUT."""
+
+
+def _run_table(table: TaskTable, algo: str, time_quantum: int, workers: int,
+               calendar: Optional[WorkCalendar]) -> List[Dict[str, Any]]:
+    # Executed inside a pool process
+    return schedule_table(table, algo, time_quantum, workers, calendar)
+
+
+def _warm() -> None:
+    # First job of every pool process: unpickling it already imports scheduler; this also imports
+    # the modules behind map() jobs (numpy with robustness) and runs the engines once on a tiny
+    # table, so the first real request doesn't pay for either
+    import optimizer, robustness  # noqa: F401
+    table = TaskTable([1, 2], ["a", "b"], [2, 1], [0, 1], [4, 4], [2, 1])
+    for algo in ("fcfs", "rr", "srtf"):
+        schedule_table(table, algo, 1, 1, None)
+
+
+class SchedulerPool:
+    """
+    Warm process pool for large scheduling runs.
+
+    Requests at or below the inline threshold run on the server threadpool;
+    larger ones go to a worker process so they do not hold the GIL the
+    event loop and the I/O-bound endpoints need. At most `max_pending`
+    jobs are queued or running; further callers wait (and give up with
+    SchedulerBusy after `queue_timeout`).
+    """
+
+    def __init__(self, workers: int = SCHEDULER_POOL_WORKERS,
+                 inline_threshold: int = SCHEDULER_INLINE_THRESHOLD,
+                 max_pending: int = SCHEDULER_MAX_PENDING,
+                 queue_timeout: float = SCHEDULER_QUEUE_TIMEOUT):
+        self.workers = max(1, workers)
+        self.inline_threshold = inline_threshold
+        self.max_pending = max(1, max_pending)
+        self.queue_timeout = queue_timeout
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.slots: Optional[asyncio.Semaphore] = None
+
+    def start(self) -> None:
+        """Create the pool and spawn its processes up front (call from the running event loop)."""
+        if self.executor is not None:
+            return
+        # spawn: the server process has threads and an event loop, which fork does not copy safely
+        self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        # Start every process now but do not wait for them to finish importing, which would
+        # hold up the server's startup; jobs submitted meanwhile simply queue behind _warm
+        for _ in range(self.workers):
+            self.executor.submit(_warm)
+        self.slots = asyncio.Semaphore(self.max_pending)
+
+    def shutdown(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    async def run(self, tasks: Union[list, TaskTable], algo: str, time_quantum: int,
+                  is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+                  workers: int = 1, calendar: Optional[WorkCalendar] = None,
+                  tick: int = 60) -> Optional[List[Dict[str, Any]]]:
+        """
+        Schedule a task list, offloading large ones to the process pool.
+
+        Args:
+            tasks: Task models or an already prepared TaskTable
+            tick: Resolution in minutes to prepare Task models at
+            algo, time_quantum, workers, calendar: Passed to schedule_tasks
+            is_disconnected: Async callable polled while waiting; if it returns
+                True the job is cancelled (if not yet started) and None returned
+
+        Returns:
+            The schedule, or None if the client went away
+        """
+        table = tasks if isinstance(tasks, TaskTable) else await run_in_threadpool(prepare_tasks, tasks, tick)
+        if len(table) <= self.inline_threshold or self.executor is None:
+            with span("schedule_simulation"):
+                return await run_in_threadpool(schedule_table, table, algo, time_quantum, workers, calendar)
+
+        try:
+            with span("schedule_queue"):
+                await asyncio.wait_for(self.slots.acquire(), self.queue_timeout)
+        except asyncio.TimeoutError:
+            raise SchedulerBusy(f"{self.max_pending} scheduling jobs already pending")
+
+        with span("schedule_simulation"):
+            return await self._run_in_pool(table, algo, time_quantum, workers, calendar, is_disconnected)
+
+    async def map(self, fn: Callable, jobs: List[tuple]) -> List[Any]:
+        """
+        Run fn(*args) for every job in the pool, spread over its processes.
+
+        Each job takes a pending slot as it is submitted (so a batch can never
+        hold slots it is not using), raising SchedulerBusy like run(). If the
+        caller is cancelled, jobs that have not started yet are dropped.
+
+        Args:
+            fn: Module-level (picklable) function
+            jobs: Argument tuples, one per call
+
+        Returns:
+            Results in job order
+        """
+        submitted = []
+        try:
+            for args in jobs:
+                try:
+                    await asyncio.wait_for(self.slots.acquire(), self.queue_timeout)
+                except asyncio.TimeoutError:
+                    raise SchedulerBusy(f"{self.max_pending} scheduling jobs already pending")
+                submitted.append(self._submit(fn, *args))
+            return list(await asyncio.gather(*(asyncio.wrap_future(job) for job in submitted)))
+        except BaseException:
+            for job in submitted:
+                job.cancel()
+            raise
+
+    def _submit(self, fn: Callable, *args):
+        loop = asyncio.get_running_loop()
+        job = self.executor.submit(fn, *args)
+        # The slot is held until the process is actually free, even if the caller gave up
+        job.add_done_callback(lambda _: loop.call_soon_threadsafe(self.slots.release))
+        return job
+
+    async def _run_in_pool(self, table: TaskTable, algo: str, time_quantum: int, workers: int,
+                           calendar: Optional[WorkCalendar],
+                           is_disconnected: Optional[Callable[[], Awaitable[bool]]]) -> Optional[List[Dict[str, Any]]]:
+        # TaskTable is a handful of flat lists (and WorkCalendar a few small ones), so both pickle compactly
+        job = self._submit(_run_table, table, algo, time_quantum, workers, calendar)
+        future = asyncio.wrap_future(job)
+        if is_disconnected is None:
+            return await future
+        while True:
+            done, _ = await asyncio.wait({future}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return future.result()
+            if await is_disconnected():
+                # Queued jobs are dropped; a job already running finishes in its process
+                job.cancel()
+                return None
+
+
+scheduler_pool = SchedulerPool()
@@ -0,0 +1,148 @@
+"""
+Production entry point for the backend.
+
+    python serve.py                    # WEB_WORKERS processes on HOST:PORT
+    python serve.py --workers 8 --port 8000 --threads 64
+
+On Linux/macOS this runs gunicorn with uvicorn workers and `preload_app`, so
+main.py and the XGBoost models are loaded once in the master and shared
+copy-on-write by every worker. `kill -HUP <master pid>` gracefully reloads:
+the models are re-read from disk and workers are replaced one by one.
+
+Without gunicorn (Windows, or not installed) it falls back to uvicorn's own
+multi-process mode, where every worker loads the models itself.
+
+Environment:
+    HOST, PORT            Bind address (default 127.0.0.1:8000)
+    WEB_WORKERS           Worker processes (default: CPU count)
+    THREADPOOL_SIZE       Threads per worker for sync endpoints (default 40)
+    SCHEDULER_POOL_WORKERS
+                          Scheduler processes per worker (default: CPU count / workers,
+                          at least 1); every worker starts its own pool
+    WEB_TIMEOUT           Worker timeout / graceful shutdown seconds (default 120)
+
+Metrics from all workers are aggregated on /metrics through
+PROMETHEUS_MULTIPROC_DIR (a temporary directory unless set).
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+
+
+def default_workers() -> int:
+    return int(os.getenv("WEB_WORKERS", multiprocessing.cpu_count()))
+
+
+def shared_state_env(workers: int) -> None:
+    # Must be set before main.py (session_store, prometheus_client) is imported
+    if workers > 1:
+        os.environ.setdefault("SESSION_SHARED", "1")
+        if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+            os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="task_manager_metrics_")
+
+
+def scheduler_pool_env(workers: int) -> None:
+    # Every web worker starts its own scheduler pool: split the cores between them rather
+    # than each starting min(4, CPU count) processes
+    os.environ.setdefault("SCHEDULER_POOL_WORKERS", str(max(1, multiprocessing.cpu_count() // max(1, workers))))
+
+
+def post_fork(server, worker):
+    """Gunicorn hook: give each worker its own SQLite connections."""
+    from session_store import session_store
+    from storage import storage
+    session_store.after_fork()
+    storage.after_fork()
+
+
+def child_exit(server, worker):
+    """Gunicorn hook: drop the metric files of a dead worker."""
+    from observability import PROMETHEUS_AVAILABLE
+    if PROMETHEUS_AVAILABLE and os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+        multiprocess.mark_process_dead(worker.pid)
+
+
+def on_reload(server):
+    """Gunicorn hook (SIGHUP): re-read the model files before new workers fork."""
+    import inference
+    if inference.reload_models():
+        server.log.info("Reloaded XGBoost models")
+
+
+def run_gunicorn(host: str, port: int, workers: int, timeout: int) -> None:
+    from gunicorn.app.base import BaseApplication
+
+    try:
+        from uvicorn_worker import UvicornWorker  # uvicorn >= 0.30 moved the worker here
+        worker_class = "uvicorn_worker.UvicornWorker"
+    except ImportError:
+        worker_class = "uvicorn.workers.UvicornWorker"
+
+    import inference
+    from main import app
+    inference.preload()
+
+    class StandaloneApplication(BaseApplication):
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+    StandaloneApplication(app, {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": worker_class,
+        "preload_app": True,
+        "timeout": timeout,
+        "graceful_timeout": timeout,
+        "keepalive": 5,
+        "post_fork": post_fork,
+        "child_exit": child_exit,
+        "on_reload": on_reload,
+    }).run()
+
+
+def run_uvicorn(host: str, port: int, workers: int, timeout: int) -> None:
+    import uvicorn
+    uvicorn.run("main:app", host=host, port=port, workers=workers,
+                timeout_graceful_shutdown=timeout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the task manager backend")
+    parser.add_argument("--host", default=os.getenv("HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--threads", type=int, default=None,
+                        help="threadpool size per worker (THREADPOOL_SIZE)")
+    parser.add_argument("--timeout", type=int, default=int(os.getenv("WEB_TIMEOUT", "120")))
+    args = parser.parse_args()
+
+    if args.threads is not None:
+        os.environ["THREADPOOL_SIZE"] = str(args.threads)
+    shared_state_env(args.workers)
+    scheduler_pool_env(args.workers)
+
+    if sys.platform != "win32":
+        try:
+            import gunicorn  # noqa: F401
+        except ImportError:
+            print("gunicorn not installed, falling back to uvicorn workers")
+        else:
+            run_gunicorn(args.host, args.port, args.workers, args.timeout)
+            return
+    run_uvicorn(args.host, args.port, args.workers, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
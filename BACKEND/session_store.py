@@ -0,0 +1,148 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+SESSION_CACHE_SIZE = int(os.getenv("SESSION_CACHE_SIZE", "256"))
+SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", "sessions.db")
+# Set when several server processes share the database (see serve.py)
+SESSION_SHARED = os.getenv("SESSION_SHARED", "0") == "1"
+# Sessions untouched for this long are forgotten (0 = never)
+SESSION_TTL_HOURS = float(os.getenv("SESSION_TTL_HOURS", "168"))
+
+
+def diff_tasks(old: List[Dict], new: List[Dict]) -> Dict:
+    """
+    Compute a splice delta turning `old` into `new`.
+
+    The agent only appends or rewrites trailing tasks, so the delta keeps the
+    common prefix and replaces the tail: new == old[:truncate] + append.
+    """
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    return {"truncate": prefix, "append": new[prefix:]}
+
+
+def apply_delta(tasks: List[Dict], delta: Dict) -> List[Dict]:
+    """Apply a splice delta produced by diff_tasks."""
+    truncate = max(0, min(int(delta.get("truncate", len(tasks))), len(tasks)))
+    return tasks[:truncate] + list(delta.get("append") or [])
+
+
+class SessionStore:
+    """
+    Per-session structured task summaries.
+
+    Hot sessions live in an in-memory LRU; sessions evicted from it are
+    spilled to SQLite and promoted back on their next access. In shared mode
+    (multiple worker processes) SQLite is the source of truth: writes go
+    straight through and reads never trust another process's stale cache.
+    Sessions not written for `ttl_hours` are unknown again; their rows are
+    deleted whenever sessions are spilled.
+    """
+
+    def __init__(self, capacity: int = SESSION_CACHE_SIZE, db_path: str = SESSION_DB_PATH,
+                 shared: bool = SESSION_SHARED, ttl_hours: float = SESSION_TTL_HOURS):
+        self.capacity = max(1, capacity)
+        self.shared = shared
+        self.ttl = ttl_hours * 3600
+        self.cache: "OrderedDict[str, Tuple[List[Dict], float]]" = OrderedDict()  # id -> (tasks, written at)
+        self.lock = threading.Lock()
+        self.db_path = db_path
+        self.conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, tasks TEXT NOT NULL, updated_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions (updated_at)")
+        conn.commit()
+        return conn
+
+    def after_fork(self) -> None:
+        """Open a fresh connection in a forked worker (SQLite handles must not cross fork)."""
+        self.lock = threading.Lock()
+        self.cache.clear()
+        self.conn = self._connect()
+
+    @staticmethod
+    def new_session_id() -> str:
+        return uuid.uuid4().hex
+
+    def get(self, session_id: str) -> Optional[List[Dict]]:
+        """Return the session's task list, or None if the session is unknown."""
+        with self.lock:
+            entry = None if self.shared else self.cache.get(session_id)
+            if entry is not None:
+                if entry[1] < self._cutoff():
+                    del self.cache[session_id]
+                    return None
+                self.cache.move_to_end(session_id)
+                return list(entry[0])
+
+            row = self.conn.execute(
+                "SELECT tasks, updated_at FROM sessions WHERE session_id = ? AND updated_at >= ?",
+                (session_id, self._cutoff())
+            ).fetchone()
+            if row is None:
+                return None
+            tasks = json.loads(row[0])
+            self._insert(session_id, tasks, row[1])
+            return list(tasks)
+
+    def put(self, session_id: str, tasks: List[Dict]) -> None:
+        """Store the full task list for a session."""
+        with self.lock:
+            written = time.time()
+            self._insert(session_id, list(tasks), written)
+            if self.shared:
+                self._spill([(session_id, (tasks, written))])
+
+    def delete(self, session_id: str) -> None:
+        with self.lock:
+            self.cache.pop(session_id, None)
+            self.conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self.conn.commit()
+
+    def flush(self) -> None:
+        """Spill every cached session to SQLite (e.g. on shutdown)."""
+        with self.lock:
+            self._spill(list(self.cache.items()))
+
+    def _insert(self, session_id: str, tasks: List[Dict], written: float) -> None:
+        # Caller holds self.lock
+        self.cache[session_id] = (tasks, written)
+        self.cache.move_to_end(session_id)
+        evicted = []
+        while len(self.cache) > self.capacity:
+            evicted.append(self.cache.popitem(last=False))
+        if evicted:
+            self._spill(evicted)
+
+    def _spill(self, items) -> None:
+        # Caller holds self.lock; items are (session id, (tasks, written at))
+        self.conn.executemany(
+            "INSERT INTO sessions (session_id, tasks, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET tasks = excluded.tasks, updated_at = excluded.updated_at",
+            [(session_id, json.dumps(tasks), written) for session_id, (tasks, written) in items]
+        )
+        if self.ttl > 0:
+            self.conn.execute("DELETE FROM sessions WHERE updated_at < ?", (self._cutoff(),))
+        self.conn.commit()
+
+    def _cutoff(self) -> float:
+        # Oldest updated_at still alive
+        return time.time() - self.ttl if self.ttl > 0 else float("-inf")
+
+
+session_store = SessionStore()
@@ -0,0 +1,165 @@
+"""
+Backend cold-start profile.
+
+    python startup_profile.py imports                 # -X importtime report for `import main`
+    python startup_profile.py imports --module inference --top 40
+    python startup_profile.py first-response          # spawn uvicorn, time the first requests
+    python startup_profile.py first-response --budget-ms 300 --runs 3
+
+`imports` runs a fresh interpreter with -X importtime and lists the modules
+with the largest cumulative and self import times, plus how long each direct
+import of the profiled module took.
+
+`first-response` starts `uvicorn main:app`, waits until it answers, and
+reports the time from process start until it is ready and the latency of the
+first `/` and `/api/run_scheduler` requests. It exits 1 when either of those
+latencies exceeds --budget-ms.
+"""
+import argparse
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+SCHEDULER_PAYLOAD = {
+    "algo": "srtf",
+    "tq": 2,
+    "task_list": [
+        {"id": 1, "taskName": "Write report", "duration": 3,
+         "arrivalTime": {"hrs": 9, "date": "2025-09-27"}, "deadlineTime": {"hrs": 17, "date": "2025-09-27"},
+         "importance": "High"},
+        {"id": 2, "taskName": "Call vendor", "duration": 1,
+         "arrivalTime": {"hrs": 10, "date": "2025-09-27"}, "deadlineTime": {"hrs": 12, "date": "2025-09-27"},
+         "importance": "Medium"},
+    ],
+}
+
+
+def isolated_env() -> Dict[str, str]:
+    """Environment for a throwaway backend with its own SQLite files."""
+    env = dict(os.environ)
+    scratch = tempfile.mkdtemp(prefix="startup_profile_")
+    env.setdefault("STORAGE_DB_PATH", os.path.join(scratch, "storage.db"))
+    env.setdefault("SESSION_DB_PATH", os.path.join(scratch, "sessions.db"))
+    return env
+
+
+def import_times(module: str) -> List[Dict]:
+    """Parse `python -X importtime -c "import <module>"` into {module, self_us, cumulative_us, depth}."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=HERE, env=isolated_env(), capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append({"module": name, "self_us": int(self_us), "cumulative_us": int(cumulative_us),
+                         "depth": len(indent) // 2})
+    return rows
+
+
+def report_imports(module: str, top: int) -> None:
+    rows = import_times(module)
+    target = next((r for r in reversed(rows) if r["module"] == module and r["depth"] == 0), None)
+    if target is None:
+        raise SystemExit(f"{module} not found in the importtime output (already imported by site?)")
+    print(f"import {module}: {target['cumulative_us'] / 1e3:.1f} ms total\n")
+
+    # Direct imports of the profiled module are the depth-1 rows preceding it
+    direct = [r for r in rows[:rows.index(target)] if r["depth"] == 1]
+    print(f"{'direct import':40s} {'cumulative ms':>14s}")
+    for r in sorted(direct, key=lambda r: -r["cumulative_us"])[:top]:
+        print(f"{r['module']:40s} {r['cumulative_us'] / 1e3:14.1f}")
+
+    print(f"\n{'module (any depth)':40s} {'self ms':>10s} {'cumulative ms':>14s}")
+    for r in sorted(rows, key=lambda r: -r["self_us"])[:top]:
+        print(f"{r['module']:40s} {r['self_us'] / 1e3:10.1f} {r['cumulative_us'] / 1e3:14.1f}")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def first_response(timeout: float) -> Dict[str, float]:
+    """Start a backend and time readiness plus its first `/` and `/api/run_scheduler` requests (ms)."""
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    began = time.perf_counter()
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port),
+                               "--log-level", "warning"], cwd=HERE, env=isolated_env())
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            if server.poll() is not None:
+                raise SystemExit(f"backend exited with code {server.returncode}")
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                    break
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise SystemExit(f"backend did not come up within {timeout:.0f}s")
+                time.sleep(0.01)
+        ready = time.perf_counter() - began
+
+        with httpx.Client(base_url=base_url, timeout=timeout) as client:
+            start = time.perf_counter()
+            client.get("/").raise_for_status()
+            root = time.perf_counter() - start
+
+            start = time.perf_counter()
+            client.post("/api/run_scheduler", json=SCHEDULER_PAYLOAD).raise_for_status()
+            scheduler = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+    return {"ready": ready * 1e3, "root": root * 1e3, "run_scheduler": scheduler * 1e3}
+
+
+def report_first_response(runs: int, budget_ms: float, timeout: float) -> int:
+    print(f"{'run':>4s} {'ready ms':>10s} {'first / ms':>12s} {'first run_scheduler ms':>24s}")
+    worst: Optional[float] = None
+    for i in range(runs):
+        result = first_response(timeout)
+        print(f"{i:4d} {result['ready']:10.1f} {result['root']:12.1f} {result['run_scheduler']:24.1f}")
+        slowest = max(result["root"], result["run_scheduler"])
+        worst = slowest if worst is None else max(worst, slowest)
+    over = worst is not None and worst > budget_ms
+    print(f"slowest first response {worst:.1f} ms, budget {budget_ms:.0f} ms" + ("  OVER BUDGET" if over else ""))
+    return 1 if over else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend startup profile")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imports_p = sub.add_parser("imports", help="-X importtime report")
+    imports_p.add_argument("--module", default="main")
+    imports_p.add_argument("--top", type=int, default=25)
+
+    first_p = sub.add_parser("first-response", help="time-to-first-response of a fresh server")
+    first_p.add_argument("--runs", type=int, default=1)
+    first_p.add_argument("--budget-ms", type=float, default=300.0)
+    first_p.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    if args.command == "imports":
+        report_imports(args.module, args.top)
+    else:
+        sys.exit(report_first_response(args.runs, args.budget_ms, args.timeout))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+STORAGE_DB_PATH = os.getenv("STORAGE_DB_PATH", "task_manager.db")
+# Stored schedules kept; saving one more drops the oldest (0 = keep everything)
+SCHEDULE_RETENTION = int(os.getenv("SCHEDULE_RETENTION", "100"))
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    task_name TEXT NOT NULL,
+    duration INTEGER NOT NULL,
+    arrival_date TEXT NOT NULL,
+    arrival_hrs INTEGER NOT NULL,
+    arrival_at INTEGER NOT NULL,
+    deadline_date TEXT NOT NULL,
+    deadline_hrs INTEGER NOT NULL,
+    deadline_at INTEGER NOT NULL,
+    importance TEXT NOT NULL,
+    arrival_mins INTEGER NOT NULL DEFAULT 0,
+    deadline_mins INTEGER NOT NULL DEFAULT 0,
+    depends_on TEXT NOT NULL DEFAULT ''  -- comma-separated task ids
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_arrival ON tasks (arrival_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks (deadline_at);
+
+CREATE TABLE IF NOT EXISTS schedules (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    algo TEXT NOT NULL,
+    tq INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    num_segments INTEGER NOT NULL,
+    workers INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE TABLE IF NOT EXISTS segments (
+    schedule_id INTEGER NOT NULL REFERENCES schedules (id) ON DELETE CASCADE,
+    seq INTEGER NOT NULL,
+    task TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    "end" INTEGER NOT NULL,
+    date TEXT NOT NULL,
+    worker INTEGER,
+    PRIMARY KEY (schedule_id, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_segments_date ON segments (schedule_id, date, seq);
+"""
+
+
+def to_epoch_hours(date_str: str, hrs: int) -> int:
+    """Convert a YYYY-MM-DD date and hour to hours since 1970-01-01."""
+    return (date.fromisoformat(date_str).toordinal() - EPOCH_ORDINAL) * 24 + hrs
+
+
+def current_epoch_hours() -> int:
+    now = datetime.now()
+    return to_epoch_hours(now.strftime("%Y-%m-%d"), now.hour)
+
+
+class Storage:
+    """
+    SQLite (WAL) persistence for tasks and generated schedule segments.
+
+    Each thread gets its own connection so FastAPI's threadpool can read
+    concurrently while a single writer commits.
+    """
+
+    def __init__(self, db_path: str = STORAGE_DB_PATH, retention: int = SCHEDULE_RETENTION):
+        self.db_path = db_path
+        self.retention = retention
+        self.local = threading.local()
+        conn = self._conn()
+        conn.executescript(SCHEMA)
+        self._migrate(conn)
+        conn.commit()
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Add the columns newer versions introduced to a database created by an older one."""
+        for table, column, definition in [("schedules", "workers", "INTEGER NOT NULL DEFAULT 1"),
+                                          ("segments", "worker", "INTEGER"),
+                                          ("tasks", "arrival_mins", "INTEGER NOT NULL DEFAULT 0"),
+                                          ("tasks", "deadline_mins", "INTEGER NOT NULL DEFAULT 0"),
+                                          ("tasks", "depends_on", "TEXT NOT NULL DEFAULT ''")]:
+            if column not in {r["name"] for r in conn.execute(f"PRAGMA table_info({table})")}:
+                try:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                except sqlite3.OperationalError:
+                    pass  # another worker process added it first
+
+    def after_fork(self) -> None:
+        """Drop connections inherited from the parent process (SQLite handles must not cross fork)."""
+        self.local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self.local.conn = conn
+        return conn
+
+    # ---------------- Tasks ----------------
+
+    @staticmethod
+    def _task_row(task) -> tuple:
+        return (
+            task.id,
+            task.taskName,
+            task.duration,
+            task.arrivalTime.date,
+            task.arrivalTime.hrs,
+            to_epoch_hours(task.arrivalTime.date, task.arrivalTime.hrs),
+            task.deadlineTime.date,
+            task.deadlineTime.hrs,
+            to_epoch_hours(task.deadlineTime.date, task.deadlineTime.hrs),
+            task.importance,
+            task.arrivalTime.mins,
+            task.deadlineTime.mins,
+            ",".join(map(str, getattr(task, "dependsOn", None) or ())),
+        )
+
+    @staticmethod
+    def _task_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        task = {
+            "id": row["id"],
+            "taskName": row["task_name"],
+            "duration": row["duration"],
+            "arrivalTime": Storage._time_dict(row["arrival_hrs"], row["arrival_date"], row["arrival_mins"]),
+            "deadlineTime": Storage._time_dict(row["deadline_hrs"], row["deadline_date"], row["deadline_mins"]),
+            "importance": row["importance"],
+        }
+        if row["depends_on"]:
+            task["dependsOn"] = [int(i) for i in row["depends_on"].split(",")]
+        return task
+
+    @staticmethod
+    def _time_dict(hrs: int, date_str: str, mins: int) -> Dict[str, Any]:
+        # mins only when set, so whole-hour tasks keep their original shape
+        return {"hrs": hrs, "date": date_str, "mins": mins} if mins else {"hrs": hrs, "date": date_str}
+
+    def upsert_tasks(self, tasks: Iterable) -> int:
+        """Insert or replace tasks (pydantic/dataclass Task objects)."""
+        conn = self._conn()
+        rows = [self._task_row(t) for t in tasks]
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO tasks (id, task_name, duration, arrival_date, arrival_hrs, arrival_at, "
+                "deadline_date, deadline_hrs, deadline_at, importance, arrival_mins, deadline_mins, "
+                "depends_on) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def get_task(self, task_id: int) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        return self._task_dict(row) if row else None
+
+    def delete_task(self, task_id: int) -> bool:
+        conn = self._conn()
+        with conn:
+            cur = conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        return cur.rowcount > 0
+
+    def list_tasks(self, limit: int = 100, offset: int = 0,
+                   arrival_from: Optional[int] = None, arrival_to: Optional[int] = None,
+                   deadline_from: Optional[int] = None, deadline_to: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Page through tasks, optionally restricted to arrival / deadline ranges.
+
+        Args:
+            limit, offset: Page window (ordered by arrival, then id)
+            arrival_from, arrival_to: Epoch-hour range on arrival (inclusive)
+            deadline_from, deadline_to: Epoch-hour range on deadline (inclusive)
+
+        Returns:
+            List of task dicts in the Task JSON shape
+        """
+        clauses, params = [], []
+        for column, low, high in (("arrival_at", arrival_from, arrival_to),
+                                  ("deadline_at", deadline_from, deadline_to)):
+            if low is not None:
+                clauses.append(f"{column} >= ?")
+                params.append(low)
+            if high is not None:
+                clauses.append(f"{column} <= ?")
+                params.append(high)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "deadline_at, id" if deadline_from is not None or deadline_to is not None else "arrival_at, id"
+        rows = self._conn().execute(
+            f"SELECT * FROM tasks {where} ORDER BY {order} LIMIT ? OFFSET ?",
+            (*params, limit, offset)
+        ).fetchall()
+        return [self._task_dict(r) for r in rows]
+
+    def tasks_due_within(self, hours: int, now: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Tasks whose deadline falls in [now, now + hours]."""
+        now = current_epoch_hours() if now is None else now
+        return self.list_tasks(limit=-1, deadline_from=now, deadline_to=now + hours)
+
+    # ---------------- Schedules ----------------
+
+    def save_schedule(self, algo: str, tq: int, segments: List[Dict[str, Any]], workers: int = 1) -> int:
+        """
+        Persist a generated schedule and return its id.
+
+        Only the latest `retention` schedules are kept: older ones (and their
+        segments) are deleted in the same transaction, so paged and windowed
+        runs cannot grow the database without bound.
+        """
+        conn = self._conn()
+        with conn:
+            cur = conn.execute(
+                "INSERT INTO schedules (algo, tq, created_at, num_segments, workers) VALUES (?, ?, ?, ?, ?)",
+                (algo, tq, time.time(), len(segments), workers)
+            )
+            schedule_id = cur.lastrowid
+            conn.executemany(
+                'INSERT INTO segments (schedule_id, seq, task, start, "end", date, worker) '
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(schedule_id, seq, s["task"], s["start"], s["end"], s["date"], s.get("worker"))
+                 for seq, s in enumerate(segments)]
+            )
+            if self.retention > 0:
+                # ids only grow (AUTOINCREMENT), so the oldest are the lowest
+                conn.execute("DELETE FROM schedules WHERE id <= ?", (schedule_id - self.retention,))
+        return schedule_id
+
+    def get_schedule(self, schedule_id: int) -> Optional[Dict[str, Any]]:
+        row = self._conn().execute(
+            "SELECT s.*, MIN(g.date) AS first_date, MAX(g.date) AS last_date "
+            "FROM schedules s LEFT JOIN segments g ON g.schedule_id = s.id WHERE s.id = ? GROUP BY s.id",
+            (schedule_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "scheduleId": row["id"],
+            "algo": row["algo"],
+            "tq": row["tq"],
+            "workers": row["workers"],
+            "createdAt": row["created_at"],
+            "numSegments": row["num_segments"],
+            "firstDate": row["first_date"],
+            "lastDate": row["last_date"],
+        }
+
+    def has_schedule(self, schedule_id: int) -> bool:
+        return self._conn().execute("SELECT 1 FROM schedules WHERE id = ?", (schedule_id,)).fetchone() is not None
+
+    def delete_schedule(self, schedule_id: int) -> bool:
+        conn = self._conn()
+        with conn:
+            cur = conn.execute("DELETE FROM schedules WHERE id = ?", (schedule_id,))
+        return cur.rowcount > 0
+
+    def segment_dates(self, schedule_id: int) -> List[Dict[str, Any]]:
+        """Dates covered by a schedule with their segment counts (served from the date index)."""
+        rows = self._conn().execute(
+            "SELECT date, COUNT(*) AS count FROM segments WHERE schedule_id = ? GROUP BY date ORDER BY date",
+            (schedule_id,)
+        ).fetchall()
+        return [dict(r) for r in rows]
+
+    def segments_window(self, schedule_id: int, from_date: Optional[str] = None, to_date: Optional[str] = None,
+                        cursor: Optional[str] = None, limit: int = 500) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Keyset-paginated segments of a schedule within a date window.
+
+        Args:
+            schedule_id: Stored schedule id
+            from_date, to_date: Inclusive YYYY-MM-DD window (open-ended if None)
+            cursor: Opaque cursor returned by the previous page
+            limit: Page size
+
+        Returns:
+            Tuple of (segments, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            ValueError: The cursor is not one this method returned
+        """
+        after_date, after_seq = "", -1
+        if cursor:
+            after_date, _, seq = cursor.rpartition("|")
+            try:
+                date.fromisoformat(after_date)
+                after_seq = int(seq)
+            except ValueError:
+                raise ValueError(f"Invalid cursor: {cursor!r}") from None
+        rows = self._conn().execute(
+            'SELECT seq, task, start, "end", date, worker FROM segments '
+            "WHERE schedule_id = ? AND date >= ? AND date <= ? AND (date, seq) > (?, ?) "
+            "ORDER BY date, seq LIMIT ?",
+            (schedule_id, from_date or "", to_date or "9999-12-31", after_date, after_seq, limit + 1)
+        ).fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = f"{rows[-1]['date']}|{rows[-1]['seq']}"
+        segments = [{"task": r["task"], "start": r["start"], "end": r["end"], "date": r["date"]} for r in rows]
+        for segment, row in zip(segments, rows):
+            if row["worker"] is not None:
+                segment["worker"] = row["worker"]
+        return segments, next_cursor
+
+storage = Storage()
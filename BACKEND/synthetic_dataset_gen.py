@@ -1,18 +1,20 @@
-import random, numpy as np, pandas as pd
+import random, numpy as np
 
-import scipy
+# scipy.stats and pandas are imported where they are used: they take most of
+# a second to import and the backend only needs them once a prediction runs
 
 from scheduler import schedule_tasks
 from datetime import datetime
 
-ALGOS = ["fcfs", "sjf", "srtf", "rr", "ps", "edf"]
+# Class labels of the algorithm model; new policies go at the end so existing labels keep their index
+ALGOS = ["fcfs", "sjf", "srtf", "rr", "ps", "edf", "mlfq", "ps-aging"]
 
 
 import random
 from datetime import datetime, timedelta
 from models import Task, ArrivalTime, DeadlineTime  # adjust import path if needed
 
-def generate_random_task_list(num_tasks, start_date="2025-09-27"):
+def generate_random_task_list(num_tasks, start_date="2025-09-27", horizon_days=3):
     tasks = []
     start_dt = datetime.strptime(start_date, "%Y-%m-%d")
 
@@ -21,8 +23,8 @@ def generate_random_task_list(num_tasks, start_date="2025-09-27"):
         duration = int(round(random.uniform(1, 10)))
 
 
-        # Random arrival date (within 3 days of start)
-        arrival_date_offset = random.randint(0, 2)
+        # Random arrival date (within horizon_days of start)
+        arrival_date_offset = random.randint(0, horizon_days - 1)
         arrival_dt = start_dt + timedelta(days=arrival_date_offset)
 
         # Random arrival time (0–23)
@@ -62,6 +64,12 @@ def generate_random_task_list(num_tasks, start_date="2025-09-27"):
     return tasks
 
 
+def generate_preset_task_list(preset, num_tasks):
+    """Task list drawn from a workload_gen scenario preset (e.g. "bursty_morning")."""
+    from workload_gen import generate_preset, to_tasks
+    return to_tasks(generate_preset(preset, num_tasks, seed=random.getrandbits(32)))
+
+
 
 
 import numpy as np
@@ -69,10 +77,10 @@ from datetime import datetime
 
 from datetime import datetime
 import numpy as np
-import scipy.stats
 
 def extract_batch_features(task_list):
     """Extract optimized scheduling features from a list of Task objects."""
+    import scipy.stats
 
     durations = [t.duration for t in task_list]
     arrivals = [t.arrivalTime.hrs for t in task_list]
@@ -276,15 +284,16 @@ def score_schedule(schedule, task_list):
 
 
 
-def generate_dataset_algo(n_batches=1000):
+def generate_dataset_algo(n_batches=1000, preset=None):
+    import pandas as pd
     data = []
     for _ in range(n_batches):
         num_tasks = random.randint(4, 10)
-        tasks = generate_random_task_list(num_tasks)
+        tasks = generate_preset_task_list(preset, num_tasks) if preset else generate_random_task_list(num_tasks)
         features = extract_batch_features(tasks)
         best_algo, best_score = None, -float("inf")
         for algo in ALGOS:
-            if algo == "rr":
+            if algo in ("rr", "mlfq"):
                 for tq in [1, 2, 4, 6]:
                     schedule = schedule_tasks(tasks, algo, time_quantum=tq)
                     sc = score_schedule(schedule, tasks)
@@ -302,14 +311,15 @@ def generate_dataset_algo(n_batches=1000):
 
     return pd.DataFrame(data)
 
-def generate_dataset_tq(n_batches=1000):
+def generate_dataset_tq(n_batches=1000, preset=None):
+    import pandas as pd
     tq_values = [1, 2, 4, 6]
     tq_to_encoded = {tq: i for i, tq in enumerate(tq_values)}  # map to 0–3
 
     data = []
     for _ in range(n_batches):
         num_tasks = random.randint(4, 10)
-        tasks = generate_random_task_list(num_tasks)
+        tasks = generate_preset_task_list(preset, num_tasks) if preset else generate_random_task_list(num_tasks)
         features = extract_batch_features(tasks)
 
         best_score = -float("inf")
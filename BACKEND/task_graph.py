@@ -0,0 +1,116 @@
+"""
+Task dependency graphs.
+
+Tasks name their predecessors by id (Task.dependsOn). predecessor_lists turns
+that into per-task lists of predecessor indices, rejecting unknown ids and
+cycles, which is all the scheduler engines need: they keep an indegree
+counter per task and release a task once its last predecessor completes.
+
+critical_path is the classic CPM forward / backward pass over a topological
+order, with each task additionally unable to start before its arrival. All
+of it is O(V + E).
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+def predecessor_lists(ids: Sequence[int],
+                      depends_on: Sequence[Optional[Sequence[int]]]) -> Optional[List[List[int]]]:
+    """
+    Predecessor indices of every task, or None when no task has any.
+
+    Raises:
+        ValueError: A dependency on an unknown, duplicated or the task's own id, or a cycle
+    """
+    if not any(depends_on):
+        return None
+    index: Dict[int, int] = {}
+    duplicated = set()
+    for i, task_id in enumerate(ids):
+        if task_id in index:
+            duplicated.add(task_id)
+        index[task_id] = i
+
+    predecessors = []
+    for i, deps in enumerate(depends_on):
+        preds = []
+        for dep in deps or ():
+            if dep not in index:
+                raise ValueError(f"Task {ids[i]} depends on unknown task {dep}")
+            if dep in duplicated:
+                raise ValueError(f"Task {ids[i]} depends on task id {dep}, which is used more than once")
+            if index[dep] == i:
+                raise ValueError(f"Task {ids[i]} depends on itself")
+            preds.append(index[dep])
+        predecessors.append(preds)
+    topological_order(predecessors)  # raises on cycles
+    return predecessors
+
+
+def successor_lists(predecessors: List[List[int]]) -> List[List[int]]:
+    successors: List[List[int]] = [[] for _ in predecessors]
+    for i, preds in enumerate(predecessors):
+        for p in preds:
+            successors[p].append(i)
+    return successors
+
+
+def topological_order(predecessors: List[List[int]]) -> List[int]:
+    """Kahn's algorithm; ties keep list order. Raises ValueError on a cycle."""
+    indegree = [len(preds) for preds in predecessors]
+    successors = successor_lists(predecessors)
+    order = [i for i, d in enumerate(indegree) if d == 0]
+    for i in order:  # grows while iterating
+        for s in successors[i]:
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                order.append(s)
+    if len(order) < len(predecessors):
+        stuck = [i for i, d in enumerate(indegree) if d > 0]
+        raise ValueError(f"Dependency cycle among {len(stuck)} tasks (task indices {stuck[:10]})")
+    return order
+
+
+def critical_path(arrivals: Sequence[int], durations: Sequence[int],
+                  predecessors: List[List[int]]) -> Tuple[List[int], List[int], List[int]]:
+    """
+    CPM with unlimited workers: every task starts as early as its arrival and
+    predecessors allow; its latest start still keeps the project's earliest finish.
+
+    Returns:
+        (critical path as task indices first to last, earliest starts, latest starts);
+        slack is latest - earliest
+    """
+    n = len(arrivals)
+    if n == 0:
+        return [], [], []
+    successors = successor_lists(predecessors)
+    order = topological_order(predecessors)
+
+    earliest = [0] * n
+    for i in order:
+        start = arrivals[i]
+        for p in predecessors[i]:
+            if earliest[p] + durations[p] > start:
+                start = earliest[p] + durations[p]
+        earliest[i] = start
+    finishes = [earliest[i] + durations[i] for i in range(n)]
+    project_finish = max(finishes)
+
+    latest = [0] * n
+    for i in reversed(order):
+        finish = project_finish
+        for s in successors[i]:
+            if latest[s] < finish:
+                finish = latest[s]
+        latest[i] = finish - durations[i]
+
+    # Walk back from the task finishing last through the predecessors that held it up
+    path = [finishes.index(project_finish)]
+    while True:
+        i = path[-1]
+        binding = next((p for p in predecessors[i] if finishes[p] == earliest[i]), None)
+        if binding is None:
+            break
+        path.append(binding)
+    path.reverse()
+    return path, earliest, latest
@@ -0,0 +1,205 @@
+"""
+Regression checks for deadline feasibility and admission control.
+
+Run from BACKEND/: python -m pytest -q test_feasibility.py
+
+The incremental trackers are checked against a from-scratch EDF run after
+every change, and EDF itself against the tick-by-tick reference of
+test_scheduler, on random task sets (fixed seeds).
+"""
+import random
+from dataclasses import replace
+from typing import List, Optional
+
+import pytest
+
+import feasibility
+from feasibility import (FeasibilityTracker, ReleaseTracker, admit_tasks, check_feasibility, edf_finishes,
+                         effective_windows)
+from scheduler import TaskTable
+from test_scheduler import random_dag_tables, random_table, random_tables, reference_preemptive
+
+
+def edf_feasible(releases: List[int], durations: List[int], deadlines: List[int],
+                 depends: Optional[List[List[int]]] = None) -> bool:
+    releases, deadlines = effective_windows(releases, durations, deadlines, depends)
+    return all(f <= d for f, d in zip(edf_finishes(releases, durations, deadlines), deadlines))
+
+
+def greedy_admission(table: TaskTable, base: int) -> List[int]:
+    # Candidates in order, each kept if the committed tasks plus those kept so far stay EDF-feasible
+    admitted = list(range(base))
+    for i in range(base, len(table)):
+        chosen = admitted + [i]
+        if table.depends is not None:
+            if any(p not in chosen for p in table.depends[i]):
+                continue
+            position = {idx: pos for pos, idx in enumerate(chosen)}
+            depends = [[position[p] for p in table.depends[j]] for j in chosen]
+        else:
+            depends = None
+        if edf_feasible([table.arrivals[j] for j in chosen], [table.durations[j] for j in chosen],
+                        [table.deadlines[j] for j in chosen], depends):
+            admitted.append(i)
+    return admitted
+
+
+# ---------------- EDF ----------------
+
+def test_edf_finishes_matches_reference():
+    for table in random_tables(seed=40):
+        finish = [0] * len(table)
+        for idx, _, end in reference_preemptive(table, table.deadlines):
+            finish[idx] = max(finish[idx], end)
+        assert edf_finishes(table.arrivals, table.durations, table.deadlines) == finish
+
+
+def test_check_feasibility_reports_the_first_late_task():
+    # One person from 0: a (3h, due 4) then b (4h, due 5) finishes at 7, two hours late
+    table = TaskTable([1, 2], ["a", "b"], [3, 4], [0, 0], [4, 5], [2, 2])
+    report = check_feasibility(table)
+    assert not report["feasible"]
+    assert report["extraHours"] == 2
+    assert report["firstViolation"]["id"] == 2
+    assert report["firstViolation"]["lateHours"] == 2
+    assert report["firstViolation"]["finish"] == {"date": "1970-01-01", "hrs": 7}
+    assert check_feasibility(replace(table, deadlines=[4, 7])) == {"feasible": True, "extraHours": 0,
+                                                                    "firstViolation": None}
+
+
+def test_check_feasibility_tightens_deadlines_for_successors():
+    # b (due 10) needs a first, so a is effectively due at 10 - 4 = 6 and finishes at 5
+    table = TaskTable([1, 2], ["a", "b"], [5, 4], [0, 0], [20, 10], [2, 2], depends=[[], [0]])
+    assert check_feasibility(table)["feasible"]
+    # b due at 8 pulls a's deadline to 4: a is the first to run late, by an hour
+    report = check_feasibility(replace(table, deadlines=[20, 8]))
+    assert report["firstViolation"]["id"] == 1
+    assert report["firstViolation"]["lateHours"] == 1
+    assert report["extraHours"] == 1
+
+
+# ---------------- Trackers ----------------
+
+def test_feasibility_tracker_matches_edf():
+    rng = random.Random(41)
+    for _ in range(100):
+        now = rng.randint(0, 5)
+        tracker = FeasibilityTracker(now)
+        tasks = {}
+        for step in range(30):
+            if tasks and rng.random() < 0.3:
+                task_id = rng.choice(sorted(tasks))
+                tracker.remove(task_id)
+                del tasks[task_id]
+            else:
+                tasks[step] = (rng.randint(1, 6), rng.randint(now, now + 40))
+                tracker.add(step, *tasks[step])
+            ids = sorted(tasks)
+            work = [tasks[i][0] for i in ids]
+            deadlines = [tasks[i][1] for i in ids]
+            finishes = edf_finishes([now] * len(ids), work, deadlines)
+            late = [k for k in range(len(ids)) if finishes[k] > deadlines[k]]
+            assert len(tracker) == len(ids)
+            assert tracker.feasible() == (not late)
+            assert tracker.extra() == max([finishes[k] - deadlines[k] for k in late], default=0)
+            # Ties in deadline go to the task added first, which is also the smaller id here
+            expected = min(late, key=lambda k: (deadlines[k], ids[k]), default=None)
+            assert tracker.first_violation() == (None if expected is None else ids[expected])
+
+
+def test_feasibility_tracker_extend_matches_add():
+    rng = random.Random(42)
+    for _ in range(50):
+        tasks = [(i, rng.randint(1, 6), rng.randint(0, 40)) for i in range(rng.randint(1, 25))]
+        built, added = FeasibilityTracker(), FeasibilityTracker()
+        built.extend(tasks)
+        for task in tasks:
+            added.add(*task)
+        assert (built.feasible(), built.extra(), built.first_violation()) == \
+               (added.feasible(), added.extra(), added.first_violation())
+        with pytest.raises(ValueError):
+            built.add(*tasks[0])
+
+
+def test_release_tracker_matches_edf():
+    rng = random.Random(43)
+    for _ in range(80):
+        table = random_table(rng, rng.randint(1, 15))
+        tracker = ReleaseTracker(table.arrivals)
+        present = set()
+        for _ in range(40):
+            idx = rng.randrange(len(table))
+            if idx in present:
+                tracker.remove(idx)
+                present.remove(idx)
+            else:
+                tracker.add(idx, table.durations[idx], table.arrivals[idx], table.deadlines[idx])
+                present.add(idx)
+            chosen = sorted(present)
+            assert tracker.feasible() == edf_feasible([table.arrivals[i] for i in chosen],
+                                                      [table.durations[i] for i in chosen],
+                                                      [table.deadlines[i] for i in chosen])
+
+
+# ---------------- Admission ----------------
+
+def test_admission_is_greedy_in_candidate_order():
+    # Each candidate fits on its own, not both: the first one asked for wins
+    table = TaskTable([1, 2, 3], ["base", "x", "y"], [2, 3, 3], [0, 0, 0], [2, 6, 6], [2] * 3)
+    report = admit_tasks(table, 1)
+    assert (report["admitted"], report["rejected"]) == ([2], [3])
+    swapped = TaskTable([1, 3, 2], ["base", "y", "x"], [2, 3, 3], [0, 0, 0], [2, 6, 6], [2] * 3)
+    assert admit_tasks(swapped, 1)["admitted"] == [3]
+
+
+@pytest.mark.parametrize("spread", [0, 30])
+def test_admission_matches_greedy_reference(spread):
+    # spread 0: one arrival time (tracker path); 30: more arrival times than candidates (full EDF checks)
+    rng = random.Random(44 + spread)
+    for _ in range(60):
+        table = random_table(rng, rng.randint(1, 20))
+        table = replace(table, arrivals=[rng.randint(0, spread) for _ in range(len(table))])
+        base = rng.randint(0, len(table))
+        report = admit_tasks(table, base)
+        expected = greedy_admission(table, base)
+        assert report["admitted"] == [table.ids[i] for i in expected[base:]]
+        assert report["rejected"] == [table.ids[i] for i in range(base, len(table)) if i not in expected]
+        assert report["feasible"] == edf_feasible(*(
+            [column[i] for i in expected] for column in (table.arrivals, table.durations, table.deadlines)))
+
+
+def test_admission_with_dependencies_matches_greedy_reference():
+    rng = random.Random(46)
+    for table in random_dag_tables(seed=46):
+        base = rng.randint(0, len(table))
+        if any(p >= base for i in range(base) for p in table.depends[i]):
+            continue  # committed tasks can't depend on candidates
+        report = admit_tasks(table, base)
+        expected = greedy_admission(table, base)
+        assert report["admitted"] == [table.ids[i] for i in expected[base:]]
+
+
+def test_candidate_depending_on_a_rejected_candidate_is_rejected():
+    # x can't fit, y depends on x; z is independent and fits
+    table = TaskTable([1, 2, 3, 4], ["base", "x", "y", "z"], [4, 4, 1, 1], [0] * 4, [4, 6, 20, 20], [2] * 4,
+                      depends=[[], [], [1], []])
+    report = admit_tasks(table, 1)
+    assert (report["admitted"], report["rejected"]) == ([4], [2, 3])
+
+
+def test_committed_task_depending_on_a_candidate_is_rejected():
+    table = TaskTable([1, 2], ["base", "x"], [1, 1], [0, 0], [10, 10], [2, 2], depends=[[1], []])
+    with pytest.raises(ValueError):
+        admit_tasks(table, 1)
+
+
+def test_admission_cell_limit(monkeypatch):
+    monkeypatch.setattr(feasibility, "ADMIT_MAX_CELLS", 10)
+    table = TaskTable(list(range(1, 6)), list("abcde"), [1] * 5, [0, 1, 2, 3, 4], [50] * 5, [2] * 5)
+    with pytest.raises(ValueError):
+        admit_tasks(table, 1)  # several arrival times: 4 candidates x 5 tasks needs full checks
+    # One arrival time stays on the O(log n) tracker whatever the size
+    assert admit_tasks(replace(table, arrivals=[0] * 5), 1)["admitted"] == [2, 3, 4, 5]
+    # Dependencies always need full checks
+    with pytest.raises(ValueError):
+        admit_tasks(replace(table, arrivals=[0] * 5, depends=[[], [0], [], [], []]), 1)
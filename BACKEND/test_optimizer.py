@@ -0,0 +1,63 @@
+"""
+Regression checks for the local-search schedule optimizer.
+
+Run from BACKEND/: python -m pytest -q test_optimizer.py
+
+Searches are time-boxed, so how far one gets varies between runs; the
+checks are invariants that must hold wherever it stops.
+"""
+import pytest
+
+from optimizer import ScheduleOptimizer
+from oracle import score_runs
+from test_scheduler import check_runs, finish_times, random_dag_tables, random_tables
+
+BUDGET_MS = 15
+
+
+def optimized(table, seed: int = 0) -> ScheduleOptimizer:
+    return ScheduleOptimizer(table, seed=seed).run(BUDGET_MS)
+
+
+def test_incremental_score_matches_full_decode():
+    # Delta-scored moves must leave the running totals where a from-scratch decode puts them
+    for seed, table in enumerate(random_tables(seed=50, count=30, max_tasks=60) +
+                                 random_dag_tables(seed=51, count=20, max_tasks=40)):
+        optimizer = optimized(table, seed)
+        end_at, met_at, imp_at, first, last, sum_end, met, importance, raw = optimizer._decode(optimizer.perm)
+        assert optimizer.end_at == end_at
+        assert optimizer.met_at == met_at
+        assert (optimizer.first, optimizer.last, optimizer.sum_end, optimizer.met) == (first, last, sum_end, met)
+        assert optimizer.importance == pytest.approx(importance)
+        assert optimizer.raw == pytest.approx(raw)
+        best = optimizer.perm if optimizer.at_best else optimizer.best_perm
+        assert optimizer.best_raw == pytest.approx(optimizer._decode(best)[-1])
+
+
+def test_best_runs_keep_arrivals_and_dependencies():
+    for seed, table in enumerate(random_dag_tables(seed=52, count=40)):
+        runs = optimized(table, seed).best_runs()
+        check_runs(table, runs)  # all the work, nothing before its arrival, one task at a time
+        finish = finish_times(table, runs)
+        for idx, start, _ in runs:
+            assert all(start >= finish[p] for p in table.depends[idx]), (seed, idx)
+
+
+def test_result_never_scores_below_the_baseline():
+    for seed, table in enumerate(random_tables(seed=53, count=30, max_tasks=40)):
+        optimizer = optimized(table, seed)
+        result = optimizer.result()
+        assert result["score"] >= result["baselineScore"] == optimizer.baseline_score
+        assert result["mode"] == "optimize"
+        if result["score"] > result["baselineScore"]:
+            assert result["score"] == score_runs(table, optimizer.best_runs())
+
+
+def test_run_can_continue():
+    # A second pass starts from where the first stopped and keeps the best found
+    table = random_tables(seed=54, count=1, max_tasks=50)[0]
+    optimizer = optimized(table)
+    best, iterations = optimizer.best_raw, optimizer.iterations
+    optimizer.run(BUDGET_MS)
+    assert optimizer.best_raw >= best
+    assert optimizer.iterations >= iterations
@@ -0,0 +1,62 @@
+"""
+Regression checks for the Monte Carlo what-if replay.
+
+Run from BACKEND/: python -m pytest -q test_robustness.py
+
+With every duration factor at 1 the right-shift replay has nothing to
+shift, so it must give back the plan's own finish times.
+"""
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+import robustness
+from robustness import replay_runs, what_if_report
+from scheduler import TaskTable, schedule_runs
+from test_scheduler import ALL_ALGOS, finish_times, random_dag_tables, random_tables
+
+
+def planned_finish(table: TaskTable, runs: List[Tuple[int, ...]]) -> List[int]:
+    if table.depends is not None:
+        return finish_times(table, runs)
+    finish = list(table.arrivals)
+    for run in runs:
+        finish[run[0]] = max(finish[run[0]], run[2])
+    return finish
+
+
+@pytest.mark.parametrize("algo", ALL_ALGOS)
+@pytest.mark.parametrize("workers", [1, 3])
+def test_unit_factors_replay_the_plan(algo, workers):
+    for table in random_tables(seed=60, count=60) + random_dag_tables(seed=61, count=60):
+        runs = schedule_runs(table, algo, 2, workers)
+        finish = replay_runs(runs, table, table.arrivals, np.ones((len(table), 3)), workers)
+        expected = planned_finish(table, runs)
+        assert (finish == np.asarray(expected, dtype=float)[:, None]).all(), (algo, workers)
+
+
+def test_longer_durations_never_finish_earlier():
+    for table in random_dag_tables(seed=62, count=40):
+        runs = schedule_runs(table, "edf", 2, 2)
+        factors = np.linspace(0.5, 2.0, 5)[None, :].repeat(len(table), axis=0)
+        finish = replay_runs(runs, table, table.arrivals, factors, 2)
+        assert (np.diff(finish, axis=1) >= 0).all()
+
+
+def test_report_without_spread_matches_the_plan():
+    table = TaskTable([1, 2, 3], ["a", "b", "c"], [4, 2, 3], [0, 0, 1], [6, 5, 20], [2] * 3)
+    report = what_if_report(table, "fcfs", samples=50, sigma=1e-9, seed=1)
+    # fcfs: a 0-4, b 4-6 (due 5), c 6-9
+    assert report["plannedMakespan"] == 9
+    assert report["makespan"]["p50"] == pytest.approx(9)
+    assert [t["missProbability"] for t in report["tasks"]] == [0.0, 1.0, 0.0]
+    assert report["expectedMisses"] == 1.0
+
+
+def test_cell_limit(monkeypatch):
+    monkeypatch.setattr(robustness, "WHAT_IF_MAX_CELLS", 100)
+    table = TaskTable(list(range(1, 6)), list("abcde"), [2] * 5, [0] * 5, [20] * 5, [2] * 5)
+    assert what_if_report(table, "fcfs", samples=20, seed=1)["samples"] == 20
+    with pytest.raises(ValueError):
+        what_if_report(table, "fcfs", samples=21, seed=1)
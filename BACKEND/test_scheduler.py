@@ -0,0 +1,389 @@
+"""
+Regression checks for the scheduling engines.
+
+Run from BACKEND/: python -m pytest -q test_scheduler.py
+
+The engines are compared against slow tick-by-tick reference simulations
+and checked for invariants every schedule must keep, on random task tables
+(fixed seeds, so a failure reproduces).
+"""
+import random
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+import scheduler
+from scheduler import ArrivalTime, DeadlineTime, Releases, Task, TaskTable, schedule_runs, schedule_tasks
+from task_graph import critical_path, predecessor_lists, topological_order
+
+NONPREEMPTIVE_KEYS = {
+    "sjf": lambda table: table.durations,
+    "ps": lambda table: table.priorities,
+    "edf": lambda table: table.deadlines,
+}
+ALL_ALGOS = ["fcfs", "sjf", "srtf", "rr", "ps", "edf", "ps-p", "edf-p", "mlfq", "ps-aging"]
+
+
+def random_table(rng: random.Random, n: int, min_duration: int = 1,
+                 depends: Optional[List[List[int]]] = None) -> TaskTable:
+    arrivals = [rng.randint(0, 30) for _ in range(n)]
+    return TaskTable(
+        ids=list(range(1, n + 1)),
+        names=[f"t{i}" for i in range(n)],
+        durations=[rng.randint(min_duration, 8) for _ in range(n)],
+        arrivals=arrivals,
+        deadlines=[a + rng.randint(1, 40) for a in arrivals],
+        priorities=[rng.randint(1, 3) for _ in range(n)],
+        depends=depends,
+    )
+
+
+def random_tables(seed: int, count: int = 150, max_tasks: int = 20) -> List[TaskTable]:
+    rng = random.Random(seed)
+    return [random_table(rng, rng.randint(1, max_tasks)) for _ in range(count)]
+
+
+def check_runs(table: TaskTable, runs: List[Tuple[int, ...]], workers: int = 1) -> None:
+    """Invariants of any schedule: all the work done, nothing before its arrival, no worker double-booked."""
+    done = [0] * len(table)
+    by_worker: Dict[int, List[Tuple[int, int]]] = {}
+    for run in runs:
+        idx, start, end = run[:3]
+        worker = run[3] if workers > 1 else 1
+        assert start <= end
+        assert start >= table.arrivals[idx]
+        assert 1 <= worker <= workers
+        done[idx] += end - start
+        by_worker.setdefault(worker, []).append((start, end))
+    assert done == table.durations
+    for segments in by_worker.values():
+        segments.sort()
+        assert all(a[1] <= b[0] for a, b in zip(segments, segments[1:]))
+
+
+def reference_nonpreemptive(table: TaskTable, keys: Optional[List[int]]) -> List[Tuple[int, int, int]]:
+    # Whenever the worker is free: the arrived task with the smallest (key, index); FCFS: (arrival, index)
+    keys = table.arrivals if keys is None else keys
+    pending = set(range(len(table)))
+    runs, time = [], min(table.arrivals)
+    while pending:
+        ready = [i for i in pending if table.arrivals[i] <= time]
+        if not ready:
+            time = min(table.arrivals[i] for i in pending)
+            continue
+        idx = min(ready, key=lambda i: (keys[i], i))
+        runs.append((idx, time, time + table.durations[idx]))
+        time += table.durations[idx]
+        pending.remove(idx)
+    return runs
+
+
+def reference_rr(table: TaskTable, quantum: int) -> List[Tuple[int, int, int]]:
+    # Arrivals during a quantum queue ahead of the task it preempts
+    order = sorted(range(len(table)), key=lambda i: (table.arrivals[i], i))
+    remaining, queue, runs = list(table.durations), [], []
+    time, position = min(table.arrivals), 0
+    while position < len(order) or queue:
+        if not queue:
+            time = max(time, table.arrivals[order[position]])
+        while position < len(order) and table.arrivals[order[position]] <= time:
+            queue.append(order[position])
+            position += 1
+        idx = queue.pop(0)
+        run = min(quantum, remaining[idx])
+        runs.append((idx, time, time + run))
+        time += run
+        remaining[idx] -= run
+        while position < len(order) and table.arrivals[order[position]] <= time:
+            queue.append(order[position])
+            position += 1
+        if remaining[idx]:
+            queue.append(idx)
+    return runs
+
+
+def reference_preemptive(table: TaskTable, keys: Optional[List[int]]) -> List[Tuple[int, int, int]]:
+    # Tick by tick: the arrived unfinished task with the smallest (key, index); keys=None: remaining time
+    remaining, runs = list(table.durations), []
+    time = min(table.arrivals)
+    while any(remaining):
+        ready = [i for i in range(len(table)) if remaining[i] and table.arrivals[i] <= time]
+        if not ready:
+            time = min(table.arrivals[i] for i in range(len(table)) if remaining[i])
+            continue
+        idx = min(ready, key=lambda i: (remaining[i] if keys is None else keys[i], i))
+        runs.append((idx, time, time + 1))
+        remaining[idx] -= 1
+        time += 1
+    return merge_runs(runs)
+
+
+def merge_runs(runs: List[Tuple[int, ...]]) -> List[Tuple[int, ...]]:
+    """Glue back-to-back runs of the same task (on the same worker)."""
+    merged: List[Tuple[int, ...]] = []
+    for run in runs:
+        last = merged[-1] if merged else None
+        if last is not None and last[0] == run[0] and last[2] == run[1] and last[3:] == run[3:]:
+            merged[-1] = (last[0], last[1], run[2], *run[3:])
+        else:
+            merged.append(run)
+    return merged
+
+
+# ---------------- Single worker ----------------
+
+@pytest.mark.parametrize("algo", ["fcfs", "sjf", "ps", "edf"])
+def test_nonpreemptive_matches_reference(algo):
+    for table in random_tables(seed=1):
+        keys = NONPREEMPTIVE_KEYS[algo](table) if algo in NONPREEMPTIVE_KEYS else None
+        assert schedule_runs(table, algo) == reference_nonpreemptive(table, keys)
+
+
+@pytest.mark.parametrize("quantum", [1, 2, 3])
+def test_rr_matches_reference(quantum):
+    for table in random_tables(seed=2):
+        assert schedule_runs(table, "rr", quantum) == reference_rr(table, quantum)
+
+
+PREEMPTIVE_KEYS = {
+    "srtf": lambda table: None,
+    "ps-p": lambda table: table.priorities,
+    "edf-p": lambda table: table.deadlines,
+}
+
+
+@pytest.mark.parametrize("algo", ["srtf", "ps-p", "edf-p"])
+def test_preemptive_matches_reference(algo):
+    for table in random_tables(seed=7):
+        assert merge_runs(schedule_runs(table, algo)) == reference_preemptive(table, PREEMPTIVE_KEYS[algo](table))
+
+
+def test_preemptive_ties_go_to_the_earlier_task():
+    # Same importance: the later-listed task that is running yields to an earlier-listed arrival
+    table = TaskTable([1, 2], ["a", "b"], [2, 4], [1, 0], [20, 20], [2, 2])
+    assert schedule_runs(table, "ps-p") == [(1, 0, 1), (0, 1, 3), (1, 3, 6)]
+    # A strictly smaller key preempts, a larger one waits
+    table = TaskTable([1, 2, 3], ["a", "b", "c"], [4, 2, 1], [0, 1, 2], [10, 5, 30], [2, 1, 3])
+    assert schedule_runs(table, "edf-p") == [(0, 0, 1), (1, 1, 2), (1, 2, 3), (0, 3, 6), (2, 6, 7)]
+
+
+@pytest.mark.parametrize("algo", ["srtf", "ps-p", "edf-p"])
+def test_preemptive_schedule_is_merged(algo):
+    for table in random_tables(seed=8, count=50):
+        schedule = schedule_tasks(table, algo)
+        for a, b in zip(schedule, schedule[1:]):
+            assert not (a["task"] == b["task"] and a["date"] == b["date"] and a["end"] == b["start"])
+
+
+# ---------------- Multiple workers ----------------
+
+@pytest.mark.parametrize("algo", ["fcfs", "sjf", "ps", "edf"])
+def test_one_parallel_worker_matches_single_worker(algo):
+    for table in random_tables(seed=3):
+        keys = NONPREEMPTIVE_KEYS[algo](table) if algo in NONPREEMPTIVE_KEYS else None
+        runs = scheduler.parallel_nonpreemptive_runs(table, keys, 1)
+        assert [run[:3] for run in runs] == schedule_runs(table, algo)
+    for table in random_tables(seed=4):
+        assert [run[:3] for run in scheduler.parallel_rr_runs(table, 2, 1)] == schedule_runs(table, "rr", 2)
+
+
+@pytest.mark.parametrize("algo", ALL_ALGOS)
+@pytest.mark.parametrize("workers", [2, 3, 5])
+def test_parallel_invariants(algo, workers):
+    for table in random_tables(seed=5, count=80):
+        check_runs(table, schedule_runs(table, algo, 2, workers), workers)
+
+
+@pytest.mark.parametrize("algo", ["fcfs", "sjf", "ps", "edf"])
+def test_parallel_nonpreemptive_never_idles_with_work_waiting(algo):
+    # A task that has arrived waits only while every worker is busy
+    workers = 3
+    for table in random_tables(seed=6, count=80):
+        runs = schedule_runs(table, algo, 1, workers)
+        for idx, start, _, _ in runs:
+            for t in range(table.arrivals[idx], start):
+                assert sum(1 for _, s, e, _ in runs if s <= t < e) == workers, (algo, idx, t)
+
+
+def test_parallel_schedule_has_workers():
+    table = TaskTable([1, 2], ["a", "b"], [2, 3], [9, 9], [20, 20], [1, 2])
+    schedule = schedule_tasks(table, "fcfs", workers=2)
+    assert sorted((s["task"], s["worker"], s["start"], s["end"]) for s in schedule) == [("a", 1, 9, 11),
+                                                                                       ("b", 2, 9, 12)]
+
+
+def test_workers_must_be_positive():
+    table = TaskTable([1], ["a"], [1], [0], [5], [1])
+    with pytest.raises(ValueError):
+        schedule_runs(table, "fcfs", 1, 0)
+
+
+@pytest.mark.parametrize("algo", ["srtf", "ps-p", "edf-p"])
+def test_parallel_preemptive_runs_the_smallest_keys(algo):
+    # At every tick the busy workers hold the smallest keys; an arrived task waits only behind
+    # smaller or equal ones (equal keys don't preempt a running task)
+    workers = 2
+    for table in random_tables(seed=9, count=60, max_tasks=12):
+        runs = schedule_runs(table, algo, 1, workers)
+        check_runs(table, runs, workers)
+        keys = PREEMPTIVE_KEYS[algo](table)
+        for t in range(min(table.arrivals), max(run[2] for run in runs)):
+            done = [sum(min(e, t) - s for i, s, e, _ in runs if i == idx and s < t) for idx in range(len(table))]
+            left = [table.durations[i] - done[i] for i in range(len(table))]
+            key = (lambda i: left[i]) if keys is None else keys.__getitem__
+            running = {i for i, s, e, _ in runs if s <= t < e}
+            waiting = [i for i in range(len(table)) if left[i] and table.arrivals[i] <= t and i not in running]
+            if waiting:
+                assert len(running) == workers
+                assert max(key(i) for i in running) <= min(key(i) for i in waiting)
+
+
+def test_parallel_preemption_needs_a_strictly_smaller_key():
+    # Both workers busy on importance 2; an importance-2 arrival waits, an importance-1 one preempts
+    table = TaskTable([1, 2, 3], ["a", "b", "c"], [4, 4, 1], [0, 0, 1], [20] * 3, [2, 2, 2])
+    assert [run[0] for run in schedule_runs(table, "ps-p", 1, 2) if run[1] <= 1 < run[2]] == [0, 1]
+    table = replace(table, priorities=[2, 2, 1])
+    assert any(run[0] == 2 and run[1] == 1 for run in schedule_runs(table, "ps-p", 1, 2))
+
+
+# ---------------- MLFQ / aging ----------------
+
+def high_stream(low_duration: int, hours: int, per_hour: int = 1) -> TaskTable:
+    # Task 0: Low, arrives at 0; then `per_hour` one-hour High tasks arriving every hour for `hours` hours
+    n = 1 + hours * per_hour
+    return TaskTable(list(range(1, n + 1)), [f"t{i}" for i in range(n)], [low_duration] + [1] * (n - 1),
+                     [0] + [k // per_hour for k in range(n - 1)], [10 * hours] * n, [3] + [1] * (n - 1))
+
+
+def test_mlfq_demotes_after_a_full_quantum():
+    # Two High tasks of 4h, quantum 1: level 0 gives 1h each, level 1 2h, level 2 the rest
+    table = TaskTable([1, 2], ["a", "b"], [4, 4], [0, 0], [20, 20], [1, 1])
+    assert schedule_runs(table, "mlfq", 1) == [(0, 0, 1), (1, 1, 2), (0, 2, 4), (1, 4, 6), (0, 6, 7), (1, 7, 8)]
+    # A Low task enters at the bottom level with its 4x quantum; a task done within its quantum stays put
+    table = TaskTable([1, 2], ["a", "b"], [6, 1], [0, 0], [20, 20], [3, 1])
+    assert schedule_runs(table, "mlfq", 1) == [(1, 0, 1), (0, 1, 5), (0, 5, 7)]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_mlfq_boost_lifts_a_starving_task(workers):
+    boost = scheduler.MLFQ_BOOST_HOURS
+    table = high_stream(2, 2 * boost, per_hour=workers)
+    # Without a boost in the window the Low task waits out the whole stream of High tasks
+    runs = (scheduler.mlfq_runs(table, 1, 10 * boost) if workers == 1
+            else scheduler.parallel_mlfq_runs(table, 1, workers, 10 * boost))
+    assert min(run[1] for run in runs if run[0] == 0) == 2 * boost
+    # With it, the Low task joins the top level at the boost, behind the High tasks that arrived then
+    runs = schedule_runs(table, "mlfq", 1, workers)
+    check_runs(table, runs, workers)
+    assert min(run[1] for run in runs if run[0] == 0) == boost + 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_aging_lets_a_low_task_overtake_new_high_ones(workers):
+    # A Low task gains a level per AGING_HOURS: after 2 x AGING_HOURS it ties with a fresh High one,
+    # and ties go to the earlier task in the list
+    aging = scheduler.AGING_HOURS
+    table = high_stream(1, 4 * aging, per_hour=workers)
+    runs = schedule_runs(table, "ps-aging", 1, workers)
+    check_runs(table, runs, workers)
+    assert min(run[1] for run in runs if run[0] == 0) == 2 * aging
+    # Plain priority scheduling starves it until the stream ends
+    assert min(run[1] for run in schedule_runs(table, "ps", 1, workers) if run[0] == 0) == 4 * aging
+    # A Medium task only needs one interval
+    table = replace(table, priorities=[2] + table.priorities[1:])
+    assert min(run[1] for run in schedule_runs(table, "ps-aging", 1, workers) if run[0] == 0) == aging
+
+
+# ---------------- Dependencies ----------------
+
+def random_dag_tables(seed: int, count: int = 80, max_tasks: int = 15) -> List[TaskTable]:
+    rng = random.Random(seed)
+    tables = []
+    for _ in range(count):
+        n = rng.randint(1, max_tasks)
+        depends = [[p for p in range(i) if rng.random() < 0.2] for i in range(n)]
+        order = list(range(n))
+        rng.shuffle(order)  # predecessors anywhere in the list, not only earlier
+        position = {idx: pos for pos, idx in enumerate(order)}
+        depends = [[position[p] for p in depends[i]] for i in sorted(range(n), key=position.__getitem__)]
+        tables.append(random_table(rng, n, min_duration=0, depends=depends))
+    return tables
+
+
+def finish_times(table: TaskTable, runs: List[Tuple[int, ...]]) -> List[int]:
+    """Finish of every task; milestones (no work) finish once they arrived and their predecessors finished."""
+    finish = [-1] * len(table)
+    for run in runs:
+        finish[run[0]] = max(finish[run[0]], run[2])
+    for i in topological_order(table.depends):
+        if table.durations[i] == 0:
+            finish[i] = max([table.arrivals[i]] + [finish[p] for p in table.depends[i]])
+    return finish
+
+
+@pytest.mark.parametrize("algo", ALL_ALGOS)
+@pytest.mark.parametrize("workers", [1, 3])
+def test_dependencies_respected(algo, workers):
+    for table in random_dag_tables(seed=10):
+        runs = schedule_runs(table, algo, 2, workers)
+        check_runs(table, runs, workers)
+        finish = finish_times(table, runs)
+        for run in runs:
+            assert all(run[1] >= finish[p] for p in table.depends[run[0]]), (algo, run)
+
+
+@pytest.mark.parametrize("algo", ALL_ALGOS)
+@pytest.mark.parametrize("workers", [1, 3])
+def test_empty_dependencies_change_nothing(algo, workers):
+    # The indegree queue with no edges must release tasks exactly like the plain arrival order
+    for table in random_tables(seed=11, count=60):
+        with_edges = replace(table, depends=[[] for _ in range(len(table))])
+        assert schedule_runs(with_edges, algo, 2, workers) == schedule_runs(table, algo, 2, workers)
+
+
+def test_releases_order():
+    # b depends on a; c has no predecessors and arrives later than b
+    table = TaskTable([1, 2, 3], ["a", "b", "c"], [3, 1, 1], [0, 0, 1], [20] * 3, [2] * 3, depends=[[], [0], []])
+    releases = Releases(table)
+    assert releases.due(1) == [0, 2]
+    assert not releases.due(10)  # b waits for a however late it is
+    releases.complete(0, 3)
+    assert releases.next_time() == 3
+    assert releases.pop() == 1
+    assert not releases
+
+
+def test_milestone_completes_on_release():
+    # a -> m (no work) -> b: b can start the moment a finishes
+    table = TaskTable([1, 2, 3], ["a", "m", "b"], [2, 0, 1], [0, 0, 0], [20] * 3, [2] * 3, depends=[[], [0], [1]])
+    assert schedule_runs(table, "fcfs") == [(0, 0, 2), (2, 2, 3)]
+
+
+def test_predecessor_lists():
+    assert predecessor_lists([1, 2, 3], [[], [], []]) is None
+    assert predecessor_lists([10, 20, 30], [[20], [], [10, 20]]) == [[1], [], [0, 1]]
+    for depends_on in ([[4], [], []], [[1], [], []], [[2], [3], [1]]):
+        with pytest.raises(ValueError):
+            predecessor_lists([1, 2, 3], depends_on)
+
+
+def test_topological_order_keeps_list_order():
+    assert topological_order([[], [], [0], [1, 2]]) == [0, 1, 2, 3]
+    assert topological_order([[1], [], [1]]) == [1, 0, 2]
+    with pytest.raises(ValueError):
+        topological_order([[1], [0]])
+
+
+def test_critical_path():
+    # a(3) -> c(2); b(1) -> c: a is critical, b has 2 hours of slack
+    path, earliest, latest = critical_path([0, 0, 0], [3, 1, 2], [[], [], [0, 1]])
+    assert path == [0, 2]
+    assert earliest == [0, 0, 3]
+    assert [l - e for l, e in zip(latest, earliest)] == [0, 2, 0]
+
+
+def test_unknown_dependency_is_rejected():
+    task = Task(1, "a", 1, ArrivalTime(9, "2025-01-01"), DeadlineTime(17, "2025-01-01"), "High", dependsOn=[7])
+    with pytest.raises(ValueError):
+        schedule_tasks([task], "fcfs")
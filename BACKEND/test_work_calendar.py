@@ -0,0 +1,164 @@
+"""
+Regression checks for working-hours calendars.
+
+Run from BACKEND/: python -m pytest -q test_work_calendar.py
+
+The bitmap and the index conversions are compared against hour-by-hour
+walks of the calendar, and calendar schedules are checked to do all their
+work inside working ticks.
+"""
+import random
+from dataclasses import replace
+from datetime import date, timedelta
+from typing import List, Tuple
+
+import pytest
+
+import scheduler
+import work_calendar
+from test_scheduler import ALL_ALGOS, check_runs, random_tables
+from work_calendar import WEEKDAYS, WorkCalendar
+
+MONDAY = "2025-01-06"
+MONDAY_DAY = date.fromisoformat(MONDAY).toordinal() - work_calendar.EPOCH_ORDINAL
+
+
+def day_str(offset: int) -> str:
+    return (date.fromisoformat(MONDAY) + timedelta(days=offset)).isoformat()
+
+
+def random_calendar(rng: random.Random) -> Tuple[WorkCalendar, dict, List[str], List[Tuple[str, int, int]]]:
+    weekly = {}
+    for day in rng.sample(WEEKDAYS, rng.randint(1, 7)):
+        start = rng.randint(0, 20)
+        weekly[day] = [(start, rng.randint(start + 1, 24))]
+    holidays = [day_str(rng.randint(0, 27)) for _ in range(rng.randint(0, 4))]
+    blocked = []
+    for _ in range(rng.randint(0, 4)):
+        start = rng.randint(0, 22)
+        blocked.append((day_str(rng.randint(0, 27)), start, rng.randint(start + 1, 24)))
+    return WorkCalendar.from_config(weekly, holidays, blocked), weekly, holidays, blocked
+
+
+def working_hour(weekly: dict, holidays: List[str], blocked: List[Tuple[str, int, int]], hour: int) -> bool:
+    # Straight from the settings: is epoch hour `hour` a working one?
+    day = date.fromordinal(hour // 24 + work_calendar.EPOCH_ORDINAL)
+    h = hour % 24
+    if day.isoformat() in holidays:
+        return False
+    if any(d == day.isoformat() and s <= h < e for d, s, e in blocked):
+        return False
+    return any(s <= h < e for s, e in weekly.get(WEEKDAYS[day.weekday()], []))
+
+
+# ---------------- Configuration ----------------
+
+def test_default_calendar_is_weekdays_nine_to_five():
+    calendar = WorkCalendar.from_config()
+    bits = calendar.bitmap(MONDAY_DAY, 7)
+    for offset in range(7):
+        expected = [1 if offset < 5 and 9 <= h < 17 else 0 for h in range(24)]
+        assert list(bits[offset * 24:(offset + 1) * 24]) == expected
+
+
+@pytest.mark.parametrize("weekly, holidays, blocked", [
+    ({"funday": [(9, 17)]}, [], []),  # unknown weekday
+    ({"mon": [(17, 9)]}, [], []),  # empty window
+    ({"mon": [(9, 25)]}, [], []),  # past midnight
+    ({"mon": []}, [], []),  # no working hours at all
+    ({"mon": [(9, 17)]}, ["2025-02-30"], []),  # bad holiday
+    ({"mon": [(9, 17)]}, [], [(MONDAY, 12, 12)]),  # empty blocked slot
+    ({"mon": [(9, 17)]}, [], [("06/01/2025", 9, 10)]),  # bad blocked date
+])
+def test_from_config_rejects_bad_settings(weekly, holidays, blocked):
+    with pytest.raises(ValueError):
+        WorkCalendar.from_config(weekly, holidays, blocked)
+
+
+def test_from_config_takes_full_day_names_and_merges_blocked_slots():
+    calendar = WorkCalendar.from_config({"Monday": [(9, 12), (13, 17)]}, [],
+                                        [(MONDAY, 10, 12), (MONDAY, 11, 14), (MONDAY, 16, 17)])
+    start = MONDAY_DAY * 24
+    assert calendar.blocked == [(start + 10, start + 14), (start + 16, start + 17)]
+    assert [h for h in range(24) if calendar.bitmap(MONDAY_DAY, 1)[h]] == [9, 14, 15]
+
+
+# ---------------- Bitmap and index ----------------
+
+def test_bitmap_matches_the_settings():
+    rng = random.Random(70)
+    for _ in range(50):
+        calendar, weekly, holidays, blocked = random_calendar(rng)
+        first_day = MONDAY_DAY - rng.randint(0, 3)
+        bits = calendar.bitmap(first_day, 35)
+        assert list(bits) == [working_hour(weekly, holidays, blocked, first_day * 24 + h) for h in range(35 * 24)]
+        # Sub-hour ticks repeat every hour's bit
+        quarter = calendar.bitmap(first_day, 35, tick=15)
+        assert list(quarter) == [bit for bit in bits for _ in range(4)]
+
+
+def test_holidays_and_blocked_slots_are_off():
+    calendar = WorkCalendar.from_config(None, [day_str(1)], [(day_str(2), 9, 13)])
+    bits = calendar.bitmap(MONDAY_DAY, 3)
+    assert sum(bits[0:24]) == 8
+    assert sum(bits[24:48]) == 0  # Tuesday holiday
+    assert [h for h in range(24) if bits[48 + h]] == [13, 14, 15, 16]  # Wednesday from 13
+
+
+def test_advance_and_expand_match_an_hour_by_hour_walk():
+    rng = random.Random(71)
+    for _ in range(40):
+        calendar, weekly, holidays, blocked = random_calendar(rng)
+        start = MONDAY_DAY * 24
+        index = calendar.index(start, start + 24 * 7, 60)
+        working = [t for t in range(index.start, index.end) if index.bits[t - index.start]]
+        assert index.total == len(working)
+        for _ in range(30):
+            t = rng.randint(start, start + 24 * 7)
+            duration = rng.randint(0, 40)
+            before = sum(1 for w in working if w < t)
+            assert index.working_before(t) == before
+            if duration:
+                # Done at the end of the duration-th working hour from t
+                assert index.advance(t, duration) == working[before + duration - 1] + 1
+                intervals = index.expand(before, before + duration)
+                hours = [h for s, e in intervals for h in range(s, e)]
+                assert hours == working[before:before + duration]
+                assert all(a[1] < b[0] for a, b in zip(intervals, intervals[1:]))  # split only at gaps
+            else:
+                assert index.advance(t, 0) == t
+
+
+def test_index_covers_what_it_is_asked_for():
+    calendar = WorkCalendar.from_config({"mon": [(9, 10)]}, [day_str(7), day_str(14)])
+    start = MONDAY_DAY * 24
+    index = calendar.index(start, start + 100, 5)
+    assert index.end > start + 100
+    assert index.total - index.working_before(start + 100) >= 5
+
+
+def test_index_horizon_is_capped(monkeypatch):
+    calendar = WorkCalendar.from_config({"mon": [(9, 10)]})
+    start = MONDAY_DAY * 24
+    monkeypatch.setattr(work_calendar, "CALENDAR_MAX_TICKS", 24 * 100)
+    calendar.index(start, start, 10)  # ten Mondays fit in 100 days
+    with pytest.raises(ValueError):
+        calendar.index(start, start, 20)
+    with pytest.raises(ValueError):
+        calendar.index(start, start, 1, tick=1)  # 100 days of hours is under 2 days of minutes
+
+
+# ---------------- Schedules ----------------
+
+@pytest.mark.parametrize("algo", ALL_ALGOS)
+@pytest.mark.parametrize("workers", [1, 2])
+def test_calendar_runs_stay_in_working_hours(algo, workers):
+    rng = random.Random(72)
+    for table in random_tables(seed=73, count=30):
+        calendar, *_ = random_calendar(rng)
+        table = replace(table, arrivals=[MONDAY_DAY * 24 + a for a in table.arrivals])
+        runs = scheduler.calendar_runs(table, algo, 2, workers, calendar)
+        check_runs(table, runs, workers)
+        index = calendar.index(min(table.arrivals), max(run[2] for run in runs), 0)
+        for run in runs:
+            assert all(index.bits[t - index.start] for t in range(run[1], run[2])), (algo, run)
@@ -0,0 +1,211 @@
+"""
+Working-hours calendars.
+
+A WorkCalendar says when work can happen: hours per weekday, holidays and
+blocked slots. For a planning horizon it compiles into a CalendarIndex, an
+availability bitmap (one entry per scheduler tick, hourly by default) with
+prefix sums over it, so converting between real time (epoch ticks) and
+working time (ticks of work since the horizon start) is a bisect, O(log H),
+instead of an hour-by-hour walk.
+
+The schedulers use it by simulating in working time, where the calendar
+disappears, and expanding the resulting runs back onto the real clock.
+"""
+import os
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+DEFAULT_WEEKLY_HOURS = {day: [(9, 17)] for day in WEEKDAYS[:5]}
+# Upper bound on the ticks one CalendarIndex covers (about 114 years hourly, 694 days at 1-minute ticks)
+CALENDAR_MAX_TICKS = int(os.getenv("CALENDAR_MAX_TICKS", "1000000"))
+
+
+def _epoch_day(date_str: str) -> int:
+    return date.fromisoformat(date_str).toordinal() - EPOCH_ORDINAL
+
+
+@dataclass
+class WorkCalendar:
+    """
+    When work can happen. Hours are [start, end) within a day, 0..24.
+
+    Attributes:
+        day_masks: 7 masks (Monday first) of 24 bytes, 1 = working hour
+        holidays: Epoch days with no work at all
+        blocked: Sorted, non-overlapping (start, end) epoch-hour ranges with no work
+    """
+    day_masks: List[bytes]
+    holidays: frozenset = frozenset()
+    blocked: List[Tuple[int, int]] = field(default_factory=list)
+
+    @classmethod
+    def from_config(cls, weekly_hours: Optional[Dict[str, Sequence[Sequence[int]]]] = None,
+                    holidays: Iterable[str] = (),
+                    blocked: Iterable[Tuple[str, int, int]] = ()) -> "WorkCalendar":
+        """
+        Build a calendar from API-style settings.
+
+        Args:
+            weekly_hours: {"mon": [[9, 12], [13, 17]], ...}; missing days are off.
+                Defaults to Monday-Friday 9-17.
+            holidays: YYYY-MM-DD dates
+            blocked: (YYYY-MM-DD, start hour, end hour) slots
+
+        Raises:
+            ValueError: Unknown weekday, bad hour range or date, or no working hours at all
+        """
+        weekly_hours = DEFAULT_WEEKLY_HOURS if weekly_hours is None else weekly_hours
+        masks = [bytearray(24) for _ in WEEKDAYS]
+        for day, windows in weekly_hours.items():
+            key = day.lower()[:3]
+            if key not in WEEKDAYS:
+                raise ValueError(f"Unknown weekday: {day}")
+            for start, end in windows:
+                if not 0 <= start < end <= 24:
+                    raise ValueError(f"Bad working window for {day}: {start}-{end}")
+                masks[WEEKDAYS.index(key)][start:end] = b"\x01" * (end - start)
+        if not any(any(mask) for mask in masks):
+            raise ValueError("Calendar has no working hours")
+
+        ranges = []
+        for day_str, start, end in blocked:
+            if not 0 <= start < end <= 24:
+                raise ValueError(f"Bad blocked slot on {day_str}: {start}-{end}")
+            day_hour = _epoch_day(day_str) * 24
+            ranges.append((day_hour + start, day_hour + end))
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        return cls(day_masks=[bytes(m) for m in masks],
+                   holidays=frozenset(_epoch_day(d) for d in holidays),
+                   blocked=merged)
+
+    def bitmap(self, first_day: int, num_days: int, tick: int = 60) -> bytearray:
+        """Availability of every tick of days [first_day, first_day + num_days), 1 = working."""
+        per_hour = 60 // tick
+        per_day = 24 * per_hour
+        masks = [bytes(b for b in mask for _ in range(per_hour)) for mask in self.day_masks]
+        bits = bytearray(num_days * per_day)
+        for offset in range(num_days):
+            day = first_day + offset
+            if day not in self.holidays:
+                # 1970-01-01 was a Thursday
+                bits[offset * per_day:(offset + 1) * per_day] = masks[(day + 3) % 7]
+        start_hour, end_hour = first_day * 24, (first_day + num_days) * 24
+        # Blocked ranges don't overlap, so only the one before the first starting in the window can reach into it
+        first = max(bisect_right(self.blocked, (start_hour,)) - 1, 0)
+        for start, end in self.blocked[first:]:
+            if start >= end_hour:
+                break
+            lo, hi = max(start, start_hour), min(end, end_hour)
+            if lo < hi:
+                bits[(lo - start_hour) * per_hour:(hi - start_hour) * per_hour] = bytes((hi - lo) * per_hour)
+        return bits
+
+    def index(self, first: int, last: int, working: int, tick: int = 60) -> "CalendarIndex":
+        """
+        Compile the calendar from the day of `first` until it covers `last`
+        and at least `working` working ticks after it (all in epoch ticks
+        of `tick` minutes).
+
+        Raises:
+            ValueError: The horizon needs more than CALENDAR_MAX_TICKS ticks
+        """
+        per_day = 1440 // tick
+        weekly = sum(sum(mask) for mask in self.day_masks) * 60 // tick
+        first_day = first // per_day
+        num_days = last // per_day - first_day + 1 + 7 * (working // weekly + 1)
+        max_days = CALENDAR_MAX_TICKS // per_day
+        while True:
+            if num_days > max_days:
+                raise ValueError(f"Calendar horizon of {num_days} days is over the limit of {max_days} days "
+                                 f"at {tick}-minute ticks; shorten the task list or the arrival spread")
+            index = CalendarIndex(first_day * per_day, self.bitmap(first_day, num_days, tick))
+            if index.end > last and index.total - index.working_before(last) >= working:
+                return index
+            # Holidays / blocked slots ate into the estimate
+            num_days = max_days + 1 if num_days == max_days else min(num_days * 2, max_days)
+
+
+class CalendarIndex:
+    """
+    Tick bitmap of a calendar over [start, end) with prefix sums.
+
+    prefix[i] is the number of working ticks in [start, start + i), so
+    real -> working time is one lookup and working -> real time one bisect.
+    Runs of consecutive working ticks are kept as blocks for expanding
+    working-time intervals back onto the clock.
+    """
+
+    def __init__(self, start: int, bits: bytearray):
+        self.start = start
+        self.end = start + len(bits)
+        self.bits = bits
+        self.prefix = [0, *accumulate(bits)]
+        self.total = self.prefix[-1]
+        # Working blocks: real start, working-time start, length
+        self.block_real: List[int] = []
+        self.block_work: List[int] = []
+        self.block_len: List[int] = []
+        pos = 0
+        while pos < len(bits):
+            if bits[pos]:
+                run_end = bits.find(0, pos)
+                run_end = len(bits) if run_end < 0 else run_end
+                self.block_real.append(start + pos)
+                self.block_work.append(self.prefix[pos])
+                self.block_len.append(run_end - pos)
+                pos = run_end
+            else:
+                next_pos = bits.find(1, pos)
+                pos = len(bits) if next_pos < 0 else next_pos
+
+    def working_before(self, t: int) -> int:
+        """Working ticks in [start, t): the working-time position of real time `t`."""
+        return self.prefix[min(max(t - self.start, 0), len(self.bits))]
+
+    def real_time(self, work: int) -> int:
+        """Real tick in which working tick number `work` (0-based) is done."""
+        if not 0 <= work < self.total:
+            raise ValueError(f"Working tick {work} is outside the calendar horizon")
+        return self.start + bisect_right(self.prefix, work) - 1
+
+    def advance(self, t: int, duration: int) -> int:
+        """Real tick at which `duration` working ticks started at `t` are finished."""
+        if duration <= 0:
+            return t
+        return self.real_time(self.working_before(t) + duration - 1) + 1
+
+    def expand(self, work_start: int, work_end: int) -> List[Tuple[int, int]]:
+        """Real (start, end) intervals covering working time [work_start, work_end)."""
+        intervals = []
+        block = bisect_right(self.block_work, work_start) - 1
+        while work_start < work_end:
+            if block >= len(self.block_work):
+                raise ValueError("Schedule runs past the calendar horizon")
+            offset = work_start - self.block_work[block]
+            take = min(work_end - work_start, self.block_len[block] - offset)
+            if take > 0:
+                real = self.block_real[block] + offset
+                intervals.append((real, real + take))
+                work_start += take
+            block += 1
+        return intervals
+
+    def expand_runs(self, runs: List[Tuple[int, ...]]) -> List[Tuple[int, ...]]:
+        """Map (task index, start, end[, worker]) runs from working time back to epoch ticks."""
+        expanded = []
+        for run in runs:
+            idx, start, end, *rest = run
+            for real_start, real_end in self.expand(start, end):
+                expanded.append((idx, real_start, real_end, *rest))
+        return expanded
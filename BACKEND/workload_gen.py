@@ -0,0 +1,238 @@
+"""
+Vectorized synthetic workload generator.
+
+    python workload_gen.py --preset bursty_morning -n 1000000 --out workload.npz
+    python workload_gen.py --preset sprint_deadline -n 200 --out tasks.json
+
+Workloads are generated as column arrays (see `generate_workload`) and only
+turned into Task objects / JSON when asked, so millions of tasks take
+seconds instead of the minutes a per-task random/datetime loop needs.
+"""
+import argparse
+import json
+import time
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+IMPORTANCE_LEVELS = np.array(["Low", "Medium", "High"])
+EPOCH = np.datetime64("1970-01-01", "D")
+
+
+@dataclass
+class WorkloadConfig:
+    num_tasks: Optional[int] = 1000  # None: draw N ~ Poisson(arrival_rate * horizon hours)
+    start_date: str = "2025-09-27"
+    horizon_days: int = 3
+    arrival_rate: float = 2.0  # tasks per hour, only used when num_tasks is None
+    # Relative arrival intensity per hour of day (24 values); None = flat
+    hourly_profile: Optional[Sequence[float]] = None
+    # Durations in hours: "lognormal" (duration_mean, duration_sigma), "pareto" (duration_alpha, scale
+    # duration_min) or "uniform" [duration_min, duration_max]
+    duration_dist: str = "lognormal"
+    duration_mean: float = 4.0  # median of the lognormal
+    duration_sigma: float = 0.6
+    duration_alpha: float = 1.5
+    duration_min: int = 1
+    duration_max: int = 48
+    # Deadline = arrival + duration * slack, slack ~ uniform[slack_min, slack_max]
+    slack_min: float = 1.2
+    slack_max: float = 3.0
+    # Cluster deadlines in the last `deadline_cluster_hours` of the horizon instead (sprint end)
+    deadline_cluster_hours: Optional[int] = None
+    importance_mix: Sequence[float] = (1 / 3, 1 / 3, 1 / 3)  # Low, Medium, High
+
+
+def _peak(hours: Sequence[int], peak: float = 6.0) -> List[float]:
+    profile = [1.0] * 24
+    for h in hours:
+        profile[h] = peak
+    return profile
+
+
+PRESETS: Dict[str, WorkloadConfig] = {
+    # Roughly what generate_random_task_list produces
+    "uniform": WorkloadConfig(duration_dist="uniform", duration_min=1, duration_max=10),
+    # Most work lands between 8 and 11 in the morning, short tasks with tight deadlines
+    "bursty_morning": WorkloadConfig(
+        horizon_days=5, hourly_profile=_peak(range(8, 12), peak=8.0),
+        duration_mean=2.0, duration_sigma=0.5, duration_max=12,
+        slack_min=1.1, slack_max=2.0, importance_mix=(0.2, 0.5, 0.3)
+    ),
+    # Two-week sprint: work trickles in during office hours, everything is due at the end
+    "sprint_deadline": WorkloadConfig(
+        horizon_days=14, hourly_profile=_peak(range(9, 18), peak=4.0),
+        duration_mean=6.0, duration_sigma=0.7, duration_max=40,
+        deadline_cluster_hours=24, importance_mix=(0.1, 0.4, 0.5)
+    ),
+    # Half a year of backlog with heavy-tailed effort and generous deadlines
+    "long_horizon_backlog": WorkloadConfig(
+        horizon_days=180, duration_dist="pareto", duration_alpha=1.3, duration_min=1, duration_max=200,
+        slack_min=2.0, slack_max=10.0, importance_mix=(0.5, 0.35, 0.15)
+    ),
+}
+
+
+def generate_workload(config: WorkloadConfig, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Generate a workload as column arrays.
+
+    Arrival times follow a (possibly time-varying) Poisson process over the
+    horizon: conditional on the task count, arrivals are i.i.d. draws from
+    the normalized intensity, which is how they are sampled here.
+
+    Returns:
+        Dict of equal-length arrays sorted by arrival:
+            id (int64), duration (int64, hours), arrival_at / deadline_at
+            (int64, hours since 1970-01-01), importance (int8: 0 Low, 1 Medium, 2 High)
+    """
+    rng = np.random.default_rng(seed)
+    horizon_hours = config.horizon_days * 24
+    n = config.num_tasks if config.num_tasks is not None else int(rng.poisson(config.arrival_rate * horizon_hours))
+
+    start = (np.datetime64(config.start_date, "D") - EPOCH).astype(np.int64) * 24
+
+    # Arrivals: pick a day uniformly, an hour from the intensity profile
+    days = rng.integers(0, config.horizon_days, size=n)
+    if config.hourly_profile is None:
+        hours = rng.integers(0, 24, size=n)
+    else:
+        profile = np.asarray(config.hourly_profile, dtype=np.float64)
+        hours = rng.choice(24, size=n, p=profile / profile.sum())
+    arrival_at = np.sort(start + days * 24 + hours)
+
+    # Durations
+    if config.duration_dist == "lognormal":
+        raw = rng.lognormal(np.log(config.duration_mean), config.duration_sigma, size=n)
+    elif config.duration_dist == "pareto":
+        raw = (rng.pareto(config.duration_alpha, size=n) + 1) * config.duration_min
+    elif config.duration_dist == "uniform":
+        raw = rng.uniform(config.duration_min, config.duration_max, size=n)
+    else:
+        raise ValueError(f"Unknown duration distribution: {config.duration_dist}")
+    duration = np.clip(np.rint(raw), config.duration_min, config.duration_max).astype(np.int64)
+
+    # Deadlines
+    if config.deadline_cluster_hours:
+        horizon_end = start + horizon_hours
+        deadline_at = horizon_end - rng.integers(0, config.deadline_cluster_hours, size=n)
+        deadline_at = np.maximum(deadline_at, arrival_at + duration)
+    else:
+        slack = rng.uniform(config.slack_min, config.slack_max, size=n)
+        deadline_at = arrival_at + np.ceil(duration * slack).astype(np.int64)
+
+    mix = np.asarray(config.importance_mix, dtype=np.float64)
+    importance = rng.choice(3, size=n, p=mix / mix.sum()).astype(np.int8)
+
+    return {
+        "id": np.arange(1, n + 1, dtype=np.int64),
+        "duration": duration,
+        "arrival_at": arrival_at,
+        "deadline_at": deadline_at,
+        "importance": importance,
+    }
+
+
+def _dates_and_hours(epoch_hours: np.ndarray):
+    dates = (EPOCH + (epoch_hours // 24).astype("timedelta64[D]")).astype(str)
+    return dates.tolist(), (epoch_hours % 24).tolist()
+
+
+def to_task_dicts(workload: Dict[str, np.ndarray]) -> List[Dict]:
+    """Task JSON dicts (the API's Task shape)."""
+    arrival_dates, arrival_hrs = _dates_and_hours(workload["arrival_at"])
+    deadline_dates, deadline_hrs = _dates_and_hours(workload["deadline_at"])
+    importance = IMPORTANCE_LEVELS[workload["importance"]].tolist()
+    return [
+        {
+            "id": task_id,
+            "taskName": f"Task {task_id - 1}",
+            "duration": duration,
+            "arrivalTime": {"hrs": a_hrs, "date": a_date},
+            "deadlineTime": {"hrs": d_hrs, "date": d_date},
+            "importance": imp,
+        }
+        for task_id, duration, a_date, a_hrs, d_date, d_hrs, imp in zip(
+            workload["id"].tolist(), workload["duration"].tolist(), arrival_dates, arrival_hrs,
+            deadline_dates, deadline_hrs, importance
+        )
+    ]
+
+
+def to_tasks(workload: Dict[str, np.ndarray]) -> list:
+    """models.Task objects (built without re-validation; the arrays are already well-formed)."""
+    from models import Task, ArrivalTime, DeadlineTime
+
+    return [
+        Task.model_construct(
+            id=t["id"], taskName=t["taskName"], duration=t["duration"],
+            arrivalTime=ArrivalTime.model_construct(**t["arrivalTime"]),
+            deadlineTime=DeadlineTime.model_construct(**t["deadlineTime"]),
+            importance=t["importance"]
+        )
+        for t in to_task_dicts(workload)
+    ]
+
+
+def to_scheduler_tasks(workload: Dict[str, np.ndarray]) -> list:
+    """scheduler.Task dataclasses: the cheapest objects schedule_tasks / extract_batch_features accept."""
+    from scheduler import Task, ArrivalTime, DeadlineTime
+
+    arrival_dates, arrival_hrs = _dates_and_hours(workload["arrival_at"])
+    deadline_dates, deadline_hrs = _dates_and_hours(workload["deadline_at"])
+    importance = IMPORTANCE_LEVELS[workload["importance"]].tolist()
+    return [
+        Task(task_id, f"Task {task_id - 1}", duration, ArrivalTime(a_hrs, a_date),
+             DeadlineTime(d_hrs, d_date), imp)
+        for task_id, duration, a_date, a_hrs, d_date, d_hrs, imp in zip(
+            workload["id"].tolist(), workload["duration"].tolist(), arrival_dates, arrival_hrs,
+            deadline_dates, deadline_hrs, importance
+        )
+    ]
+
+
+def generate_preset(name: str, num_tasks: Optional[int] = None, seed: Optional[int] = None,
+                    **overrides) -> Dict[str, np.ndarray]:
+    """Generate a named preset workload, optionally overriding its size or other config fields."""
+    if name not in PRESETS:
+        raise ValueError(f"Unknown workload preset: {name} (choose from {', '.join(PRESETS)})")
+    config = PRESETS[name]
+    if num_tasks is not None:
+        overrides["num_tasks"] = num_tasks
+    return generate_workload(replace(config, **overrides), seed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic task workloads")
+    parser.add_argument("--preset", default="uniform", choices=list(PRESETS))
+    parser.add_argument("-n", "--num-tasks", type=int, default=None)
+    parser.add_argument("--horizon-days", type=int, default=None)
+    parser.add_argument("--start-date", default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", default=None, help=".npz for column arrays, .json for Task dicts")
+    args = parser.parse_args()
+
+    overrides = {}
+    if args.horizon_days is not None:
+        overrides["horizon_days"] = args.horizon_days
+    if args.start_date is not None:
+        overrides["start_date"] = args.start_date
+
+    began = time.perf_counter()
+    workload = generate_preset(args.preset, args.num_tasks, args.seed, **overrides)
+    elapsed = time.perf_counter() - began
+    n = len(workload["id"])
+    print(f"{args.preset}: {n} tasks in {elapsed:.3f}s, "
+          f"mean duration {workload['duration'].mean():.2f}h, "
+          f"mean slack {(workload['deadline_at'] - workload['arrival_at'] - workload['duration']).mean():.2f}h")
+
+    if args.out and args.out.endswith(".npz"):
+        np.savez_compressed(args.out, **workload)
+    elif args.out:
+        with open(args.out, "w") as f:
+            json.dump(to_task_dicts(workload), f)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ import TaskInputSection from './components/TaskInputSection';
 import ScheduleVisualizationSection from './components/ScheduleVisualizationSection';
 import AIInteractionSection from './components/AIInteractionSection';
 import Notification from './components/Notification';
-import { Task, NotificationType } from './types';
+import { Task, NotificationType, ScheduleRef } from './types';
 import { useElectron } from './hooks/useElectron';
 
 function App() {
@@ -18,6 +18,8 @@ function App() {
   
   const [manualSchedule, setManualSchedule] = useState<any[]>([]);
   const [aiSchedule, setAiSchedule] = useState<any[]>([]);
+  const [manualScheduleRef, setManualScheduleRef] = useState<ScheduleRef | null>(null);
+  const [aiScheduleRef, setAiScheduleRef] = useState<ScheduleRef | null>(null);
   const [manualAlgo, setManualAlgo] = useState<string>('RR');
   const [quantum, setQuantum] = useState<string>('2');
   const [aiAlgo, setAiAlgo] = useState<string>('Not suggested yet');
@@ -80,6 +82,8 @@ function App() {
         showNotification={showNotification} 
         setManualSchedule={setManualSchedule}
         setAiSchedule={setAiSchedule}
+        setManualScheduleRef={setManualScheduleRef}
+        setAiScheduleRef={setAiScheduleRef}
         manualAlgo={manualAlgo}
         setManualAlgo={setManualAlgo}
         quantum={quantum}
@@ -94,6 +98,8 @@ function App() {
         showNotification={showNotification} 
         manualSchedule={manualSchedule} 
         aiSchedule={aiSchedule} 
+        manualScheduleRef={manualScheduleRef}
+        aiScheduleRef={aiScheduleRef}
         manualAlgo={manualAlgo}
         quantum={quantum}
         aiAlgo={aiAlgo}
@@ -125,6 +131,8 @@ function App() {
         showNotification={showNotification} 
         setManualSchedule={setManualSchedule}
         setAiSchedule={setAiSchedule}
+        setManualScheduleRef={setManualScheduleRef}
+        setAiScheduleRef={setAiScheduleRef}
         manualAlgo={manualAlgo}
         setManualAlgo={setManualAlgo}
         quantum={quantum}
@@ -1,4 +1,7 @@
-import React from 'react';
+import React, { useEffect, useRef, useState } from 'react';
+import { ScheduleRef } from '../types';
+import { apiCall } from '../utils/api';
+import { API_URL } from '../utils/backend_config';
 
 interface Task {
   task: string;
@@ -7,14 +10,238 @@ interface Task {
   date: string;
 }
 
+const SEGMENT_PAGE_SIZE = 500;
+
 interface GanttChartProps {
   tasks: Task[];
+  scheduleRef?: ScheduleRef | null;
   algo?: string;
   tq?: string;
   height?: number;
 }
 
-const GanttChart: React.FC<GanttChartProps> = ({ tasks, algo, tq, height = 320 }) => {
+interface DateSectionProps {
+  date: string;
+  dateTasks: Task[];
+  colorFor: (taskName: string) => string;
+}
+
+// Format date for display
+const formatDate = (dateStr: string) => {
+  const date = new Date(dateStr);
+  return date.toLocaleDateString('en-US', { 
+    weekday: 'short', 
+    month: 'short', 
+    day: 'numeric' 
+  });
+};
+
+const DateSection: React.FC<DateSectionProps> = ({ date, dateTasks, colorFor }) => {
+  const maxEnd = Math.max(...dateTasks.map(t => t.end));
+  const minStart = Math.min(...dateTasks.map(t => t.start));
+  const totalDuration = maxEnd - minStart;
+
+  // Group overlapping tasks within the same date
+  const getTaskRow = (task: Task, index: number): number => {
+    const overlappingTasks = dateTasks.slice(0, index).filter(
+      t => !(t.end <= task.start || t.start >= task.end)
+    );
+    return overlappingTasks.length;
+  };
+
+  const maxRows = Math.max(...dateTasks.map((task, i) => getTaskRow(task, i))) + 1;
+  const rowHeight = 60;
+  const chartHeight = Math.max(maxRows * (rowHeight + 8), 150);
+
+  // Generate time markers
+  const timeMarkers = [];
+  for (let i = minStart; i <= maxEnd; i++) {
+    timeMarkers.push(i);
+  }
+
+  return (
+    <div className="mb-4">
+      {/* Date Header */}
+      <div className="flex items-center mb-2">
+        <div className="bg-slate-800 px-3 py-1.5 rounded-md">
+          <h4 className="text-sm font-semibold text-slate-200">{formatDate(date)}</h4>
+          <p className="text-xs text-slate-400">{date}</p>
+        </div>
+      </div>
+
+      {/* Chart Container */}
+      <div className="relative bg-slate-800 rounded-lg p-3" style={{ minHeight: `${chartHeight + 60}px` }}>
+        {/* Time axis */}
+        <div className="absolute top-0 left-0 right-0 h-8 border-b border-slate-700">
+          <div className="relative h-full">
+            {timeMarkers.map((time) => (
+              <div
+                key={time}
+                className="absolute flex flex-col items-center"
+                style={{
+                  left: `${((time - minStart) / totalDuration) * 100}%`,
+                  transform: 'translateX(-50%)',
+                }}
+              >
+                <span className="text-xs text-slate-400 font-medium">
+                  {time}h
+                </span>
+                <div className="w-px h-1 bg-slate-600 mt-1"></div>
+              </div>
+            ))}
+          </div>
+        </div>
+
+        {/* Grid lines */}
+        <div className="absolute top-8 left-0 right-0 bottom-0 pointer-events-none">
+          {timeMarkers.map((time) => (
+            <div
+              key={`grid-${time}`}
+              className="absolute top-0 bottom-0 w-px bg-slate-700 opacity-30"
+              style={{
+                left: `${((time - minStart) / totalDuration) * 100}%`,
+              }}
+            ></div>
+          ))}
+        </div>
+
+        {/* Tasks */}
+        <div className="relative mt-10" style={{ minHeight: `${chartHeight}px` }}>
+          {dateTasks.map((task, index) => {
+            const duration = task.end - task.start;
+            const startPercent = ((task.start - minStart) / totalDuration) * 100;
+            const widthPercent = (duration / totalDuration) * 100;
+            const row = getTaskRow(task, index);
+            const color = colorFor(task.task);
+
+            return (
+              <div
+                key={index}
+                className={`absolute ${color} rounded-md shadow-lg hover:shadow-xl transition-all duration-200 hover:scale-105 cursor-pointer group`}
+                style={{
+                  left: `${startPercent}%`,
+                  width: `${widthPercent}%`,
+                  height: `${rowHeight}px`,
+                  top: `${row * (rowHeight + 8)}px`,
+                  minWidth: '80px',
+                }}
+              >
+                <div className="flex items-center justify-between h-full px-3 py-2 relative">
+                  <div className="flex-1 min-w-0 pr-2 overflow-hidden">
+                    <p className="text-white text-sm font-medium leading-tight line-clamp-2">
+                      {task.task}
+                    </p>
+                    <p className="text-white text-xs opacity-80 mt-0.5">
+                      {task.start}h - {task.end}h
+                    </p>
+                  </div>
+
+                  {/* Duration badge */}
+                  <div className="ml-2 bg-white bg-opacity-20 rounded px-2 py-1 flex-shrink-0">
+                    <span className="text-xs text-white font-semibold">
+                      {duration}h
+                    </span>
+                  </div>
+
+                  {/* Hover tooltip */}
+                  <div className="absolute -top-10 left-1/2 transform -translate-x-1/2 bg-slate-700 text-white px-3 py-2 rounded-md text-xs whitespace-nowrap opacity-0 group-hover:opacity-100 transition-opacity duration-200 pointer-events-none shadow-xl z-10">
+                    <div className="font-semibold">{task.task}</div>
+                    <div>Duration: {duration} hour{duration > 1 ? 's' : ''}</div>
+                    <div>Time: {task.start}h - {task.end}h</div>
+                    <div className="absolute -bottom-1 left-1/2 transform -translate-x-1/2 w-2 h-2 bg-slate-700 rotate-45"></div>
+                  </div>
+                </div>
+              </div>
+            );
+          })}
+        </div>
+
+        {/* Legend */}
+        <div className="mt-3 pt-2 border-t border-slate-700">
+          <div className="flex items-center justify-between">
+            <div className="flex items-center space-x-4">
+              <div className="flex items-center text-xs text-slate-400">
+                <div className="w-3 h-3 bg-blue-500 rounded-sm mr-2"></div>
+                <span>Task Block</span>
+              </div>
+              <div className="flex items-center text-xs text-slate-400">
+                <svg className="w-4 h-4 mr-1" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+                  <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z" />
+                </svg>
+                <span>Time in hours</span>
+              </div>
+            </div>
+            <div className="text-xs text-slate-500">
+              Duration: {totalDuration}h ({dateTasks.length} task{dateTasks.length > 1 ? 's' : ''})
+            </div>
+          </div>
+        </div>
+      </div>
+    </div>
+  );
+};
+
+interface LazyDateSectionProps {
+  scheduleId: number;
+  date: string;
+  count: number;
+  colorFor: (taskName: string) => string;
+}
+
+// Fetches a day's segments only once its placeholder scrolls into view
+const LazyDateSection: React.FC<LazyDateSectionProps> = ({ scheduleId, date, count, colorFor }) => {
+  const placeholderRef = useRef<HTMLDivElement>(null);
+  const [visible, setVisible] = useState(false);
+  const [dateTasks, setDateTasks] = useState<Task[] | null>(null);
+
+  useEffect(() => {
+    const node = placeholderRef.current;
+    if (!node || visible) return;
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some(entry => entry.isIntersecting)) {
+          setVisible(true);
+          observer.disconnect();
+        }
+      },
+      { rootMargin: '400px' }
+    );
+    observer.observe(node);
+    return () => observer.disconnect();
+  }, [visible]);
+
+  useEffect(() => {
+    if (!visible) return;
+    let cancelled = false;
+    const fetchDay = async () => {
+      const segments: Task[] = [];
+      let cursor: string | null = null;
+      do {
+        const params = new URLSearchParams({ date, limit: String(SEGMENT_PAGE_SIZE) });
+        if (cursor) params.set('cursor', cursor);
+        const [success, data] = await apiCall(`${API_URL}/api/schedules/${scheduleId}/segments?${params}`);
+        if (!success || cancelled) return;
+        segments.push(...data.segments);
+        cursor = data.nextCursor;
+      } while (cursor);
+      if (!cancelled) setDateTasks(segments);
+    };
+    fetchDay();
+    return () => { cancelled = true; };
+  }, [visible, scheduleId, date]);
+
+  if (!dateTasks) {
+    return (
+      <div ref={placeholderRef} className="mb-4 bg-slate-800 rounded-lg p-3" style={{ minHeight: '200px' }}>
+        <h4 className="text-sm font-semibold text-slate-200">{formatDate(date)}</h4>
+        <p className="text-xs text-slate-400">{date} · {visible ? 'Loading ' : ''}{count} segment{count > 1 ? 's' : ''}</p>
+      </div>
+    );
+  }
+  return <DateSection date={date} dateTasks={dateTasks} colorFor={colorFor} />;
+};
+
+const GanttChart: React.FC<GanttChartProps> = ({ tasks, scheduleRef, algo, tq, height = 320 }) => {
   // Group tasks by date
   const tasksByDate = tasks.reduce((acc, task) => {
     if (!acc[task.date]) {
@@ -45,14 +272,14 @@ const GanttChart: React.FC<GanttChartProps> = ({ tasks, algo, tq, height = 320 }
     taskColorMap[taskName] = colorPalette[index % colorPalette.length];
   });
   
-  // Format date for display
-  const formatDate = (dateStr: string) => {
-    const date = new Date(dateStr);
-    return date.toLocaleDateString('en-US', { 
-      weekday: 'short', 
-      month: 'short', 
-      day: 'numeric' 
-    });
+  // Lazily loaded segments are not known up front, so fall back to a stable hash colour
+  const colorFor = (taskName: string) => {
+    if (taskColorMap[taskName]) return taskColorMap[taskName];
+    let hash = 0;
+    for (let i = 0; i < taskName.length; i++) {
+      hash = (hash * 31 + taskName.charCodeAt(i)) | 0;
+    }
+    return colorPalette[Math.abs(hash) % colorPalette.length];
   };
   
   return (
@@ -66,151 +293,13 @@ const GanttChart: React.FC<GanttChartProps> = ({ tasks, algo, tq, height = 320 }
         </div>
         
         {/* Date Sections */}
-        {sortedDates.map((date, dateIndex) => {
-          const dateTasks = tasksByDate[date];
-          const maxEnd = Math.max(...dateTasks.map(t => t.end));
-          const minStart = Math.min(...dateTasks.map(t => t.start));
-          const totalDuration = maxEnd - minStart;
-          
-          // Group overlapping tasks within the same date
-          const getTaskRow = (task: Task, index: number): number => {
-            const overlappingTasks = dateTasks.slice(0, index).filter(
-              t => !(t.end <= task.start || t.start >= task.end)
-            );
-            return overlappingTasks.length;
-          };
-          
-          const maxRows = Math.max(...dateTasks.map((task, i) => getTaskRow(task, i))) + 1;
-          const rowHeight = 60;
-          const chartHeight = Math.max(maxRows * (rowHeight + 8), 150);
-          
-          // Generate time markers
-          const timeMarkers = [];
-          for (let i = minStart; i <= maxEnd; i++) {
-            timeMarkers.push(i);
-          }
-          
-          return (
-            <div key={date} className="mb-4">
-              {/* Date Header */}
-              <div className="flex items-center mb-2">
-                <div className="bg-slate-800 px-3 py-1.5 rounded-md">
-                  <h4 className="text-sm font-semibold text-slate-200">{formatDate(date)}</h4>
-                  <p className="text-xs text-slate-400">{date}</p>
-                </div>
-              </div>
-              
-              {/* Chart Container */}
-              <div className="relative bg-slate-800 rounded-lg p-3" style={{ minHeight: `${chartHeight + 60}px` }}>
-                {/* Time axis */}
-                <div className="absolute top-0 left-0 right-0 h-8 border-b border-slate-700">
-                  <div className="relative h-full">
-                    {timeMarkers.map((time) => (
-                      <div
-                        key={time}
-                        className="absolute flex flex-col items-center"
-                        style={{
-                          left: `${((time - minStart) / totalDuration) * 100}%`,
-                          transform: 'translateX(-50%)',
-                        }}
-                      >
-                        <span className="text-xs text-slate-400 font-medium">
-                          {time}h
-                        </span>
-                        <div className="w-px h-1 bg-slate-600 mt-1"></div>
-                      </div>
-                    ))}
-                  </div>
-                </div>
-                
-                {/* Grid lines */}
-                <div className="absolute top-8 left-0 right-0 bottom-0 pointer-events-none">
-                  {timeMarkers.map((time) => (
-                    <div
-                      key={`grid-${time}`}
-                      className="absolute top-0 bottom-0 w-px bg-slate-700 opacity-30"
-                      style={{
-                        left: `${((time - minStart) / totalDuration) * 100}%`,
-                      }}
-                    ></div>
-                  ))}
-                </div>
-                
-                {/* Tasks */}
-                <div className="relative mt-10" style={{ minHeight: `${chartHeight}px` }}>
-                  {dateTasks.map((task, index) => {
-                    const duration = task.end - task.start;
-                    const startPercent = ((task.start - minStart) / totalDuration) * 100;
-                    const widthPercent = (duration / totalDuration) * 100;
-                    const row = getTaskRow(task, index);
-                    const color = taskColorMap[task.task];
-                    
-                    return (
-                      <div
-                        key={index}
-                        className={`absolute ${color} rounded-md shadow-lg hover:shadow-xl transition-all duration-200 hover:scale-105 cursor-pointer group`}
-                        style={{
-                          left: `${startPercent}%`,
-                          width: `${widthPercent}%`,
-                          height: `${rowHeight}px`,
-                          top: `${row * (rowHeight + 8)}px`,
-                          minWidth: '80px',
-                        }}
-                      >
-                        <div className="flex items-center justify-between h-full px-3 py-2 relative">
-                          <div className="flex-1 min-w-0 pr-2 overflow-hidden">
-                            <p className="text-white text-sm font-medium leading-tight line-clamp-2">
-                              {task.task}
-                            </p>
-                            <p className="text-white text-xs opacity-80 mt-0.5">
-                              {task.start}h - {task.end}h
-                            </p>
-                          </div>
-                          
-                          {/* Duration badge */}
-                          <div className="ml-2 bg-white bg-opacity-20 rounded px-2 py-1 flex-shrink-0">
-                            <span className="text-xs text-white font-semibold">
-                              {duration}h
-                            </span>
-                          </div>
-                          
-                          {/* Hover tooltip */}
-                          <div className="absolute -top-10 left-1/2 transform -translate-x-1/2 bg-slate-700 text-white px-3 py-2 rounded-md text-xs whitespace-nowrap opacity-0 group-hover:opacity-100 transition-opacity duration-200 pointer-events-none shadow-xl z-10">
-                            <div className="font-semibold">{task.task}</div>
-                            <div>Duration: {duration} hour{duration > 1 ? 's' : ''}</div>
-                            <div>Time: {task.start}h - {task.end}h</div>
-                            <div className="absolute -bottom-1 left-1/2 transform -translate-x-1/2 w-2 h-2 bg-slate-700 rotate-45"></div>
-                          </div>
-                        </div>
-                      </div>
-                    );
-                  })}
-                </div>
-                
-                {/* Legend */}
-                <div className="mt-3 pt-2 border-t border-slate-700">
-                  <div className="flex items-center justify-between">
-                    <div className="flex items-center space-x-4">
-                      <div className="flex items-center text-xs text-slate-400">
-                        <div className="w-3 h-3 bg-blue-500 rounded-sm mr-2"></div>
-                        <span>Task Block</span>
-                      </div>
-                      <div className="flex items-center text-xs text-slate-400">
-                        <svg className="w-4 h-4 mr-1" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                          <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z" />
-                        </svg>
-                        <span>Time in hours</span>
-                      </div>
-                    </div>
-                    <div className="text-xs text-slate-500">
-                      Duration: {totalDuration}h ({dateTasks.length} task{dateTasks.length > 1 ? 's' : ''})
-                    </div>
-                  </div>
-                </div>
-              </div>
-            </div>
-          );
-        })}
+        {scheduleRef
+          ? scheduleRef.dates.map(({ date, count }) => (
+              <LazyDateSection key={date} scheduleId={scheduleRef.scheduleId} date={date} count={count} colorFor={colorFor} />
+            ))
+          : sortedDates.map((date) => (
+              <DateSection key={date} date={date} dateTasks={tasksByDate[date]} colorFor={colorFor} />
+            ))}
       </div>
     </div>
   );
@@ -1,13 +1,15 @@
 import React, { useState } from 'react';
 import { Download, Play } from 'lucide-react';
-import { NotificationType } from '../types';
-import { apiCall } from '../utils/api';
+import { NotificationType, ScheduleRef } from '../types';
+import { apiCall, fetchAllSegments } from '../utils/api';
 import { API_URL } from '../utils/backend_config';
 import GanttChart from './GanttChart';   // adjust path if different
 
 interface ScheduleVisualizationSectionProps {
   manualSchedule: any[];
   aiSchedule: any[];
+  manualScheduleRef?: ScheduleRef | null;
+  aiScheduleRef?: ScheduleRef | null;
   showNotification: (message: string, type: NotificationType) => void;
   manualAlgo?: string;
   quantum?: string;
@@ -24,7 +26,7 @@ interface ScheduleVisualizationSectionProps {
   setResetMemorySchedule: React.Dispatch<React.SetStateAction<any[]>>;
 }
 
-export default function ScheduleVisualizationSection({ showNotification, manualSchedule, aiSchedule, manualAlgo, quantum, aiAlgo, aiQuantum, navigate, agentAlgo, agentQuantum, agentSchedule, setAgentAlgo, setAgentQuantum, setAgentSchedule, resetMemorySchedule, setResetMemorySchedule }: ScheduleVisualizationSectionProps) {
+export default function ScheduleVisualizationSection({ showNotification, manualSchedule, aiSchedule, manualScheduleRef, aiScheduleRef, manualAlgo, quantum, aiAlgo, aiQuantum, navigate, agentAlgo, agentQuantum, agentSchedule, setAgentAlgo, setAgentQuantum, setAgentSchedule, resetMemorySchedule, setResetMemorySchedule }: ScheduleVisualizationSectionProps) {
   const [finalChoice, setFinalChoice] = useState<'manual' | 'AI'>('manual');
 
   const handleDownloadJPEG = async (type: 'manual' | 'ai') => {
@@ -69,8 +71,8 @@ export default function ScheduleVisualizationSection({ showNotification, manualS
         
         <div className="bg-slate-900 flex items-center justify-center py-4">
       {/* Replace the existing content with the GanttChart */}
-      {manualSchedule && manualSchedule.length > 0 ? (
-        <GanttChart tasks={manualSchedule} algo={manualAlgo} tq={quantum} />
+      {manualScheduleRef || (manualSchedule && manualSchedule.length > 0) ? (
+        <GanttChart tasks={manualSchedule} scheduleRef={manualScheduleRef} algo={manualAlgo} tq={quantum} />
       ) : (
         <div className="text-center">
           <p className="text-slate-500">No schedule data available</p>
@@ -97,8 +99,8 @@ export default function ScheduleVisualizationSection({ showNotification, manualS
         
         <div className="bg-slate-900 flex items-center justify-center py-4">
       {/* Replace the existing content with the GanttChart */}
-      {aiSchedule && aiSchedule.length > 0 ? (
-        <GanttChart tasks={aiSchedule} algo={aiAlgo} tq={aiQuantum} />
+      {aiScheduleRef || (aiSchedule && aiSchedule.length > 0) ? (
+        <GanttChart tasks={aiSchedule} scheduleRef={aiScheduleRef} algo={aiAlgo} tq={aiQuantum} />
       ) : (
         <div className="text-center">
           <p className="text-slate-500">No schedule data available</p>
@@ -143,19 +145,28 @@ export default function ScheduleVisualizationSection({ showNotification, manualS
 
           <div className="text-center">
             <button
-              onClick={()=>{
+              onClick={async ()=>{
                 handleSubmitFinalSelection(finalChoice); 
+                const scheduleRef = finalChoice === 'manual' ? manualScheduleRef : aiScheduleRef;
+                let schedule = (finalChoice === 'manual' ? manualSchedule : aiSchedule) || [];
+                if (scheduleRef) {
+                  // Paged schedule: the agent needs all of it, not the first page
+                  const [success, segments] = await fetchAllSegments(API_URL, scheduleRef.scheduleId);
+                  if (!success) {
+                    showNotification('Failed to load the full schedule', 'error');
+                    return;
+                  }
+                  schedule = segments;
+                }
                 if (finalChoice === 'manual') {
                   setAgentAlgo?.(manualAlgo || '');
                   setAgentQuantum?.(quantum || '');
-                  setAgentSchedule?.(manualSchedule || []);
-                  setResetMemorySchedule(manualSchedule)
                 } else {
                   setAgentAlgo?.(aiAlgo || '');
                   setAgentQuantum?.(aiQuantum || '');
-                  setAgentSchedule?.(aiSchedule || []);
-                  setResetMemorySchedule(aiSchedule)
                 }
+                setAgentSchedule?.(schedule);
+                setResetMemorySchedule(schedule)
                 navigate('ai-interaction');
               }
             }
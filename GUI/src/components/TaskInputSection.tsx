@@ -1,6 +1,6 @@
 import React, { useState } from 'react';
 import { Play, Trash2, Download, Upload, AlertTriangle, Lightbulb, ClipboardCheck  } from 'lucide-react';
-import { Task, NotificationType } from '../types';
+import { Task, NotificationType, ScheduleRef } from '../types';
 import { apiCall } from '../utils/api';
 import { API_URL } from '../utils/backend_config';
 
@@ -10,6 +10,8 @@ interface TaskInputSectionProps {
   showNotification: (message: string, type: NotificationType) => void;
   setManualSchedule: React.Dispatch<React.SetStateAction<any[]>>;
   setAiSchedule: React.Dispatch<React.SetStateAction<any[]>>;
+  setManualScheduleRef: React.Dispatch<React.SetStateAction<ScheduleRef | null>>;
+  setAiScheduleRef: React.Dispatch<React.SetStateAction<ScheduleRef | null>>;
   manualAlgo: string;
   setManualAlgo: React.Dispatch<React.SetStateAction<string>>;
   quantum: string;
@@ -28,6 +30,8 @@ export default function TaskInputSection({
   showNotification,
   setManualSchedule,
   setAiSchedule,
+  setManualScheduleRef,
+  setAiScheduleRef,
   manualAlgo,
   setManualAlgo,
   quantum,
@@ -62,14 +66,40 @@ export default function TaskInputSection({
   // const [aiAlgo, setAiAlgo] = useState('Not suggested yet');
   // const [aiQuantum, setAiQuantum] = useState('Not suggested yet');
   const [deleteIds, setDeleteIds] = useState('');
+  const [sessionId, setSessionId] = useState<string | null>(null);
+  const [summaryResetPending, setSummaryResetPending] = useState(false);
 
   const handleValidateTask = async (nlTask: string, nlResponse: string, warningMsg: string, suggestionMsg: string, tasksSummaryMsg: any[]) => {
-    const [success, data] = await apiCall(API_URL + '/api/validateTask','POST', { nlTask: nlTask, nlResponse: nlResponse, warningMsg: warningMsg, suggestionMsg: suggestionMsg, tasksSummaryMsg: tasksSummaryMsg });
+    // With a session the backend keeps the summary; only send the NL text and any local reset
+    const body: any = { nlTask: nlTask, nlResponse: nlResponse, warningMsg: warningMsg, suggestionMsg: suggestionMsg };
+    if (sessionId) {
+      body.sessionId = sessionId;
+      if (summaryResetPending) {
+        body.tasksDelta = { truncate: 0, append: [] };
+      }
+    } else {
+      body.tasksSummaryMsg = tasksSummaryMsg;
+    }
+    let [success, data] = await apiCall(API_URL + '/api/validateTask','POST', body);
+    if (!success && sessionId && typeof data === 'string' && data.includes('Unknown session')) {
+      // The server lost the session (expired / restarted): rebuild it from the local summary
+      const localSummary = summaryResetPending || !Array.isArray(tasksSummaryMsg) ? [] : tasksSummaryMsg;
+      const retryBody = { ...body, tasksSummaryMsg: localSummary.filter((t: any) => typeof t === 'object') };
+      delete retryBody.tasksDelta;
+      [success, data] = await apiCall(API_URL + '/api/validateTask','POST', retryBody);
+    }
     console.log(success, data);
     if (success) {
       setWarningMsg(data.warningMsg);
       setSuggestionMsg(data.suggestionMsg);
-      setTasksSummaryMsg(data.tasksSummaryMsg);
+      setSessionId(data.sessionId);
+      setSummaryResetPending(false);
+      if (data.tasksSummaryMsg) {
+        setTasksSummaryMsg(data.tasksSummaryMsg);
+      } else {
+        const base = summaryResetPending || !Array.isArray(tasksSummaryMsg) ? [] : tasksSummaryMsg;
+        setTasksSummaryMsg([...base.slice(0, data.tasksDelta.truncate), ...data.tasksDelta.append]);
+      }
       showNotification('Task validation processed successfully', 'success');
     } else {
       showNotification('Task validation failed', 'error');
@@ -146,6 +176,7 @@ export default function TaskInputSection({
 
       // Optionally reset tasksSummaryMsg
       setTasksSummaryMsg([]);
+      setSummaryResetPending(true);
 
       showNotification('Natural language tasks added successfully!', 'success');
     } else {
@@ -224,10 +255,28 @@ export default function TaskInputSection({
     event.target.value = '';
   };
 
+  // Schedules with more segments than this come back as a paged handle rendered lazily
+  const LAZY_SCHEDULE_THRESHOLD = 1000;
+
+  const applyScheduleResult = (
+    data: any,
+    setSchedule: React.Dispatch<React.SetStateAction<any[]>>,
+    setScheduleRef: React.Dispatch<React.SetStateAction<ScheduleRef | null>>
+  ) => {
+    if (Array.isArray(data)) {
+      setSchedule(data);
+      setScheduleRef(null);
+    } else {
+      // Only a first page: consumers that need every segment fetch them through the ref
+      setSchedule([]);
+      setScheduleRef({ scheduleId: data.scheduleId, dates: data.dates });
+    }
+  };
+
   const handleRunManualScheduler = async (tasks: Task[], algo: string, quantum: string) => {
-    const [success, data] = await apiCall(API_URL + '/api/run_scheduler', 'POST', { "task_list": tasks, "algo": algo, "tq": quantum });
+    const [success, data] = await apiCall(API_URL + '/api/run_scheduler', 'POST', { "task_list": tasks, "algo": algo, "tq": quantum, "page_size": LAZY_SCHEDULE_THRESHOLD });
     if (success) {
-      setManualSchedule(data);
+      applyScheduleResult(data, setManualSchedule, setManualScheduleRef);
       setManualAlgo(algo);
       setQuantum(quantum);
       console.log(data);
@@ -251,9 +300,9 @@ export default function TaskInputSection({
   };
 
   const handleRunAIScheduler = async (tasks: Task[], algo: string, quantum: string) => {
-    const [success, data] = await apiCall(API_URL + '/api/run_scheduler', 'POST', { "task_list": tasks, "algo": algo, "tq": quantum });
+    const [success, data] = await apiCall(API_URL + '/api/run_scheduler', 'POST', { "task_list": tasks, "algo": algo, "tq": quantum, "page_size": LAZY_SCHEDULE_THRESHOLD });
     if (success) {
-      setAiSchedule(data);
+      applyScheduleResult(data, setAiSchedule, setAiScheduleRef);
       setAiAlgo(algo);
       setAiQuantum(quantum);
       showNotification('AI scheduler run successfully', 'success');
@@ -612,6 +661,8 @@ export default function TaskInputSection({
                       <option value="RR">Round Robin</option>
                       <option value="PS">Priority Scheduling</option>
                       <option value="EDF">Earliest Deadline First</option>
+                      <option value="PS-P">Priority Scheduling (Preemptive)</option>
+                      <option value="EDF-P">Earliest Deadline First (Preemptive)</option>
                     </select>
                   </div>
                   <div>
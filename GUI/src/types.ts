@@ -13,4 +13,16 @@ export interface Task {
   importance: 'High' | 'Medium' | 'Low';
 }
 
-export type NotificationType = 'success' | 'error' | 'info';
\ No newline at end of file
+export type NotificationType = 'success' | 'error' | 'info';
+export interface ScheduleSegment {
+  task: string;
+  start: number;
+  end: number;
+  date: string;
+}
+
+// Handle for a large schedule kept on the backend; segments are fetched per visible day
+export interface ScheduleRef {
+  scheduleId: number;
+  dates: { date: string; count: number }[];
+}
@@ -40,6 +40,21 @@ export const apiCall = async (
 };
 
 
+// Every segment of a stored (paged) schedule, following nextCursor page by page
+export const fetchAllSegments = async (apiUrl: string, scheduleId: number): Promise<[boolean, any[]]> => {
+  const segments: any[] = [];
+  let cursor: string | null = null;
+  do {
+    const params = new URLSearchParams({ limit: '5000' });
+    if (cursor) params.set('cursor', cursor);
+    const [success, data] = await apiCall(`${apiUrl}/api/schedules/${scheduleId}/segments?${params}`);
+    if (!success) return [false, segments];
+    segments.push(...data.segments);
+    cursor = data.nextCursor;
+  } while (cursor);
+  return [true, segments];
+};
+
 
 
 // // GET request example